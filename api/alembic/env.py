@@ -5,7 +5,14 @@ from alembic import context
 
 from core.config import settings
 from database import Base
-from models import User, Plan, Subscription  # noqa: F401
+from models import (  # noqa: F401
+    User,
+    Plan,
+    Subscription,
+    SubscriptionCounter,
+    SubscriptionTimeseriesCache,
+    SubscriptionTimeseriesCacheGeneration,
+)
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.database_url)
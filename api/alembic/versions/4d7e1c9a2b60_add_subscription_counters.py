@@ -0,0 +1,38 @@
+"""Add subscription counters
+
+Revision ID: 4d7e1c9a2b60
+Revises: be3387263fc6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d7e1c9a2b60'
+down_revision: Union[str, None] = 'be3387263fc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('subscription_counters',
+    sa.Column('plan_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['plan_id'], ['plans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('plan_id', 'status')
+    )
+    # Writes that land between this backfill and the new code going live are
+    # picked up by reconcile_counters.py.
+    op.execute(
+        "INSERT INTO subscription_counters (plan_id, status, count) "
+        "SELECT plan_id, status, COUNT(*) FROM subscriptions GROUP BY plan_id, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('subscription_counters')
@@ -0,0 +1,32 @@
+"""Add subscription timeseries cache
+
+Revision ID: 9a3f5b2e7c14
+Revises: 4d7e1c9a2b60
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f5b2e7c14'
+down_revision: Union[str, None] = '4d7e1c9a2b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('subscription_timeseries_cache',
+    sa.Column('granularity', sa.String(length=10), nullable=False),
+    sa.Column('bucket_start', sa.Date(), nullable=False),
+    sa.Column('tier', sa.String(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('granularity', 'bucket_start', 'tier')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('subscription_timeseries_cache')
@@ -0,0 +1,34 @@
+"""Add unique active subscription index
+
+Revision ID: be3387263fc6
+Revises: 119c69584fb8
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'be3387263fc6'
+down_revision: Union[str, None] = '119c69584fb8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails if any user already has more than one active subscription;
+    # resolve those rows before upgrading.
+    op.create_index(
+        'uq_subscriptions_user_id_active',
+        'subscriptions',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_subscriptions_user_id_active', table_name='subscriptions')
@@ -0,0 +1,72 @@
+"""Add subscription lookup indexes
+
+Revision ID: c5e8d1f0a3b7
+Revises: 9a3f5b2e7c14
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8d1f0a3b7'
+down_revision: Union[str, None] = '9a3f5b2e7c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction. If a build fails it leaves
+    # an INVALID index behind; drop it by hand before re-running.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_subscriptions_user_id_status',
+            'subscriptions',
+            ['user_id', 'status'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_subscriptions_end_date_active',
+            'subscriptions',
+            ['end_date'],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_subscriptions_status_plan_id',
+            'subscriptions',
+            ['status', 'plan_id'],
+            unique=False,
+            postgresql_include=['id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # (user_id, status) covers every lookup the single-column index served.
+        op.drop_index(
+            'ix_subscriptions_user_id',
+            table_name='subscriptions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_subscriptions_user_id',
+            'subscriptions',
+            ['user_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_subscriptions_status_plan_id', table_name='subscriptions', postgresql_concurrently=True)
+        op.drop_index('ix_subscriptions_end_date_active', table_name='subscriptions', postgresql_concurrently=True)
+        op.drop_index('ix_subscriptions_user_id_status', table_name='subscriptions', postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""Add plan validity range index
+
+Revision ID: d2a7f4c9e8b1
+Revises: c5e8d1f0a3b7
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7f4c9e8b1'
+down_revision: Union[str, None] = 'c5e8d1f0a3b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_plans_validity',
+        'plans',
+        [sa.text("tstzrange(active_from, active_to, '[]')")],
+        unique=False,
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_plans_validity', table_name='plans', postgresql_using='gist')
@@ -0,0 +1,59 @@
+"""Add plan window exclusion constraint
+
+Revision ID: e6b3c8a1f5d2
+Revises: d2a7f4c9e8b1
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3c8a1f5d2'
+down_revision: Union[str, None] = 'd2a7f4c9e8b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+OVERLAPPING_PLANS = sa.text(
+    "SELECT a.id, b.id, a.tier, a.billing_period, a.simulation "
+    "FROM plans a JOIN plans b ON a.id < b.id "
+    "AND a.tier = b.tier AND a.billing_period = b.billing_period AND a.simulation = b.simulation "
+    "AND tstzrange(a.active_from, a.active_to, '[]') && tstzrange(b.active_from, b.active_to, '[]') "
+    "ORDER BY a.id, b.id"
+)
+
+
+def upgrade() -> None:
+    # Opt-in: deploys leave the schema unchanged unless PLAN_WINDOW_EXCLUSION
+    # is set. To add it later, downgrade to d2a7f4c9e8b1 and upgrade again.
+    if not settings.plan_window_exclusion:
+        logger.info("PLAN_WINDOW_EXCLUSION is not set; skipping ex_plans_window_overlap")
+        return
+    overlaps = op.get_bind().execute(OVERLAPPING_PLANS).all()
+    if overlaps:
+        listed = "\n".join(
+            f"  plans {first} and {second} ({tier}, {billing_period}, simulation={simulation})"
+            for first, second, tier, billing_period, simulation in overlaps
+        )
+        raise RuntimeError(
+            f"Cannot add ex_plans_window_overlap: {len(overlaps)} pair(s) of plans have "
+            f"overlapping windows. Fix their active_from/active_to first:\n{listed}"
+        )
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "ALTER TABLE plans ADD CONSTRAINT ex_plans_window_overlap EXCLUDE USING gist ("
+        "tier WITH =, billing_period WITH =, simulation WITH =, "
+        "tstzrange(active_from, active_to, '[]') WITH &&)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE plans DROP CONSTRAINT IF EXISTS ex_plans_window_overlap")
@@ -0,0 +1,33 @@
+"""Add subscription timeseries cache generation
+
+Revision ID: f1c4b7e9a2d6
+Revises: e6b3c8a1f5d2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c4b7e9a2d6'
+down_revision: Union[str, None] = 'e6b3c8a1f5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    generation = op.create_table('subscription_timeseries_cache_generation',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('generation', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(generation, [{'id': 1, 'generation': 0}])
+    # Buckets cached before this revision may hold counts from the store race.
+    op.execute("DELETE FROM subscription_timeseries_cache")
+
+
+def downgrade() -> None:
+    op.drop_table('subscription_timeseries_cache_generation')
@@ -0,0 +1,33 @@
+from collections.abc import Sequence
+
+from sqlalchemy.exc import IntegrityError
+
+
+def violated_constraint(error: IntegrityError) -> str | None:
+    """Name of the constraint behind ``error``, when the driver reports it.
+
+    psycopg2 exposes it as ``diag.constraint_name`` and asyncpg as
+    ``constraint_name`` on the wrapped exception.
+    """
+    original = error.orig
+    diag = getattr(original, "diag", None)
+    if diag is not None and getattr(diag, "constraint_name", None):
+        return diag.constraint_name
+    for candidate in (original, getattr(original, "__cause__", None)):
+        name = getattr(candidate, "constraint_name", None)
+        if name:
+            return name
+    return None
+
+
+def violates_unique(error: IntegrityError, constraint: str, table: str, columns: Sequence[str]) -> bool:
+    """Whether ``error`` comes from the unique ``constraint`` on ``table(columns)``.
+
+    SQLite reports no constraint names, only the columns, so it is matched
+    by its "UNIQUE constraint failed" message instead.
+    """
+    name = violated_constraint(error)
+    if name is not None:
+        return name == constraint
+    failed = ", ".join(f"{table}.{column}" for column in columns)
+    return str(error.orig) == f"UNIQUE constraint failed: {failed}"
@@ -0,0 +1,93 @@
+import json
+import types
+from functools import lru_cache
+from typing import Any, Union, get_args, get_origin
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter, create_model
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _trusted_model(model: type[BaseModel]) -> type[BaseModel]:
+    fields = {
+        name: (_trusted_annotation(field.annotation), ... if field.is_required() else field.default)
+        for name, field in model.model_fields.items()
+    }
+    return create_model(model.__name__, __config__=ConfigDict(from_attributes=True), **fields)
+
+
+def _trusted_annotation(annotation: Any) -> Any:
+    """``annotation`` with EmailStr swapped for str, recursively.
+
+    Response rows come from the database, where every email was validated
+    on the way in; re-running email validation on output costs far more
+    than encoding the row and cannot change the serialized value.
+    """
+    if annotation is EmailStr:
+        return str
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _trusted_model(annotation)
+    origin = get_origin(annotation)
+    if origin is list:
+        return list[_trusted_annotation(get_args(annotation)[0])]
+    if origin in (Union, types.UnionType):
+        return Union[tuple(_trusted_annotation(arg) for arg in get_args(annotation))]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def schema_adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+@lru_cache(maxsize=None)
+def response_adapter(schema: Any) -> TypeAdapter:
+    """TypeAdapter for the trusted form of ``schema``, built once per process."""
+    return TypeAdapter(_trusted_annotation(schema))
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, matching FastAPI's JSONResponse encoding."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response that passes pre-encoded bytes through and encodes anything else with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def fast_json_response(schema: Any, content: Any, response: Response) -> FastJSONResponse:
+    """Validate ``content`` as ``schema`` and encode it straight to JSON bytes.
+
+    Produces the same bytes as FastAPI's ``response_model`` handling, but
+    runs in the endpoint's own thread with a cached TypeAdapter that skips
+    re-validating stored emails. Headers already set on ``response``
+    (cursors, ETags) are carried over.
+    """
+    items = content if isinstance(content, list) else [content]
+    if items and isinstance(items[0], BaseModel):
+        # Already response schemas (e.g. a row projection): pydantic passes
+        # model instances through validation untouched.
+        adapter = schema_adapter(schema)
+    else:
+        adapter = response_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name not in ("content-length", "content-type")
+    }
+    return FastJSONResponse(body, status_code=response.status_code or 200, headers=headers)
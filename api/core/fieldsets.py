@@ -0,0 +1,52 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, ConfigDict, create_model
+
+from core.fast_json import FastJSONResponse, fast_json_response
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    """Validate a ``?fields=`` list against ``schema``.
+
+    Returns the requested names in schema order, always including ``id``
+    so cursors and ETags still work, or ``None`` when no fieldset was asked for.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="fields must name at least one field"
+        )
+    unknown = sorted(requested - set(schema.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return tuple(name for name in schema.model_fields if name in requested or name == "id")
+
+
+@lru_cache(maxsize=None)
+def fieldset_model(schema: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """``schema`` trimmed to ``fields``, built once per distinct fieldset."""
+    definitions = {
+        name: (field.annotation, field)
+        for name, field in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(schema.__name__, __config__=ConfigDict(from_attributes=True), **definitions)
+
+
+def fieldset_response(
+    schema: type[BaseModel], fields: tuple[str, ...], content: Any, response: Response
+) -> FastJSONResponse:
+    """Encode ``content`` (one item or a list) with only ``fields`` of ``schema``.
+
+    Bypasses the route's ``response_model``, which would reject the trimmed items.
+    """
+    model = fieldset_model(schema, fields)
+    return fast_json_response(list[model] if isinstance(content, list) else model, content, response)
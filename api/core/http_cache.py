@@ -0,0 +1,46 @@
+import hashlib
+from collections.abc import Iterable
+
+from fastapi import Response, status
+
+from core.config import settings
+from models.plan import Plan
+
+
+def plan_etag(plans: Iterable[Plan], fields: tuple[str, ...] | None = None) -> str:
+    """Strong ETag derived from the ids and ``updated_at`` of ``plans``.
+
+    A sparse fieldset is a different representation, so ``fields`` is part
+    of the tag.
+    """
+    digest = hashlib.sha256()
+    if fields is not None:
+        digest.update(f"fields={','.join(fields)};".encode())
+    for plan in plans:
+        digest.update(f"{plan.id}:{plan.updated_at.isoformat()};".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"public, max-age={settings.plan_cache_max_age}"
+
+
+def not_modified(response: Response, etag: str) -> Response:
+    """Build a bodyless 304 carrying the cache headers already set on ``response``."""
+    set_cache_headers(response, etag)
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name not in ("content-length", "content-type")
+    }
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,146 @@
+import bisect
+import threading
+from collections import defaultdict
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "unmatched"
+
+POOL_COUNTERS = {
+    "connects": ("db_pool_connects_total", "New DBAPI connections opened."),
+    "checkouts": ("db_pool_checkouts_total", "Connections checked out of the pool."),
+    "checkins": ("db_pool_checkins_total", "Connections returned to the pool."),
+    "invalidations": ("db_pool_invalidations_total", "Connections invalidated."),
+    "checkout_wait_seconds": ("db_pool_checkout_wait_seconds_total", "Time spent waiting for a connection."),
+}
+POOL_GAUGES = {
+    "checkout_wait_max_seconds": ("db_pool_checkout_wait_max_seconds", "Longest wait for a connection."),
+    "size": ("db_pool_size", "Configured pool size."),
+    "checked_in": ("db_pool_checked_in", "Idle connections in the pool."),
+    "checked_out": ("db_pool_checked_out", "Connections currently in use."),
+    "overflow": ("db_pool_overflow", "Connections open beyond the pool size."),
+}
+
+
+class _Shard:
+    """Metrics recorded by one thread; only that thread ever writes to it."""
+
+    def __init__(self):
+        # (method, route) -> [count per bucket..., +Inf count, sum]
+        self.latency: dict[tuple[str, str], list] = {}
+        self.responses: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+        self.in_flight = 0
+
+
+class MetricsRegistry:
+    """Request metrics sharded per thread, so recording never takes a lock.
+
+    The only lock guards the list of shards, and is taken once per thread
+    and on each scrape. Scrapes sum the shards; a value recorded while a
+    scrape is running may be missed by that scrape and shows up in the next.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def request_started(self) -> None:
+        self._shard().in_flight += 1
+
+    def request_finished(self, method: str, route: str, status_code: int, seconds: float) -> None:
+        shard = self._shard()
+        shard.in_flight -= 1
+        histogram = shard.latency.get((method, route))
+        if histogram is None:
+            histogram = shard.latency[(method, route)] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+        shard.responses[(method, route, str(status_code))] += 1
+
+    def reset(self) -> None:
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.latency.clear()
+                shard.responses.clear()
+                shard.in_flight = 0
+
+    def _collect(self) -> tuple[dict, dict, int]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        latency: dict[tuple[str, str], list] = {}
+        responses: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+        in_flight = 0
+        for shard in shards:
+            in_flight += shard.in_flight
+            for key, histogram in list(shard.latency.items()):
+                total = latency.setdefault(key, [0] * len(histogram[:-1]) + [0.0])
+                for index, value in enumerate(histogram):
+                    total[index] += value
+            for key, count in list(shard.responses.items()):
+                responses[key] += count
+        return latency, responses, in_flight
+
+    def render(self, pool_status: dict[str, dict] | None = None) -> str:
+        """Prometheus text exposition of every metric, plus ``pool_status`` per engine."""
+        latency, responses, in_flight = self._collect()
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in sorted(latency.items()):
+            labels = f'method="{_escape(method)}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += histogram[len(self.buckets)]
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram[-1]}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+        lines += [
+            "# HELP http_responses_total Responses by route template and status code.",
+            "# TYPE http_responses_total counter",
+        ]
+        for (method, route, status_code), count in sorted(responses.items()):
+            lines.append(
+                f'http_responses_total{{method="{_escape(method)}",route="{_escape(route)}",'
+                f'status="{status_code}"}} {count}'
+            )
+
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+        ]
+
+        for metrics, kind in ((POOL_COUNTERS, "counter"), (POOL_GAUGES, "gauge")):
+            for key, (name, help_text) in metrics.items():
+                samples = [
+                    f'{name}{{engine="{engine}"}} {status[key]}'
+                    for engine, status in (pool_status or {}).items()
+                    if key in status
+                ]
+                if samples:
+                    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples]
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
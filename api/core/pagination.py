@@ -0,0 +1,38 @@
+import base64
+import binascii
+import json
+from typing import Any, Sequence
+
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        last_id = None
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return last_id
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Expose the cursor for the page after ``items`` when the page is full.
+
+    The header is sent in both ``skip`` and ``cursor`` mode so clients can
+    switch to keyset pagination from any page.
+    """
+    if limit > 0 and len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(items[-1].id)
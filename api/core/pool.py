@@ -0,0 +1,128 @@
+import threading
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from core.config import Settings
+
+
+class PoolMode(str, Enum):
+    QUEUE = "queue"
+    SINGLE = "single"
+    NULL = "null"
+    RDS_PROXY = "rds_proxy"
+
+
+@dataclass
+class PoolStats:
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    checkout_wait_seconds: float = 0.0
+    checkout_wait_max_seconds: float = 0.0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkout_wait_seconds += seconds
+            if seconds > self.checkout_wait_max_seconds:
+                self.checkout_wait_max_seconds = seconds
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _TimedPoolMixin:
+    """Time how long each checkout waits for the pool."""
+
+    stats: PoolStats | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.stats is not None:
+                self.stats.record_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(settings: Settings, url: str, is_async: bool = False) -> dict:
+    """Keyword arguments for ``create_engine``/``create_async_engine`` for the configured pool mode.
+
+    ``queue``      pooled connections sized by ``db_pool_size``/``db_max_overflow`` (containers).
+    ``single``     one persistent connection per process, never overflowing (Lambda).
+    ``null``       a new connection per checkout, closed on checkin.
+    ``rds_proxy``  like ``null`` and without pre-ping or prepared statements, so the
+                   proxy can multiplex connections without pinning them.
+    """
+    mode = PoolMode(settings.db_pool_mode)
+    options: dict = {"pool_recycle": settings.db_pool_recycle}
+
+    if mode in (PoolMode.NULL, PoolMode.RDS_PROXY):
+        options["poolclass"] = NullPool
+        options["pool_pre_ping"] = False
+    else:
+        options["poolclass"] = TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool
+        options["pool_pre_ping"] = settings.db_pool_pre_ping
+        options["pool_timeout"] = settings.db_pool_timeout
+        if mode == PoolMode.SINGLE:
+            options["pool_size"] = 1
+            options["max_overflow"] = 0
+        else:
+            options["pool_size"] = settings.db_pool_size
+            options["max_overflow"] = settings.db_max_overflow
+
+    if mode == PoolMode.RDS_PROXY and "+asyncpg" in url:
+        # asyncpg prepares statements server-side, which pins proxy connections.
+        options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
+    return options
+
+
+def track_pool(engine) -> PoolStats:
+    """Attach checkout/checkin counters to ``engine`` (sync, or the ``sync_engine`` of an async engine)."""
+    stats = PoolStats()
+    if isinstance(engine.pool, _TimedPoolMixin):
+        engine.pool.stats = stats
+
+    event.listen(engine, "connect", lambda *args: stats.increment("connects"))
+    event.listen(engine, "checkout", lambda *args: stats.increment("checkouts"))
+    event.listen(engine, "checkin", lambda *args: stats.increment("checkins"))
+    event.listen(engine, "invalidate", lambda *args: stats.increment("invalidations"))
+    return stats
+
+
+def pool_status(engine, stats: PoolStats) -> dict:
+    pool = engine.pool
+    status = {"pool": type(pool).__name__, **stats.as_dict()}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    return status
@@ -0,0 +1,104 @@
+import heapq
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+
+logger = logging.getLogger("shade.requests")
+
+SLOW_STATEMENT_MAX_CHARS = 500
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while serving one request."""
+
+    slow_threshold_seconds: float | None = None
+    slow_limit: int = 5
+    count: int = 0
+    seconds: float = 0.0
+    slow: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if self.slow_threshold_seconds is None or seconds < self.slow_threshold_seconds:
+            return
+        entry = (seconds, statement[:SLOW_STATEMENT_MAX_CHARS])
+        if len(self.slow) < self.slow_limit:
+            heapq.heappush(self.slow, entry)
+        else:
+            heapq.heappushpop(self.slow, entry)
+
+    def slowest(self) -> list[dict]:
+        return [
+            {"ms": round(seconds * 1000, 2), "statement": statement}
+            for seconds, statement in sorted(self.slow, reverse=True)
+        ]
+
+
+# The stats object is shared, not copied, when the context is copied into a
+# threadpool worker or a middleware's child task, so sync and async
+# endpoints both report into the request's instance.
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_request(slow_threshold_ms: float | None = None, slow_limit: int = 5) -> QueryStats:
+    stats = QueryStats(
+        slow_threshold_seconds=None if slow_threshold_ms is None else slow_threshold_ms / 1000,
+        slow_limit=slow_limit,
+    )
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> QueryStats | None:
+    return _current.get()
+
+
+def track_queries(engine) -> None:
+    """Time every cursor execution on ``engine`` (sync, or the ``sync_engine`` of an async engine)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # after_cursor_execute does not fire for failed statements.
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+def server_timing(stats: QueryStats, total_seconds: float) -> str:
+    return (
+        f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries", '
+        f"total;dur={total_seconds * 1000:.2f}"
+    )
+
+
+def log_request(method: str, path: str, status_code: int, stats: QueryStats, total_seconds: float) -> None:
+    """One JSON line per request, so log queries can group by path."""
+    record = {
+        "event": "request",
+        "method": method,
+        "path": path,
+        "status": status_code,
+        "queries": stats.count,
+        "db_ms": round(stats.seconds * 1000, 2),
+        "total_ms": round(total_seconds * 1000, 2),
+    }
+    if stats.slow:
+        record["slow_queries"] = stats.slowest()
+    logger.info(json.dumps(record))
@@ -0,0 +1,7 @@
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+
+
+def as_utc(value: datetime) -> datetime:
+    """Attach UTC to naive datetimes (SQLite returns them without an offset)."""
+    return value if value.tzinfo else value.replace(tzinfo=datetime_UTC)
@@ -1,17 +1,97 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 from core.config import settings
+from core.pool import engine_options, pool_status, track_pool
+from core.query_stats import track_queries
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class AppSession(Session):
+    """Session class of the app's sessionmakers.
+
+    The flush listeners that keep ``subscription_counters`` and
+    ``subscription_timeseries_cache`` in step are registered on this class,
+    so sessions created elsewhere (scripts, other apps sharing the process)
+    are left alone.
+    """
+
+
+SessionLocal = sessionmaker(class_=AppSession, autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
+ASYNC_DRIVERS = {
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_engine = None
+_async_engine = None
+_AsyncSessionLocal = None
+_pool_stats = {}
+
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_engine():
+    """Build the engine on first use instead of during the Lambda init phase."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(settings.database_url, **engine_options(settings, settings.database_url))
+        _pool_stats["sync"] = track_pool(_engine)
+        track_queries(_engine)
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
 
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def to_async_url(url: str) -> str:
+    """Swap the sync driver in ``url`` for its asyncio counterpart."""
+    scheme, separator, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + separator + rest
+
+
+def get_async_engine():
+    """Build the async engine on first use so the sync-only path never imports asyncpg."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = settings.async_database_url or to_async_url(settings.database_url)
+        _async_engine = create_async_engine(url, **engine_options(settings, url, is_async=True))
+        _pool_stats["async"] = track_pool(_async_engine.sync_engine)
+        track_queries(_async_engine.sync_engine)
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine, sync_session_class=AppSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+def get_pool_status() -> dict:
+    """Pool checkout/wait statistics for every engine created so far."""
+    engines = {"sync": _engine, "async": _async_engine.sync_engine if _async_engine else None}
+    return {
+        name: pool_status(engine, _pool_stats[name])
+        for name, engine in engines.items()
+        if engine is not None
+    }
@@ -1,20 +1,96 @@
-from fastapi import FastAPI
-from mangum import Mangum
+import logging
+import time
 
+from fastapi import APIRouter, FastAPI, Request, Response
+
+from core.config import settings
+from core.metrics import CONTENT_TYPE, UNMATCHED_ROUTE, metrics
+from core.query_stats import log_request, logger as request_logger, server_timing, start_request
+from database import get_pool_status
 from routers import user_router, plan_router, subscription_router, report_router
 
+def configure_request_logging() -> None:
+    """Emit the per-request log lines at INFO.
+
+    A stream handler is added only when the root logger has none (plain
+    uvicorn); under Lambda the runtime's root handler already ships them.
+    """
+    request_logger.setLevel(logging.INFO)
+    if not request_logger.handlers and not logging.getLogger().handlers:
+        request_logger.addHandler(logging.StreamHandler())
+
+
+configure_request_logging()
+
 app = FastAPI(
     title="Shade Subscription API",
     description="API for subscription management",
     version="1.0.0",
 )
 
-app.include_router(user_router)
-app.include_router(plan_router)
-app.include_router(subscription_router)
+
+def include_with_fallback(app: FastAPI, primary: APIRouter, fallback: APIRouter) -> None:
+    """Include ``primary`` and every route of ``fallback`` it does not define.
+
+    Fallback-only routes are registered first so static paths such as
+    ``/subscriptions/export`` are matched before the primary router's
+    ``/{id}`` patterns.
+    """
+    taken = {
+        (route.path, method)
+        for route in primary.routes
+        for method in getattr(route, "methods", ())
+    }
+    remaining = APIRouter()
+    remaining.routes.extend(
+        route
+        for route in fallback.routes
+        if not any((route.path, method) in taken for method in getattr(route, "methods", ()))
+    )
+    app.include_router(remaining)
+    app.include_router(primary)
+
+
+if settings.async_db:
+    from routers.async_user import router as async_user_router
+    from routers.async_plan import router as async_plan_router
+    from routers.async_subscription import router as async_subscription_router
+
+    include_with_fallback(app, async_user_router, user_router)
+    include_with_fallback(app, async_plan_router, plan_router)
+    include_with_fallback(app, async_subscription_router, subscription_router)
+else:
+    app.include_router(user_router)
+    app.include_router(plan_router)
+    app.include_router(subscription_router)
 app.include_router(report_router)
 
 
+@app.middleware("http")
+async def observe_request(request: Request, call_next):
+    """Record latency metrics, and statement counts and DB time into ``Server-Timing`` and one log line."""
+    if not (settings.metrics_enabled or settings.query_stats):
+        return await call_next(request)
+    started = time.perf_counter()
+    stats = start_request(settings.slow_query_ms, settings.slow_query_log_limit) if settings.query_stats else None
+    if settings.metrics_enabled:
+        metrics.request_started()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        total_seconds = time.perf_counter() - started
+        # Label by route template so ids do not explode the series count.
+        route = getattr(request.scope.get("route"), "path", UNMATCHED_ROUTE)
+        if settings.metrics_enabled:
+            metrics.request_finished(request.method, route, status_code, total_seconds)
+    if stats is not None:
+        response.headers["Server-Timing"] = server_timing(stats, total_seconds)
+        log_request(request.method, route, status_code, stats, total_seconds)
+    return response
+
+
 @app.get("/")
 def root():
     return {"message": "Shade Subscription API is running"}
@@ -25,5 +101,33 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/pool")
+def pool_health_check():
+    return get_pool_status()
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint():
+    return Response(metrics.render(get_pool_status()), media_type=CONTENT_TYPE)
+
+
+_lambda_adapter = None
+
+
+def is_keep_warm_event(event: dict) -> bool:
+    """EventBridge schedules (or an explicit ``{"warmup": true}``) that only keep the container alive."""
+    return event.get("warmup") is True or (
+        event.get("source") == "aws.events" and event.get("detail-type") == "Scheduled Event"
+    )
+
+
 # AWS Lambda handler
-handler = Mangum(app)
+def handler(event, context):
+    global _lambda_adapter
+    if is_keep_warm_event(event):
+        return {"statusCode": 200, "body": "warm"}
+    if _lambda_adapter is None:
+        from mangum import Mangum
+
+        _lambda_adapter = Mangum(app)
+    return _lambda_adapter(event, context)
@@ -1,5 +1,14 @@
 from models.user import User
 from models.plan import Plan
 from models.subscription import Subscription
+from models.subscription_counter import SubscriptionCounter
+from models.subscription_timeseries import SubscriptionTimeseriesCache, SubscriptionTimeseriesCacheGeneration
 
-__all__ = ["User", "Plan", "Subscription"]
+__all__ = [
+    "User",
+    "Plan",
+    "Subscription",
+    "SubscriptionCounter",
+    "SubscriptionTimeseriesCache",
+    "SubscriptionTimeseriesCacheGeneration",
+]
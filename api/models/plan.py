@@ -4,12 +4,19 @@ from datetime import UTC as datetime_UTC
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import String, DateTime, Numeric, Text, Boolean
+from sqlalchemy import String, DateTime, Numeric, Text, Boolean, Index, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from core.timestamps import as_utc
 from database import Base
 
 
+# Exclusion constraint on overlapping windows per tier, billing period and
+# simulation flag, added by migration e6b3c8a1f5d2 when PLAN_WINDOW_EXCLUSION
+# is set (PostgreSQL only).
+PLAN_WINDOW_OVERLAP_CONSTRAINT = "ex_plans_window_overlap"
+
+
 class PlanTier(str, Enum):
     FREE = "free"
     BASIC = "basic"
@@ -36,6 +43,15 @@ class Plan(Base):
     def is_active(self, current_time: datetime | None = None) -> bool:
         if current_time is None:
             current_time = datetime.now(datetime_UTC)
-        if self.active_to is None:
-            return current_time >= self.active_from.replace(tzinfo=datetime_UTC)
-        return self.active_from.replace(tzinfo=datetime_UTC) <= current_time <= self.active_to.replace(tzinfo=datetime_UTC)
+        if current_time < as_utc(self.active_from):
+            return False
+        return self.active_to is None or current_time <= as_utc(self.active_to)
+
+
+def plan_validity():
+    """The plan's active window as an inclusive tstzrange; an open active_to is unbounded."""
+    return func.tstzrange(Plan.active_from, Plan.active_to, literal_column("'[]'"))
+
+
+# GiST index over the same expression, so `plan_validity() @> :at` can use it.
+Index("ix_plans_validity", plan_validity(), postgresql_using="gist").ddl_if(dialect="postgresql")
@@ -3,11 +3,16 @@ from datetime import UTC as datetime_UTC
 
 from enum import Enum
 
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import String, DateTime, ForeignKey, Index, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from core.db_errors import violates_unique
 from database import Base
 
+# Partial unique index allowing at most one active subscription per user.
+ACTIVE_SUBSCRIPTION_CONSTRAINT = "uq_subscriptions_user_id_active"
+
 
 class SubscriptionStatus(str, Enum):
     ACTIVE = "active"
@@ -17,9 +22,30 @@ class SubscriptionStatus(str, Enum):
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        # At most one active subscription per user, enforced by the database.
+        Index(
+            ACTIVE_SUBSCRIPTION_CONSTRAINT,
+            "user_id",
+            unique=True,
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        # Per-user lookups filtered by status; also serves plain user_id lookups.
+        Index("ix_subscriptions_user_id_status", "user_id", "status"),
+        # Overdue active rows for the expiry sweeper.
+        Index(
+            "ix_subscriptions_end_date_active",
+            "end_date",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        # Index-only scans for the report's status/plan aggregates.
+        Index("ix_subscriptions_status_plan_id", "status", "plan_id", postgresql_include=["id"]),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     plan_id: Mapped[int] = mapped_column(ForeignKey("plans.id"), nullable=False, index=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default=SubscriptionStatus.ACTIVE.value)
     start_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -39,3 +65,8 @@ class Subscription(Base):
         if self.end_date and current_time > self.end_date.replace(tzinfo=datetime_UTC):
             return False
         return True
+
+
+def is_duplicate_active(error: IntegrityError) -> bool:
+    """Whether ``error`` is a second active subscription for the same user."""
+    return violates_unique(error, ACTIVE_SUBSCRIPTION_CONSTRAINT, "subscriptions", ["user_id"])
@@ -0,0 +1,14 @@
+from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class SubscriptionCounter(Base):
+    """Number of subscriptions per (plan, status), maintained alongside every write."""
+
+    __tablename__ = "subscription_counters"
+
+    plan_id: Mapped[int] = mapped_column(ForeignKey("plans.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
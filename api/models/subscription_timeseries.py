@@ -0,0 +1,30 @@
+from datetime import date
+
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class SubscriptionTimeseriesCache(Base):
+    """Active-subscription counts for time-series buckets that have already closed."""
+
+    __tablename__ = "subscription_timeseries_cache"
+
+    granularity: Mapped[str] = mapped_column(String(10), primary_key=True)  # day, week, month
+    bucket_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    tier: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class SubscriptionTimeseriesCacheGeneration(Base):
+    """Single-row counter bumped by every invalidation of ``subscription_timeseries_cache``.
+
+    Reports read it before counting and only store their buckets if it is
+    unchanged, so counts taken before a concurrent write are never cached.
+    """
+
+    __tablename__ = "subscription_timeseries_cache_generation"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
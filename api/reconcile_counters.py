@@ -0,0 +1,89 @@
+"""Rebuild subscription counters from the subscriptions table and report drift.
+
+Usage:
+    python reconcile_counters.py [--dry-run]
+
+Also usable as a Lambda handler; pass {"dry_run": true} to only report drift.
+"""
+
+import argparse
+import json
+
+from database import SessionLocal, get_engine
+from repositories.subscription import SubscriptionRepository
+from repositories.subscription_counter import SubscriptionCounterRepository
+
+
+def reconcile(dry_run: bool = False) -> list[dict]:
+    """Recount subscriptions and overwrite the counters; return every key that drifted."""
+    get_engine()
+    db = SessionLocal()
+    try:
+        counters = SubscriptionCounterRepository(db)
+        # Hold writers off the counters so the recount and the rewrite see the
+        # same set of committed subscriptions.
+        counters.lock()
+        expected = SubscriptionRepository(db).count_by_plan_and_status()
+        actual = counters.get_all()
+
+        drift = [
+            {
+                "plan_id": plan_id,
+                "status": status,
+                "expected": expected.get((plan_id, status), 0),
+                "actual": actual.get((plan_id, status), 0),
+            }
+            for plan_id, status in sorted(expected.keys() | actual.keys())
+            if expected.get((plan_id, status), 0) != actual.get((plan_id, status), 0)
+        ]
+
+        if dry_run:
+            db.rollback()
+        else:
+            counters.replace_all(expected)
+            db.commit()
+        return drift
+    finally:
+        db.close()
+
+
+def handler(event, context):
+    """Reconcile subscription counters.
+
+    Args:
+        event: Lambda event with optional 'dry_run' (default: False)
+        context: Lambda context
+
+    Returns:
+        dict with statusCode and the drifted counters
+    """
+    dry_run = bool(event.get("dry_run", False))
+    drift = reconcile(dry_run=dry_run)
+    return {
+        "statusCode": 200,
+        "body": json.dumps({
+            "success": True,
+            "dry_run": dry_run,
+            "drift": drift,
+        }),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild subscription counters")
+    parser.add_argument("--dry-run", action="store_true", help="Report drift without rewriting counters")
+    args = parser.parse_args()
+
+    drift = reconcile(dry_run=args.dry_run)
+    for row in drift:
+        print(
+            f"plan {row['plan_id']} / {row['status']}: "
+            f"counter={row['actual']} actual={row['expected']}"
+        )
+    action = "found" if args.dry_run else "fixed"
+    print(f"{len(drift)} drifted counter(s) {action}")
+    return 1 if drift and args.dry_run else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
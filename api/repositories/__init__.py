@@ -1,5 +1,13 @@
 from repositories.user import UserRepository
 from repositories.plan import PlanRepository
 from repositories.subscription import SubscriptionRepository
+from repositories.subscription_counter import SubscriptionCounterRepository
+from repositories.subscription_timeseries_cache import SubscriptionTimeseriesCacheRepository
 
-__all__ = ["UserRepository", "PlanRepository", "SubscriptionRepository"]
+__all__ = [
+    "UserRepository",
+    "PlanRepository",
+    "SubscriptionRepository",
+    "SubscriptionCounterRepository",
+    "SubscriptionTimeseriesCacheRepository",
+]
@@ -0,0 +1,78 @@
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.plan import Plan
+from repositories.batch import ids_filter
+from repositories.plan import active_at_filter, plan_fieldset_option
+from schemas.plan import PlanCreate, PlanUpdate
+
+
+class AsyncPlanRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, plan_id: int, fields: tuple[str, ...] | None = None) -> Plan | None:
+        if fields is None:
+            return await self.db.get(Plan, plan_id)
+        return await self.db.get(Plan, plan_id, options=[plan_fieldset_option(fields)])
+
+    async def get_by_ids(self, plan_ids: list[int]) -> dict[int, Plan]:
+        statement = select(Plan).filter(ids_filter(Plan.id, plan_ids, self.db.get_bind().dialect.name))
+        return {plan.id: plan for plan in await self.db.scalars(statement)}
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Plan]:
+        statement = select(Plan).order_by(Plan.id)
+        if fields is not None:
+            statement = statement.options(plan_fieldset_option(fields))
+        if after_id is not None:
+            statement = statement.filter(Plan.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        return list(await self.db.scalars(statement.limit(limit)))
+
+    async def get_active_plans(
+        self, current_time: datetime | None = None, fields: tuple[str, ...] | None = None
+    ) -> list[Plan]:
+        if current_time is None:
+            current_time = datetime.now(datetime_UTC)
+        statement = select(Plan).filter(active_at_filter(current_time, self.db.get_bind().dialect.name))
+        if fields is not None:
+            statement = statement.options(plan_fieldset_option(fields))
+        return list(await self.db.scalars(statement))
+
+    async def create(self, plan_data: PlanCreate) -> Plan:
+        plan = Plan(**plan_data.model_dump())
+        self.db.add(plan)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        await self.db.refresh(plan)
+        return plan
+
+    async def update(self, plan: Plan, plan_data: PlanUpdate) -> Plan:
+        update_data = plan_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(plan, field, value)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        await self.db.refresh(plan)
+        return plan
+
+    async def delete(self, plan: Plan) -> None:
+        await self.db.delete(plan)
+        await self.db.commit()
@@ -0,0 +1,167 @@
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from core.fieldsets import fieldset_model
+from models.subscription import Subscription, SubscriptionStatus
+from repositories.batch import ids_filter
+from repositories.subscription import (
+    detail_rows_statement,
+    eligible_insert_statement,
+    subscription_fieldset_options,
+    response_rows_statement,
+    subscription_detail_from_row,
+    subscription_fieldset_from_row,
+    subscription_response_from_row,
+    subscription_with_user_from_row,
+    with_user_rows_statement,
+)
+from repositories.subscription_counter import SubscriptionCounterRepository, counts_of
+from repositories.subscription_timeseries_cache import SubscriptionTimeseriesCacheRepository, spans_of
+from schemas.subscription import (
+    SubscriptionCreate,
+    SubscriptionDetailResponse,
+    SubscriptionResponse,
+    SubscriptionUpdate,
+    SubscriptionWithUserResponse,
+)
+
+
+class AsyncSubscriptionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, subscription_id: int, fields: tuple[str, ...] | None = None) -> Subscription | None:
+        statement = (
+            select(Subscription)
+            .options(*subscription_fieldset_options(fields))
+            .filter(Subscription.id == subscription_id)
+        )
+        return await self.db.scalar(statement)
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Subscription]:
+        statement = (
+            select(Subscription)
+            .options(*subscription_fieldset_options(fields))
+            .order_by(Subscription.id)
+        )
+        if after_id is not None:
+            statement = statement.filter(Subscription.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        return list(await self.db.scalars(statement.limit(limit)))
+
+    async def get_all_details(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[BaseModel]:
+        statement = detail_rows_statement(fields)
+        if after_id is not None:
+            statement = statement.filter(Subscription.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        result = await self.db.execute(statement.limit(limit))
+        if fields is None:
+            return [subscription_detail_from_row(row) for row in result]
+        model = fieldset_model(SubscriptionDetailResponse, fields)
+        return [subscription_fieldset_from_row(model, fields, row) for row in result]
+
+    async def get_by_ids(self, subscription_ids: list[int]) -> dict[int, Subscription]:
+        statement = (
+            select(Subscription)
+            .options(*subscription_fieldset_options(None))
+            .filter(ids_filter(Subscription.id, subscription_ids, self.db.get_bind().dialect.name))
+        )
+        return {subscription.id: subscription for subscription in await self.db.scalars(statement)}
+
+    async def get_details_by_ids(self, subscription_ids: list[int]) -> dict[int, SubscriptionDetailResponse]:
+        statement = detail_rows_statement().filter(
+            ids_filter(Subscription.id, subscription_ids, self.db.get_bind().dialect.name)
+        )
+        result = await self.db.execute(statement)
+        return {row.id: subscription_detail_from_row(row) for row in result}
+
+    async def get_all_with_users(
+        self, skip: int = 0, limit: int = 100, after_id: int | None = None
+    ) -> list[SubscriptionWithUserResponse]:
+        statement = with_user_rows_statement()
+        if after_id is not None:
+            statement = statement.filter(Subscription.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        result = await self.db.execute(statement.limit(limit))
+        return [subscription_with_user_from_row(row) for row in result]
+
+    async def get_responses_by_user_id(
+        self, user_id: int, fields: tuple[str, ...] | None = None
+    ) -> list[BaseModel]:
+        statement = response_rows_statement(fields).filter(Subscription.user_id == user_id)
+        result = await self.db.execute(statement)
+        if fields is None:
+            return [subscription_response_from_row(row) for row in result]
+        model = fieldset_model(SubscriptionResponse, fields)
+        return [subscription_fieldset_from_row(model, fields, row) for row in result]
+
+    async def get_by_user_id(self, user_id: int, fields: tuple[str, ...] | None = None) -> list[Subscription]:
+        statement = select(Subscription).filter(Subscription.user_id == user_id).order_by(Subscription.id)
+        if fields is not None:
+            statement = statement.options(*subscription_fieldset_options(fields))
+        return list(await self.db.scalars(statement))
+
+    async def get_active_by_user_id(self, user_id: int) -> Subscription | None:
+        statement = (
+            select(Subscription)
+            .options(joinedload(Subscription.plan))
+            .filter(Subscription.user_id == user_id)
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE.value)
+            .limit(1)
+        )
+        return await self.db.scalar(statement)
+
+    async def create_if_eligible(self, subscription_data: SubscriptionCreate) -> Subscription | None:
+        try:
+            subscription = (await self.db.scalars(eligible_insert_statement(subscription_data))).first()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        if subscription is not None:
+            deltas = counts_of([subscription])
+            spans = spans_of([subscription])
+            await self.db.run_sync(lambda session: SubscriptionCounterRepository(session).apply(deltas))
+            await self.db.run_sync(lambda session: SubscriptionTimeseriesCacheRepository(session).invalidate(spans))
+        await self.db.commit()
+        return subscription
+
+    async def create(self, subscription_data: SubscriptionCreate) -> Subscription:
+        subscription = Subscription(**subscription_data.model_dump())
+        self.db.add(subscription)
+        await self.db.commit()
+        await self.db.refresh(subscription)
+        return subscription
+
+    async def update(self, subscription: Subscription, subscription_data: SubscriptionUpdate) -> Subscription:
+        update_data = subscription_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(subscription, field, value)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        await self.db.refresh(subscription)
+        return subscription
+
+    async def delete(self, subscription: Subscription) -> None:
+        await self.db.delete(subscription)
+        await self.db.commit()
@@ -0,0 +1,59 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from models.user import User
+from repositories.batch import ids_filter
+from schemas.user import UserCreate, UserUpdate
+
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, user_id: int, fields: tuple[str, ...] | None = None) -> User | None:
+        if fields is None:
+            return await self.db.get(User, user_id)
+        return await self.db.get(User, user_id, options=[load_only(*(getattr(User, name) for name in fields))])
+
+    async def get_by_ids(self, user_ids: list[int]) -> dict[int, User]:
+        statement = select(User).filter(ids_filter(User.id, user_ids, self.db.get_bind().dialect.name))
+        return {user.id: user for user in await self.db.scalars(statement)}
+
+    async def get_by_email(self, email: str) -> User | None:
+        return await self.db.scalar(select(User).filter(User.email == email).limit(1))
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[User]:
+        statement = select(User).order_by(User.id)
+        if fields is not None:
+            statement = statement.options(load_only(*(getattr(User, name) for name in fields)))
+        if after_id is not None:
+            statement = statement.filter(User.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        return list(await self.db.scalars(statement.limit(limit)))
+
+    async def create(self, user_data: UserCreate) -> User:
+        user = User(**user_data.model_dump())
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def update(self, user: User, user_data: UserUpdate) -> User:
+        update_data = user_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(user, field, value)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def delete(self, user: User) -> None:
+        await self.db.delete(user)
+        await self.db.commit()
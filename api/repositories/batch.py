@@ -0,0 +1,16 @@
+from collections.abc import Sequence
+
+from sqlalchemy import Integer, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+def ids_filter(column, ids: Sequence[int], dialect_name: str):
+    """``column`` is one of ``ids``.
+
+    PostgreSQL binds the whole list as one array parameter (``= ANY(:ids)``),
+    so every batch size shares a single statement; other dialects expand
+    to ``IN (...)``.
+    """
+    if dialect_name == "postgresql":
+        return column == any_(literal(list(ids), ARRAY(Integer)))
+    return column.in_(ids)
@@ -1,36 +1,82 @@
 from datetime import datetime
 from datetime import UTC as datetime_UTC
 
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, and_, literal, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
-from models.plan import Plan
+from models.plan import Plan, plan_validity
+from repositories.batch import ids_filter
 from schemas.plan import PlanCreate, PlanUpdate
 
 
+def active_at_filter(current_time: datetime, dialect_name: str):
+    """Plans whose active window contains ``current_time``.
+
+    PostgreSQL uses range containment so the ``ix_plans_validity`` GiST index
+    applies; other dialects compare the bounds directly.
+    """
+    if dialect_name == "postgresql":
+        return plan_validity().op("@>")(literal(current_time, DateTime(timezone=True)))
+    return and_(
+        Plan.active_from <= current_time,
+        or_(Plan.active_to.is_(None), Plan.active_to >= current_time),
+    )
+
+
+def plan_fieldset_option(fields: tuple[str, ...]):
+    """Load only ``fields``, plus ``updated_at``, which the plan ETag is built from."""
+    return load_only(*(getattr(Plan, name) for name in fields), Plan.updated_at)
+
+
 class PlanRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, plan_id: int) -> Plan | None:
-        return self.db.query(Plan).filter(Plan.id == plan_id).first()
+    def get_by_id(self, plan_id: int, fields: tuple[str, ...] | None = None) -> Plan | None:
+        query = self.db.query(Plan).filter(Plan.id == plan_id)
+        if fields is not None:
+            query = query.options(plan_fieldset_option(fields))
+        return query.first()
+
+    def get_by_ids(self, plan_ids: list[int]) -> dict[int, Plan]:
+        query = self.db.query(Plan).filter(ids_filter(Plan.id, plan_ids, self.db.get_bind().dialect.name))
+        return {plan.id: plan for plan in query}
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[Plan]:
-        return self.db.query(Plan).offset(skip).limit(limit).all()
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Plan]:
+        query = self.db.query(Plan).order_by(Plan.id)
+        if fields is not None:
+            query = query.options(plan_fieldset_option(fields))
+        if after_id is not None:
+            query = query.filter(Plan.id > after_id)
+        else:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
-    def get_active_plans(self, current_time: datetime | None = None) -> list[Plan]:
+    def get_active_plans(
+        self, current_time: datetime | None = None, fields: tuple[str, ...] | None = None
+    ) -> list[Plan]:
         if current_time is None:
             current_time = datetime.now(datetime_UTC)
-        return (
-            self.db.query(Plan)
-            .filter(Plan.active_from <= current_time)
-            .filter((Plan.active_to.is_(None)) | (Plan.active_to >= current_time))
-            .all()
-        )
+        query = self.db.query(Plan).filter(active_at_filter(current_time, self.db.get_bind().dialect.name))
+        if fields is not None:
+            query = query.options(plan_fieldset_option(fields))
+        return query.all()
 
     def create(self, plan_data: PlanCreate) -> Plan:
         plan = Plan(**plan_data.model_dump())
         self.db.add(plan)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
         self.db.refresh(plan)
         return plan
 
@@ -38,7 +84,11 @@ class PlanRepository:
         update_data = plan_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(plan, field, value)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
         self.db.refresh(plan)
         return plan
 
@@ -1,39 +1,369 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from collections import Counter
+from collections.abc import Iterator
+from datetime import datetime
+from datetime import UTC as datetime_UTC
 
+from pydantic import BaseModel
+from sqlalchemy import (
+    DateTime, String, and_, column, func, insert, literal, literal_column, or_, select, tuple_, update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only
+
+from core.fieldsets import fieldset_model
+from core.timestamps import as_utc
+from repositories.batch import ids_filter
 from models.subscription import Subscription, SubscriptionStatus
-from models.plan import Plan
-from schemas.subscription import SubscriptionCreate, SubscriptionUpdate
+from models.plan import Plan, PlanTier
+from models.user import User, UserMode
+from repositories.subscription_counter import SubscriptionCounterRepository, counts_of
+from repositories.subscription_timeseries_cache import SubscriptionTimeseriesCacheRepository, spans_of
+from schemas.plan import PlanResponse
+from schemas.subscription import (
+    SubscriptionCreate,
+    SubscriptionDetailResponse,
+    SubscriptionResponse,
+    SubscriptionUpdate,
+    SubscriptionWithUserResponse,
+)
+from schemas.user import UserResponse
+
+
+TIMESERIES_INTERVALS = {"day": "1 day", "week": "1 week", "month": "1 month"}
+
+
+def active_during(bucket_start, bucket_end):
+    """Subscriptions active at any point in [bucket_start, bucket_end)."""
+    return and_(
+        Subscription.start_date < bucket_end,
+        or_(Subscription.cancelled_at.is_(None), Subscription.cancelled_at > bucket_start),
+        or_(Subscription.end_date.is_(None), Subscription.end_date > bucket_start),
+    )
+
+
+def eligible_insert_statement(subscription_data: SubscriptionCreate, now: datetime | None = None):
+    """INSERT ... SELECT ... RETURNING that only inserts for a live user and an active plan.
+
+    Returns no row when the user or plan is missing or ineligible. The
+    one-active-subscription rule is enforced by the
+    ``uq_subscriptions_user_id_active`` partial unique index.
+    """
+    if now is None:
+        now = datetime.now(datetime_UTC)
+    timestamp = DateTime(timezone=True)
+    source = (
+        select(
+            User.id,
+            Plan.id,
+            literal(SubscriptionStatus.ACTIVE.value, String),
+            literal(subscription_data.start_date, timestamp),
+            literal(subscription_data.end_date, timestamp),
+            literal(now, timestamp),
+            literal(now, timestamp),
+        )
+        .select_from(User)
+        .join(Plan, Plan.id == subscription_data.plan_id)
+        .filter(User.id == subscription_data.user_id)
+        .filter(User.mode != UserMode.SIMULATION.value)
+        .filter(Plan.active_from <= now)
+        .filter(or_(Plan.active_to.is_(None), Plan.active_to >= now))
+    )
+    columns = ["user_id", "plan_id", "status", "start_date", "end_date", "created_at", "updated_at"]
+    return insert(Subscription).from_select(columns, source).returning(Subscription)
+
+
+SUBSCRIPTION_RESPONSE_COLUMNS = (
+    Subscription.id,
+    Subscription.user_id,
+    Subscription.plan_id,
+    Subscription.status,
+    Subscription.start_date,
+    Subscription.end_date,
+    Subscription.cancelled_at,
+    Subscription.created_at,
+    Subscription.updated_at,
+)
+SUBSCRIPTION_USER_COLUMNS = (
+    User.id.label("user__id"),
+    User.email.label("user__email"),
+    User.name.label("user__name"),
+    User.mode.label("user__mode"),
+    User.created_at.label("user__created_at"),
+    User.updated_at.label("user__updated_at"),
+)
+SUBSCRIPTION_PLAN_COLUMNS = (
+    Plan.id.label("plan__id"),
+    Plan.name.label("plan__name"),
+    Plan.tier.label("plan__tier"),
+    Plan.description.label("plan__description"),
+    Plan.price.label("plan__price"),
+    Plan.billing_period.label("plan__billing_period"),
+    Plan.active_from.label("plan__active_from"),
+    Plan.active_to.label("plan__active_to"),
+    Plan.created_at.label("plan__created_at"),
+    Plan.updated_at.label("plan__updated_at"),
+)
+SUBSCRIPTION_WITH_USER_COLUMNS = SUBSCRIPTION_RESPONSE_COLUMNS + SUBSCRIPTION_USER_COLUMNS
+SUBSCRIPTION_DETAIL_COLUMNS = SUBSCRIPTION_WITH_USER_COLUMNS + SUBSCRIPTION_PLAN_COLUMNS
+NESTED_FIELDS = ("user", "plan")
+# Everything SubscriptionWithUserResponse reads: the subscription and its user, not the plan.
+SIDELOADED_FIELDS = tuple(SubscriptionWithUserResponse.model_fields)
+
+
+def _fieldset_columns(fields: tuple[str, ...]) -> list:
+    columns = [getattr(Subscription, name) for name in fields if name not in NESTED_FIELDS]
+    if "user" in fields:
+        columns.extend(SUBSCRIPTION_USER_COLUMNS)
+    if "plan" in fields:
+        columns.extend(SUBSCRIPTION_PLAN_COLUMNS)
+    return columns
+
+
+def subscription_fieldset_options(fields: tuple[str, ...] | None) -> list:
+    """Load options for one subscription: only the columns in ``fields``, and only the nested objects asked for."""
+    if fields is None:
+        return [joinedload(Subscription.user), joinedload(Subscription.plan)]
+    columns = [getattr(Subscription, name) for name in fields if name not in NESTED_FIELDS]
+    options = [load_only(Subscription.id, *columns)]
+    options.extend(joinedload(getattr(Subscription, name)) for name in NESTED_FIELDS if name in fields)
+    return options
+
+
+def detail_rows_statement(fields: tuple[str, ...] | None = None):
+    """Exactly the columns of SubscriptionDetailResponse, or of its ``fields``, as plain rows.
+
+    Users and plans are only joined when their field is requested.
+    """
+    if fields is None:
+        fields = tuple(SubscriptionDetailResponse.model_fields)
+    statement = select(*_fieldset_columns(fields))
+    if "user" in fields:
+        statement = statement.join(User, User.id == Subscription.user_id)
+    if "plan" in fields:
+        statement = statement.join(Plan, Plan.id == Subscription.plan_id)
+    return statement.order_by(Subscription.id)
+
+
+def with_user_rows_statement():
+    """Exactly the columns of SubscriptionWithUserResponse; plans are left to the caller."""
+    return (
+        select(*SUBSCRIPTION_WITH_USER_COLUMNS)
+        .join(User, User.id == Subscription.user_id)
+        .order_by(Subscription.id)
+    )
+
+
+def response_rows_statement(fields: tuple[str, ...] | None = None):
+    """Exactly the columns of SubscriptionResponse, or of its ``fields``, as plain rows."""
+    columns = SUBSCRIPTION_RESPONSE_COLUMNS if fields is None else _fieldset_columns(fields)
+    return select(*columns).order_by(Subscription.id)
+
+
+def _subscription_fields(row) -> dict:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "plan_id": row.plan_id,
+        "status": SubscriptionStatus(row.status),
+        "start_date": row.start_date,
+        "end_date": row.end_date,
+        "cancelled_at": row.cancelled_at,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _user_from_row(row) -> UserResponse:
+    return UserResponse.model_construct(
+        id=row.user__id,
+        email=row.user__email,
+        name=row.user__name,
+        mode=UserMode(row.user__mode),
+        created_at=row.user__created_at,
+        updated_at=row.user__updated_at,
+    )
+
+
+def subscription_response_from_row(row) -> SubscriptionResponse:
+    # Database rows are already valid, so skip pydantic validation entirely.
+    return SubscriptionResponse.model_construct(**_subscription_fields(row))
+
+
+def subscription_with_user_from_row(row) -> SubscriptionWithUserResponse:
+    return SubscriptionWithUserResponse.model_construct(**_subscription_fields(row), user=_user_from_row(row))
+
+
+def _plan_from_row(row) -> PlanResponse:
+    return PlanResponse.model_construct(
+        id=row.plan__id,
+        name=row.plan__name,
+        tier=PlanTier(row.plan__tier),
+        description=row.plan__description,
+        price=row.plan__price,
+        billing_period=row.plan__billing_period,
+        active_from=row.plan__active_from,
+        active_to=row.plan__active_to,
+        created_at=row.plan__created_at,
+        updated_at=row.plan__updated_at,
+    )
+
+
+def subscription_detail_from_row(row) -> SubscriptionDetailResponse:
+    return SubscriptionDetailResponse.model_construct(
+        **_subscription_fields(row),
+        user=_user_from_row(row),
+        plan=_plan_from_row(row),
+    )
+
+
+def subscription_fieldset_from_row(model: type[BaseModel], fields: tuple[str, ...], row) -> BaseModel:
+    """Build a trimmed response ``model`` from a row selected by ``_fieldset_columns``."""
+    values = {name: getattr(row, name) for name in fields if name not in NESTED_FIELDS}
+    if "status" in values:
+        values["status"] = SubscriptionStatus(values["status"])
+    if "user" in fields:
+        values["user"] = _user_from_row(row)
+    if "plan" in fields:
+        values["plan"] = _plan_from_row(row)
+    return model.model_construct(**values)
+
+
+def count_summary_statement():
+    """Total, per-status and per-plan counts in one GROUP BY GROUPING SETS (PostgreSQL)."""
+    return (
+        select(
+            Subscription.status,
+            Plan.name,
+            Plan.tier,
+            func.count(Subscription.id),
+            func.grouping(Subscription.status),
+            func.grouping(Plan.id),
+        )
+        .join(Plan, Plan.id == Subscription.plan_id)
+        .group_by(func.grouping_sets(
+            tuple_(),
+            tuple_(Subscription.status),
+            tuple_(Plan.id, Plan.name, Plan.tier),
+        ))
+    )
+
+
+def count_by_plan_and_status_statement():
+    return (
+        select(Plan.id, Plan.name, Plan.tier, Subscription.status, func.count(Subscription.id))
+        .join(Plan, Plan.id == Subscription.plan_id)
+        .group_by(Plan.id, Plan.name, Plan.tier, Subscription.status)
+        .order_by(Plan.id, Subscription.status)
+    )
 
 
 class SubscriptionRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.counters = SubscriptionCounterRepository(db)
+        self.timeseries_cache = SubscriptionTimeseriesCacheRepository(db)
 
-    def get_by_id(self, subscription_id: int) -> Subscription | None:
+    def get_by_id(self, subscription_id: int, fields: tuple[str, ...] | None = None) -> Subscription | None:
         return (
             self.db.query(Subscription)
-            .options(joinedload(Subscription.user), joinedload(Subscription.plan))
+            .options(*subscription_fieldset_options(fields))
             .filter(Subscription.id == subscription_id)
             .first()
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[Subscription]:
-        return (
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Subscription]:
+        query = (
             self.db.query(Subscription)
-            .options(joinedload(Subscription.user), joinedload(Subscription.plan))
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .options(*subscription_fieldset_options(fields))
+            .order_by(Subscription.id)
         )
+        if after_id is not None:
+            query = query.filter(Subscription.id > after_id)
+        else:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
-    def get_by_user_id(self, user_id: int) -> list[Subscription]:
-        return (
+    def get_all_details(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[BaseModel]:
+        """Read-only projection of ``get_all``: Core rows mapped straight to response schemas.
+
+        With ``fields``, only those columns are selected and the items are
+        the matching trimmed ``SubscriptionDetailResponse`` model.
+        """
+        statement = detail_rows_statement(fields)
+        if after_id is not None:
+            statement = statement.filter(Subscription.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        rows = self.db.execute(statement.limit(limit))
+        if fields is None:
+            return [subscription_detail_from_row(row) for row in rows]
+        model = fieldset_model(SubscriptionDetailResponse, fields)
+        return [subscription_fieldset_from_row(model, fields, row) for row in rows]
+
+    def get_by_ids(self, subscription_ids: list[int]) -> dict[int, Subscription]:
+        query = (
             self.db.query(Subscription)
-            .options(joinedload(Subscription.plan))
-            .filter(Subscription.user_id == user_id)
-            .all()
+            .options(*subscription_fieldset_options(None))
+            .filter(ids_filter(Subscription.id, subscription_ids, self.db.get_bind().dialect.name))
         )
+        return {subscription.id: subscription for subscription in query}
+
+    def get_details_by_ids(self, subscription_ids: list[int]) -> dict[int, SubscriptionDetailResponse]:
+        """Row projection of the given subscriptions, in one ``ANY``/``IN`` query."""
+        statement = detail_rows_statement().filter(
+            ids_filter(Subscription.id, subscription_ids, self.db.get_bind().dialect.name)
+        )
+        return {row.id: subscription_detail_from_row(row) for row in self.db.execute(statement)}
+
+    def get_all_with_users(
+        self, skip: int = 0, limit: int = 100, after_id: int | None = None
+    ) -> list[SubscriptionWithUserResponse]:
+        """Like ``get_all_details`` without the plan columns, for side-loading plans."""
+        statement = with_user_rows_statement()
+        if after_id is not None:
+            statement = statement.filter(Subscription.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        return [subscription_with_user_from_row(row) for row in self.db.execute(statement.limit(limit))]
+
+    def get_responses_by_user_id(
+        self, user_id: int, fields: tuple[str, ...] | None = None
+    ) -> list[BaseModel]:
+        """Read-only projection of ``get_by_user_id``, optionally trimmed to ``fields``."""
+        statement = response_rows_statement(fields).filter(Subscription.user_id == user_id)
+        rows = self.db.execute(statement)
+        if fields is None:
+            return [subscription_response_from_row(row) for row in rows]
+        model = fieldset_model(SubscriptionResponse, fields)
+        return [subscription_fieldset_from_row(model, fields, row) for row in rows]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Subscription]:
+        """Stream every subscription with its user and plan from a server-side cursor."""
+        statement = (
+            select(Subscription)
+            .options(joinedload(Subscription.user), joinedload(Subscription.plan))
+            .order_by(Subscription.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.scalars(statement)
+
+    def get_by_user_id(self, user_id: int, fields: tuple[str, ...] | None = None) -> list[Subscription]:
+        query = self.db.query(Subscription).filter(Subscription.user_id == user_id).order_by(Subscription.id)
+        if fields is not None:
+            query = query.options(*subscription_fieldset_options(fields))
+        return query.all()
 
     def get_active_by_user_id(self, user_id: int) -> Subscription | None:
         return (
@@ -44,6 +374,46 @@ class SubscriptionRepository:
             .first()
         )
 
+    def get_user_ids_with_active(self, user_ids: list[int]) -> set[int]:
+        statement = (
+            select(Subscription.user_id)
+            .filter(Subscription.user_id.in_(user_ids))
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE.value)
+        )
+        return set(self.db.scalars(statement))
+
+    def create_many(self, subscriptions_data: list[SubscriptionCreate]) -> list[Subscription]:
+        """Insert all subscriptions in one transaction with multi-row INSERT ... RETURNING."""
+        statement = insert(Subscription).returning(Subscription, sort_by_parameter_order=True)
+        rows = [subscription_data.model_dump() for subscription_data in subscriptions_data]
+        try:
+            subscriptions = list(self.db.scalars(statement, rows))
+            self.counters.apply(counts_of(subscriptions))
+            self.timeseries_cache.invalidate(spans_of(subscriptions))
+        except IntegrityError:
+            self.db.rollback()
+            raise
+        # Detach so the commit does not expire the RETURNING-loaded rows.
+        for subscription in subscriptions:
+            self.db.expunge(subscription)
+        self.db.commit()
+        return subscriptions
+
+    def create_if_eligible(self, subscription_data: SubscriptionCreate) -> Subscription | None:
+        """Create the subscription in a single round trip, or return None if ineligible."""
+        try:
+            subscription = self.db.scalars(eligible_insert_statement(subscription_data)).first()
+        except IntegrityError:
+            self.db.rollback()
+            raise
+        if subscription is not None:
+            self.counters.apply(counts_of([subscription]))
+            self.timeseries_cache.invalidate(spans_of([subscription]))
+            # RETURNING loaded every column; keep the commit from expiring them.
+            self.db.expunge(subscription)
+        self.db.commit()
+        return subscription
+
     def create(self, subscription_data: SubscriptionCreate) -> Subscription:
         subscription = Subscription(**subscription_data.model_dump())
         self.db.add(subscription)
@@ -55,7 +425,11 @@ class SubscriptionRepository:
         update_data = subscription_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(subscription, field, value)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
         self.db.refresh(subscription)
         return subscription
 
@@ -63,20 +437,137 @@ class SubscriptionRepository:
         self.db.delete(subscription)
         self.db.commit()
 
-    def count_by_status(self) -> list[tuple[str, int]]:
-        return (
-            self.db.query(Subscription.status, func.count(Subscription.id))
-            .group_by(Subscription.status)
-            .all()
+    def expire_overdue(self, limit: int, now: datetime | None = None) -> int:
+        """Mark up to ``limit`` active subscriptions whose end_date has passed as expired.
+
+        Candidate rows are claimed with FOR UPDATE SKIP LOCKED, so concurrent
+        sweepers take disjoint chunks instead of waiting on each other. The
+        chunk and its counter adjustments are committed together.
+        """
+        if now is None:
+            now = datetime.now(datetime_UTC)
+        overdue = (
+            select(Subscription.id)
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE.value)
+            .filter(Subscription.end_date < now)
+            .order_by(Subscription.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
+        statement = (
+            update(Subscription)
+            .filter(Subscription.id.in_(overdue.scalar_subquery()))
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE.value)
+            .values(status=SubscriptionStatus.EXPIRED.value, updated_at=now)
+            .returning(Subscription.plan_id)
+            .execution_options(synchronize_session=False)
+        )
+        plan_ids = list(self.db.scalars(statement))
+        deltas: Counter[tuple[int, str]] = Counter()
+        for plan_id in plan_ids:
+            deltas[(plan_id, SubscriptionStatus.ACTIVE.value)] -= 1
+            deltas[(plan_id, SubscriptionStatus.EXPIRED.value)] += 1
+        self.counters.apply(deltas)
+        self.db.commit()
+        return len(plan_ids)
 
-    def count_by_plan(self) -> list[tuple[str, str, int]]:
+    def count_summary(self) -> tuple[int, list[tuple[str, int]], list[tuple[str, str, int]]]:
+        """Total, per-status and per-plan counts from a single scan of subscriptions.
+
+        Returns ``(total, [(status, count)], [(plan name, tier, count)])``.
+        PostgreSQL computes all three with GROUPING SETS; other dialects group
+        by (plan, status) once and roll the rows up here.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._count_summary_grouping_sets()
+
+        by_status: dict[str, int] = {}
+        # Keyed by plan id like the GROUPING SETS path; plan names are not unique.
+        by_plan: dict[int, list] = {}
+        for plan_id, name, tier, subscription_status, count in self.db.execute(
+            count_by_plan_and_status_statement()
+        ):
+            by_status[subscription_status] = by_status.get(subscription_status, 0) + count
+            by_plan.setdefault(plan_id, [name, tier, 0])[2] += count
         return (
-            self.db.query(Plan.name, Plan.tier, func.count(Subscription.id))
-            .join(Subscription, Subscription.plan_id == Plan.id)
-            .group_by(Plan.id, Plan.name, Plan.tier)
-            .all()
+            sum(by_status.values()),
+            list(by_status.items()),
+            [(name, tier, count) for name, tier, count in by_plan.values()],
+        )
+
+    def _count_summary_grouping_sets(self) -> tuple[int, list[tuple[str, int]], list[tuple[str, str, int]]]:
+        total = 0
+        by_status = []
+        by_plan = []
+        for subscription_status, name, tier, count, status_rolled_up, plan_rolled_up in self.db.execute(
+            count_summary_statement()
+        ):
+            if not status_rolled_up:
+                by_status.append((subscription_status, count))
+            elif not plan_rolled_up:
+                by_plan.append((name, tier, count))
+            else:
+                total = count
+        return total, by_status, by_plan
+
+    def count_active_by_tier(
+        self, granularity: str, buckets: list[tuple[datetime, datetime]]
+    ) -> Counter[tuple[datetime, str]]:
+        """Active subscriptions per (bucket start, plan tier) for consecutive UTC buckets.
+
+        ``buckets`` are ``(start, end)`` pairs aligned to ``granularity``.
+        PostgreSQL generates the buckets with generate_series and range-joins
+        subscriptions against them; other dialects count in Python.
+        """
+        if not buckets:
+            return Counter()
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._count_active_by_tier_series(granularity, buckets)
+
+        first_start = min(start for start, _ in buckets)
+        last_end = max(end for _, end in buckets)
+        statement = (
+            select(Subscription.start_date, Subscription.cancelled_at, Subscription.end_date, Plan.tier)
+            .join(Plan, Plan.id == Subscription.plan_id)
+            .filter(active_during(first_start, last_end))
+        )
+        counts: Counter[tuple[datetime, str]] = Counter()
+        for start_date, cancelled_at, end_date, tier in self.db.execute(statement):
+            start_date = as_utc(start_date)
+            ends = [as_utc(value) for value in (cancelled_at, end_date) if value is not None]
+            for bucket_start, bucket_end in buckets:
+                if start_date < bucket_end and all(value > bucket_start for value in ends):
+                    counts[(bucket_start, tier)] += 1
+        return counts
+
+    def _count_active_by_tier_series(
+        self, granularity: str, buckets: list[tuple[datetime, datetime]]
+    ) -> Counter[tuple[datetime, str]]:
+        # generate_series runs over UTC wall-clock timestamps so month steps are
+        # not shifted by the session time zone; bounds are converted back to
+        # timestamptz before comparing, which keeps the subscription side indexable.
+        step = literal_column(f"interval '{TIMESERIES_INTERVALS[granularity]}'")
+        starts = [start.astimezone(datetime_UTC).replace(tzinfo=None) for start, _ in buckets]
+        series = (
+            func.generate_series(literal(min(starts), DateTime), literal(max(starts), DateTime), step)
+            .table_valued(column("bucket_start", DateTime))
+            .render_derived(name="buckets")
+        )
+        bucket_start = func.timezone("UTC", series.c.bucket_start)
+        bucket_end = func.timezone("UTC", series.c.bucket_start + step)
+        statement = (
+            select(series.c.bucket_start, Plan.tier, func.count(Subscription.id))
+            .select_from(series)
+            .join(Subscription, active_during(bucket_start, bucket_end))
+            .join(Plan, Plan.id == Subscription.plan_id)
+            .filter(series.c.bucket_start.in_(starts))
+            .group_by(series.c.bucket_start, Plan.tier)
         )
+        return Counter({
+            (start.replace(tzinfo=datetime_UTC), tier): count
+            for start, tier, count in self.db.execute(statement)
+        })
 
-    def count_total(self) -> int:
-        return self.db.query(func.count(Subscription.id)).scalar()
+    def count_by_plan_and_status(self) -> dict[tuple[int, str], int]:
+        rows = self.db.execute(count_by_plan_and_status_statement())
+        return {(plan_id, status): count for plan_id, _, _, status, count in rows}
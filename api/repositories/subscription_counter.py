@@ -0,0 +1,133 @@
+from collections import Counter
+
+from sqlalchemy import event, inspect, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from database import AppSession
+from models.plan import Plan
+from models.subscription import Subscription
+from models.subscription_counter import SubscriptionCounter
+
+CounterKey = tuple[int, str]
+
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class SubscriptionCounterRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, deltas: Counter[CounterKey]) -> None:
+        """Add ``deltas`` to the counters inside the caller's transaction."""
+        apply_counter_deltas(self.db.connection(), deltas)
+
+    def get_all(self) -> dict[CounterKey, int]:
+        rows = self.db.execute(
+            select(SubscriptionCounter.plan_id, SubscriptionCounter.status, SubscriptionCounter.count)
+            .filter(SubscriptionCounter.count != 0)
+        )
+        return {(plan_id, status): count for plan_id, status, count in rows}
+
+    def get_report_rows(self) -> list[tuple[int, str, str, str, int]]:
+        """Non-zero counters joined with their plan as (plan id, plan name, tier, status, count)."""
+        return (
+            self.db.query(Plan.id, Plan.name, Plan.tier, SubscriptionCounter.status, SubscriptionCounter.count)
+            .join(Plan, Plan.id == SubscriptionCounter.plan_id)
+            .filter(SubscriptionCounter.count != 0)
+            .order_by(Plan.id, SubscriptionCounter.status)
+            .all()
+        )
+
+    def lock(self) -> None:
+        """Block concurrent counter updates until the transaction ends (PostgreSQL only)."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(text("LOCK TABLE subscription_counters IN EXCLUSIVE MODE"))
+
+    def replace_all(self, counts: dict[CounterKey, int]) -> None:
+        self.db.query(SubscriptionCounter).delete()
+        if counts:
+            self.db.add_all(
+                SubscriptionCounter(plan_id=plan_id, status=status, count=count)
+                for (plan_id, status), count in counts.items()
+            )
+        self.db.flush()
+
+
+def counts_of(subscriptions) -> Counter[CounterKey]:
+    return Counter((subscription.plan_id, subscription.status) for subscription in subscriptions)
+
+
+def apply_counter_deltas(connection, deltas: Counter[CounterKey]) -> None:
+    rows = [
+        {"plan_id": plan_id, "status": status, "count": delta}
+        for (plan_id, status), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+
+    insert = UPSERT_DIALECTS.get(connection.dialect.name)
+    if insert is None:
+        _apply_without_upsert(connection, rows)
+        return
+
+    statement = insert(SubscriptionCounter).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[SubscriptionCounter.plan_id, SubscriptionCounter.status],
+        set_={"count": SubscriptionCounter.count + statement.excluded.count},
+    )
+    connection.execute(statement)
+
+
+def _apply_without_upsert(connection, rows: list[dict]) -> None:
+    for row in rows:
+        result = connection.execute(
+            update(SubscriptionCounter)
+            .filter(SubscriptionCounter.plan_id == row["plan_id"])
+            .filter(SubscriptionCounter.status == row["status"])
+            .values(count=SubscriptionCounter.count + row["count"])
+        )
+        if result.rowcount == 0:
+            connection.execute(SubscriptionCounter.__table__.insert().values(row))
+
+
+def _previous_value(subscription: Subscription, attribute: str):
+    history = inspect(subscription).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(subscription, attribute)
+
+
+def collect_counter_deltas(session: Session) -> Counter[CounterKey]:
+    deltas: Counter[CounterKey] = Counter()
+    for subscription in session.new:
+        if isinstance(subscription, Subscription):
+            deltas[(subscription.plan_id, subscription.status)] += 1
+    for subscription in session.deleted:
+        if isinstance(subscription, Subscription):
+            deltas[(_previous_value(subscription, "plan_id"), _previous_value(subscription, "status"))] -= 1
+    for subscription in session.dirty:
+        if isinstance(subscription, Subscription) and session.is_modified(subscription):
+            before = (_previous_value(subscription, "plan_id"), _previous_value(subscription, "status"))
+            after = (subscription.plan_id, subscription.status)
+            if before != after:
+                deltas[before] -= 1
+                deltas[after] += 1
+    return deltas
+
+
+@event.listens_for(AppSession, "after_flush")
+def _maintain_subscription_counters(session: Session, flush_context) -> None:
+    """Keep counters in step with ORM inserts, updates and deletes in the same transaction.
+
+    Statement-level writes (bulk INSERT ... RETURNING, the expiry sweep)
+    bypass the flush and call ``SubscriptionCounterRepository.apply``
+    themselves.
+    """
+    deltas = collect_counter_deltas(session)
+    if +deltas or -deltas:
+        apply_counter_deltas(session.connection(), deltas)
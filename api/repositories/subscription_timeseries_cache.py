@@ -0,0 +1,213 @@
+from datetime import date, datetime, time, timedelta
+from datetime import UTC as datetime_UTC
+
+from sqlalchemy import and_, delete, event, insert, inspect, or_, select, update
+from sqlalchemy.orm import Session
+
+from core.timestamps import as_utc
+from database import AppSession
+from models.plan import Plan
+from models.subscription import Subscription
+from models.subscription_timeseries import SubscriptionTimeseriesCache, SubscriptionTimeseriesCacheGeneration
+from repositories.subscription_counter import UPSERT_DIALECTS
+from schemas.report import TimeseriesGranularity
+
+# (start, end) of the time a subscription counts as active; end None is open-ended.
+ActivitySpan = tuple[datetime, datetime | None]
+
+GENERATION_ID = 1
+
+
+def bucket_floor(day: date, granularity: TimeseriesGranularity) -> date:
+    if granularity == TimeseriesGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == TimeseriesGranularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+class SubscriptionTimeseriesCacheRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_range(self, granularity: str, first: date, last: date) -> dict[date, dict[str, int]]:
+        """Cached counts by bucket start, then tier, for buckets starting in [first, last]."""
+        statement = (
+            select(
+                SubscriptionTimeseriesCache.bucket_start,
+                SubscriptionTimeseriesCache.tier,
+                SubscriptionTimeseriesCache.count,
+            )
+            .filter(SubscriptionTimeseriesCache.granularity == granularity)
+            .filter(SubscriptionTimeseriesCache.bucket_start.between(first, last))
+        )
+        cached: dict[date, dict[str, int]] = {}
+        for bucket_start, tier, count in self.db.execute(statement):
+            cached.setdefault(bucket_start, {})[tier] = count
+        return cached
+
+    def generation(self) -> int:
+        """Invalidation generation; read it before counting and pass it to ``store``."""
+        return read_generation(self.db.connection())
+
+    def store(self, granularity: str, buckets: dict[date, dict[str, int]], generation: int) -> bool:
+        """Persist closed buckets in their own transaction unless an invalidation ran since ``generation``.
+
+        The generation row is locked first, so an invalidation still in
+        flight either commits first (and the buckets are dropped) or waits
+        for them and deletes them. Rows another request stored first are
+        left alone. Returns whether the buckets were written.
+        """
+        rows = [
+            {"granularity": granularity, "bucket_start": bucket_start, "tier": tier, "count": count}
+            for bucket_start, counts in buckets.items()
+            for tier, count in counts.items()
+        ]
+        if not rows:
+            return False
+        with Session(bind=self.db.get_bind()) as writer, writer.begin():
+            if read_generation(writer.connection(), for_update=True) != generation:
+                return False
+            dialect_insert = UPSERT_DIALECTS.get(writer.get_bind().dialect.name)
+            if dialect_insert is None:
+                writer.execute(insert(SubscriptionTimeseriesCache), rows)
+            else:
+                writer.execute(dialect_insert(SubscriptionTimeseriesCache).values(rows).on_conflict_do_nothing())
+        return True
+
+    def invalidate(self, spans: list[ActivitySpan]) -> None:
+        """Drop cached buckets overlapping ``spans`` inside the caller's transaction."""
+        invalidate_buckets(self.db.connection(), spans)
+
+
+def activity_span(start_date: datetime, end_date: datetime | None, cancelled_at: datetime | None) -> ActivitySpan:
+    ends = [as_utc(value) for value in (cancelled_at, end_date) if value is not None]
+    return as_utc(start_date), min(ends) if ends else None
+
+
+def spans_of(subscriptions) -> list[ActivitySpan]:
+    return [
+        activity_span(subscription.start_date, subscription.end_date, subscription.cancelled_at)
+        for subscription in subscriptions
+    ]
+
+
+def changed_span(before: ActivitySpan, after: ActivitySpan) -> ActivitySpan | None:
+    """The part of time where two activity spans of one subscription disagree, if any."""
+    moved = []
+    if before[0] != after[0]:
+        moved += [before[0], after[0]]
+    if before[1] != after[1]:
+        moved += [before[1], after[1]]
+    if not moved:
+        return None
+    bounded = [value for value in moved if value is not None]
+    return min(bounded), None if None in moved else max(bounded)
+
+
+def read_generation(connection, for_update: bool = False) -> int:
+    statement = select(SubscriptionTimeseriesCacheGeneration.generation).filter(
+        SubscriptionTimeseriesCacheGeneration.id == GENERATION_ID
+    )
+    if for_update:
+        statement = statement.with_for_update()
+    return connection.scalar(statement) or 0
+
+
+def bump_generation(connection) -> None:
+    """Advance the generation so reports that counted before this write do not store their buckets."""
+    table = SubscriptionTimeseriesCacheGeneration
+    dialect_insert = UPSERT_DIALECTS.get(connection.dialect.name)
+    if dialect_insert is None:
+        result = connection.execute(
+            update(table).filter(table.id == GENERATION_ID).values(generation=table.generation + 1)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table).values(id=GENERATION_ID, generation=1))
+        return
+    statement = dialect_insert(table).values(id=GENERATION_ID, generation=1)
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[table.id],
+        set_={"generation": table.generation + 1},
+    ))
+
+
+def clear_buckets(connection) -> None:
+    """Delete every cached bucket, e.g. after a plan moved to another tier."""
+    bump_generation(connection)
+    connection.execute(delete(SubscriptionTimeseriesCache))
+
+
+def invalidate_buckets(connection, spans: list[ActivitySpan]) -> None:
+    """Delete cached buckets that overlap any of ``spans``.
+
+    Only buckets that ended before today are cached, so spans starting today
+    or later never issue a statement.
+    """
+    today = datetime.combine(datetime.now(datetime_UTC).date(), time(), tzinfo=datetime_UTC)
+    spans = [span for span in spans if span[0] < today]
+    if not spans:
+        return
+    first = min(start for start, _ in spans).date()
+    ends = [end for _, end in spans]
+    statement = delete(SubscriptionTimeseriesCache).where(or_(*(
+        and_(
+            SubscriptionTimeseriesCache.granularity == granularity.value,
+            SubscriptionTimeseriesCache.bucket_start >= bucket_floor(first, granularity),
+        )
+        for granularity in TimeseriesGranularity
+    )))
+    if None not in ends:
+        statement = statement.where(SubscriptionTimeseriesCache.bucket_start <= max(ends).date())
+    bump_generation(connection)
+    connection.execute(statement)
+
+
+def _previous_span(subscription: Subscription) -> ActivitySpan:
+    attributes = inspect(subscription).attrs
+    values = [
+        attributes[name].history.deleted[0] if attributes[name].history.deleted else getattr(subscription, name)
+        for name in ("start_date", "end_date", "cancelled_at")
+    ]
+    return activity_span(*values)
+
+
+def collect_changed_spans(session: Session) -> list[ActivitySpan]:
+    spans = spans_of(subscription for subscription in session.new if isinstance(subscription, Subscription))
+    for subscription in session.deleted:
+        if isinstance(subscription, Subscription):
+            spans.append(_previous_span(subscription))
+    for subscription in session.dirty:
+        if isinstance(subscription, Subscription) and session.is_modified(subscription):
+            before = _previous_span(subscription)
+            after = activity_span(subscription.start_date, subscription.end_date, subscription.cancelled_at)
+            if inspect(subscription).attrs["plan_id"].history.deleted:
+                # A new plan can mean a new tier for the whole span.
+                spans += [before, after]
+            elif (span := changed_span(before, after)) is not None:
+                spans.append(span)
+    return spans
+
+
+def changes_plan_tier(session: Session) -> bool:
+    return any(
+        isinstance(plan, Plan) and inspect(plan).attrs["tier"].history.deleted
+        for plan in session.dirty
+    )
+
+
+@event.listens_for(AppSession, "after_flush")
+def _invalidate_timeseries_cache(session: Session, flush_context) -> None:
+    """Drop cached buckets that ORM inserts, updates and deletes of subscriptions change.
+
+    A plan moving to another tier can change every bucket, so it clears the
+    whole cache. Statement-level inserts (bulk INSERT ... RETURNING) bypass
+    the flush and call ``SubscriptionTimeseriesCacheRepository.invalidate``
+    themselves.
+    """
+    if changes_plan_tier(session):
+        clear_buckets(session.connection())
+        return
+    spans = collect_changed_spans(session)
+    if spans:
+        invalidate_buckets(session.connection(), spans)
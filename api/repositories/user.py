@@ -1,6 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
 from models.user import User
+from repositories.batch import ids_filter
 from schemas.user import UserCreate, UserUpdate
 
 
@@ -8,14 +11,30 @@ class UserRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, user_id: int) -> User | None:
-        return self.db.query(User).filter(User.id == user_id).first()
+    def get_by_id(self, user_id: int, fields: tuple[str, ...] | None = None) -> User | None:
+        query = self.db.query(User).filter(User.id == user_id)
+        if fields is not None:
+            query = query.options(load_only(*(getattr(User, name) for name in fields)))
+        return query.first()
 
     def get_by_email(self, email: str) -> User | None:
         return self.db.query(User).filter(User.email == email).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        return self.db.query(User).offset(skip).limit(limit).all()
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[User]:
+        query = self.db.query(User).order_by(User.id)
+        if fields is not None:
+            query = query.options(load_only(*(getattr(User, name) for name in fields)))
+        if after_id is not None:
+            query = query.filter(User.id > after_id)
+        else:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
     def create(self, user_data: UserCreate) -> User:
         user = User(**user_data.model_dump())
@@ -24,6 +43,32 @@ class UserRepository:
         self.db.refresh(user)
         return user
 
+    def get_existing_emails(self, emails: list[str]) -> set[str]:
+        return set(self.db.scalars(select(User.email).filter(User.email.in_(emails))))
+
+    def get_by_ids(self, user_ids: list[int]) -> dict[int, User]:
+        statement = select(User).filter(ids_filter(User.id, user_ids, self.db.get_bind().dialect.name))
+        return {user.id: user for user in self.db.scalars(statement)}
+
+    def get_modes_by_ids(self, user_ids: list[int]) -> dict[int, str]:
+        rows = self.db.execute(select(User.id, User.mode).filter(User.id.in_(user_ids)))
+        return {user_id: mode for user_id, mode in rows}
+
+    def create_many(self, users_data: list[UserCreate]) -> list[User]:
+        """Insert all users in one transaction with multi-row INSERT ... RETURNING."""
+        statement = insert(User).returning(User, sort_by_parameter_order=True)
+        try:
+            users = list(self.db.scalars(statement, [user_data.model_dump() for user_data in users_data]))
+        except IntegrityError:
+            self.db.rollback()
+            raise
+        # RETURNING already loaded every column; detach so the commit does
+        # not expire them and trigger a SELECT per user on serialization.
+        for user in users:
+            self.db.expunge(user)
+        self.db.commit()
+        return users
+
     def update(self, user: User, user_data: UserUpdate) -> User:
         update_data = user_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.fast_json import fast_json_response
+from core.fieldsets import fieldset_response, parse_fields
+from core.http_cache import etag_matches, not_modified, plan_etag, set_cache_headers
+from core.pagination import set_next_cursor
+from database import get_async_db
+from schemas.bulk import BatchGetRequest
+from schemas.plan import PlanBatchGetResponse, PlanCreate, PlanUpdate, PlanResponse
+from services.async_plan import AsyncPlanService
+
+router = APIRouter(prefix="/plans", tags=["plans"])
+
+
+@router.get("", response_model=list[PlanResponse])
+async def get_plans(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, PlanResponse)
+    service = AsyncPlanService(db)
+    plans = await service.get_plans(skip=skip, limit=limit, cursor=cursor, fields=selected)
+    set_next_cursor(response, plans, limit)
+    etag = plan_etag(plans, selected)
+    if etag_matches(if_none_match, etag):
+        return not_modified(response, etag)
+    set_cache_headers(response, etag)
+    if selected is not None:
+        return fieldset_response(PlanResponse, selected, plans, response)
+    if settings.fast_json:
+        return fast_json_response(list[PlanResponse], plans, response)
+    return plans
+
+
+@router.get("/active", response_model=list[PlanResponse])
+async def get_active_plans(
+    response: Response,
+    at: datetime | None = None,
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, PlanResponse)
+    service = AsyncPlanService(db)
+    plans = await service.get_active_plans(current_time=at, fields=selected)
+    etag = plan_etag(plans, selected)
+    if etag_matches(if_none_match, etag):
+        return not_modified(response, etag)
+    set_cache_headers(response, etag)
+    if selected is not None:
+        return fieldset_response(PlanResponse, selected, plans, response)
+    if settings.fast_json:
+        return fast_json_response(list[PlanResponse], plans, response)
+    return plans
+
+
+@router.get("/{plan_id}", response_model=PlanResponse)
+async def get_plan(
+    plan_id: int,
+    response: Response,
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, PlanResponse)
+    service = AsyncPlanService(db)
+    plan = await service.get_plan(plan_id, selected)
+    etag = plan_etag([plan], selected)
+    if etag_matches(if_none_match, etag):
+        return not_modified(response, etag)
+    set_cache_headers(response, etag)
+    if selected is not None:
+        return fieldset_response(PlanResponse, selected, plan, response)
+    return plan
+
+
+@router.post("", response_model=PlanResponse, status_code=status.HTTP_201_CREATED)
+async def create_plan(plan_data: PlanCreate, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncPlanService(db)
+    return await service.create_plan(plan_data)
+
+
+@router.post("/batch-get", response_model=PlanBatchGetResponse)
+async def batch_get_plans(request: BatchGetRequest, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncPlanService(db)
+    return await service.batch_get_plans(request.ids)
+
+
+@router.patch("/{plan_id}", response_model=PlanResponse)
+async def update_plan(plan_id: int, plan_data: PlanUpdate, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncPlanService(db)
+    return await service.update_plan(plan_id, plan_data)
+
+
+@router.delete("/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_plan(plan_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncPlanService(db)
+    await service.delete_plan(plan_id)
@@ -0,0 +1,125 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.fast_json import fast_json_response
+from core.fieldsets import fieldset_response, parse_fields
+from core.pagination import set_next_cursor
+from database import get_async_db
+from schemas.bulk import BatchGetRequest
+from schemas.subscription import (
+    SubscriptionBatchGetResponse,
+    SubscriptionCreate,
+    SubscriptionUpdate,
+    SubscriptionResponse,
+    SubscriptionDetailResponse,
+    SubscriptionSideloadedResponse,
+    PlanEmbedding,
+)
+from services.async_subscription import AsyncSubscriptionService
+
+router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
+
+
+@router.get("", response_model=list[SubscriptionDetailResponse] | SubscriptionSideloadedResponse)
+async def get_subscriptions(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    plans: PlanEmbedding = PlanEmbedding.INLINE,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, SubscriptionDetailResponse)
+    service = AsyncSubscriptionService(db)
+    if plans == PlanEmbedding.SIDELOAD:
+        if selected is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields cannot be combined with plans=sideload"
+            )
+        page = await service.get_subscriptions_sideloaded(skip=skip, limit=limit, cursor=cursor)
+        set_next_cursor(response, page.subscriptions, limit)
+        if settings.fast_json:
+            return fast_json_response(SubscriptionSideloadedResponse, page, response)
+        return page
+    subscriptions = await service.get_subscriptions(skip=skip, limit=limit, cursor=cursor, fields=selected)
+    set_next_cursor(response, subscriptions, limit)
+    if selected is not None:
+        return fieldset_response(SubscriptionDetailResponse, selected, subscriptions, response)
+    if settings.fast_json:
+        return fast_json_response(list[SubscriptionDetailResponse], subscriptions, response)
+    return subscriptions
+
+
+@router.get("/{subscription_id}", response_model=SubscriptionDetailResponse)
+async def get_subscription(
+    subscription_id: int,
+    response: Response,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, SubscriptionDetailResponse)
+    service = AsyncSubscriptionService(db)
+    subscription = await service.get_subscription(subscription_id, selected)
+    if selected is not None:
+        return fieldset_response(SubscriptionDetailResponse, selected, subscription, response)
+    return subscription
+
+
+@router.get("/user/{user_id}", response_model=list[SubscriptionResponse])
+async def get_user_subscriptions(
+    user_id: int,
+    response: Response,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, SubscriptionResponse)
+    service = AsyncSubscriptionService(db)
+    subscriptions = await service.get_user_subscriptions(user_id, fields=selected)
+    if selected is not None:
+        return fieldset_response(SubscriptionResponse, selected, subscriptions, response)
+    if settings.fast_json:
+        return fast_json_response(list[SubscriptionResponse], subscriptions, response)
+    return subscriptions
+
+
+@router.get("/user/{user_id}/active", response_model=SubscriptionResponse | None)
+async def get_active_subscription(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncSubscriptionService(db)
+    return await service.get_active_subscription(user_id)
+
+
+@router.post("", response_model=SubscriptionResponse, status_code=status.HTTP_201_CREATED)
+async def create_subscription(subscription_data: SubscriptionCreate, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncSubscriptionService(db)
+    return await service.create_subscription(subscription_data)
+
+
+@router.post("/batch-get", response_model=SubscriptionBatchGetResponse)
+async def batch_get_subscriptions(request: BatchGetRequest, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncSubscriptionService(db)
+    return await service.batch_get_subscriptions(request.ids)
+
+
+@router.patch("/{subscription_id}", response_model=SubscriptionResponse)
+async def update_subscription(
+    subscription_id: int,
+    subscription_data: SubscriptionUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncSubscriptionService(db)
+    return await service.update_subscription(subscription_id, subscription_data)
+
+
+@router.post("/{subscription_id}/cancel", response_model=SubscriptionResponse)
+async def cancel_subscription(subscription_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncSubscriptionService(db)
+    return await service.cancel_subscription(subscription_id)
+
+
+@router.delete("/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_subscription(subscription_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncSubscriptionService(db)
+    await service.delete_subscription(subscription_id)
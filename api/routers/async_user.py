@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.fast_json import fast_json_response
+from core.fieldsets import fieldset_response, parse_fields
+from core.pagination import set_next_cursor
+from database import get_async_db
+from schemas.bulk import BatchGetRequest
+from schemas.user import UserBatchGetResponse, UserCreate, UserUpdate, UserResponse
+from services.async_user import AsyncUserService
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@router.get("", response_model=list[UserResponse])
+async def get_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, UserResponse)
+    service = AsyncUserService(db)
+    users = await service.get_users(skip=skip, limit=limit, cursor=cursor, fields=selected)
+    set_next_cursor(response, users, limit)
+    if selected is not None:
+        return fieldset_response(UserResponse, selected, users, response)
+    if settings.fast_json:
+        return fast_json_response(list[UserResponse], users, response)
+    return users
+
+
+@router.get("/{user_id}", response_model=UserResponse)
+async def get_user(
+    user_id: int,
+    response: Response,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    selected = parse_fields(fields, UserResponse)
+    service = AsyncUserService(db)
+    user = await service.get_user(user_id, selected)
+    if selected is not None:
+        return fieldset_response(UserResponse, selected, user, response)
+    return user
+
+
+@router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncUserService(db)
+    return await service.create_user(user_data)
+
+
+@router.post("/batch-get", response_model=UserBatchGetResponse)
+async def batch_get_users(request: BatchGetRequest, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncUserService(db)
+    return await service.batch_get_users(request.ids)
+
+
+@router.patch("/{user_id}", response_model=UserResponse)
+async def update_user(user_id: int, user_data: UserUpdate, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncUserService(db)
+    return await service.update_user(user_id, user_data)
+
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncUserService(db)
+    await service.delete_user(user_id)
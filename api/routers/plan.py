@@ -1,29 +1,86 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Response, status
 from sqlalchemy.orm import Session
 
+from core.config import settings
+from core.fast_json import fast_json_response
+from core.fieldsets import fieldset_response, parse_fields
+from core.http_cache import etag_matches, not_modified, plan_etag, set_cache_headers
+from core.pagination import set_next_cursor
 from database import get_db
-from schemas.plan import PlanCreate, PlanUpdate, PlanResponse
+from schemas.bulk import BatchGetRequest
+from schemas.plan import PlanBatchGetResponse, PlanCreate, PlanUpdate, PlanResponse
 from services.plan import PlanService
 
 router = APIRouter(prefix="/plans", tags=["plans"])
 
 
 @router.get("", response_model=list[PlanResponse])
-def get_plans(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_plans(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, PlanResponse)
     service = PlanService(db)
-    return service.get_plans(skip=skip, limit=limit)
+    plans = service.get_plans(skip=skip, limit=limit, cursor=cursor, fields=selected)
+    set_next_cursor(response, plans, limit)
+    etag = plan_etag(plans, selected)
+    if etag_matches(if_none_match, etag):
+        return not_modified(response, etag)
+    set_cache_headers(response, etag)
+    if selected is not None:
+        return fieldset_response(PlanResponse, selected, plans, response)
+    if settings.fast_json:
+        return fast_json_response(list[PlanResponse], plans, response)
+    return plans
 
 
 @router.get("/active", response_model=list[PlanResponse])
-def get_active_plans(db: Session = Depends(get_db)):
+def get_active_plans(
+    response: Response,
+    at: datetime | None = None,
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, PlanResponse)
     service = PlanService(db)
-    return service.get_active_plans()
+    plans = service.get_active_plans(current_time=at, fields=selected)
+    etag = plan_etag(plans, selected)
+    if etag_matches(if_none_match, etag):
+        return not_modified(response, etag)
+    set_cache_headers(response, etag)
+    if selected is not None:
+        return fieldset_response(PlanResponse, selected, plans, response)
+    if settings.fast_json:
+        return fast_json_response(list[PlanResponse], plans, response)
+    return plans
 
 
 @router.get("/{plan_id}", response_model=PlanResponse)
-def get_plan(plan_id: int, db: Session = Depends(get_db)):
+def get_plan(
+    plan_id: int,
+    response: Response,
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, PlanResponse)
     service = PlanService(db)
-    return service.get_plan(plan_id)
+    plan = service.get_plan(plan_id, selected)
+    etag = plan_etag([plan], selected)
+    if etag_matches(if_none_match, etag):
+        return not_modified(response, etag)
+    set_cache_headers(response, etag)
+    if selected is not None:
+        return fieldset_response(PlanResponse, selected, plan, response)
+    return plan
 
 
 @router.post("", response_model=PlanResponse, status_code=status.HTTP_201_CREATED)
@@ -32,6 +89,12 @@ def create_plan(plan_data: PlanCreate, db: Session = Depends(get_db)):
     return service.create_plan(plan_data)
 
 
+@router.post("/batch-get", response_model=PlanBatchGetResponse)
+def batch_get_plans(request: BatchGetRequest, db: Session = Depends(get_db)):
+    service = PlanService(db)
+    return service.batch_get_plans(request.ids)
+
+
 @router.patch("/{plan_id}", response_model=PlanResponse)
 def update_plan(plan_id: int, plan_data: PlanUpdate, db: Session = Depends(get_db)):
     service = PlanService(db)
@@ -1,14 +1,31 @@
+from datetime import date
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from database import get_db
-from schemas.report import SubscriptionReportResponse
+from schemas.report import (
+    SubscriptionReportResponse,
+    SubscriptionTimeseriesResponse,
+    TimeseriesGranularity,
+)
 from services.report import ReportService
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
 @router.get("/subscriptions", response_model=SubscriptionReportResponse)
-def get_subscription_report(db: Session = Depends(get_db)):
+def get_subscription_report(fresh: bool = False, db: Session = Depends(get_db)):
+    service = ReportService(db)
+    return service.get_subscription_report(fresh=fresh)
+
+
+@router.get("/subscriptions/timeseries", response_model=SubscriptionTimeseriesResponse)
+def get_subscription_timeseries(
+    start: date,
+    end: date,
+    granularity: TimeseriesGranularity = TimeseriesGranularity.DAY,
+    db: Session = Depends(get_db),
+):
     service = ReportService(db)
-    return service.get_subscription_report()
+    return service.get_subscription_timeseries(start=start, end=end, granularity=granularity)
@@ -1,34 +1,107 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from core.config import settings
+from core.fast_json import fast_json_response
+from core.fieldsets import fieldset_response, parse_fields
+from core.pagination import set_next_cursor
 from database import get_db
+from schemas.bulk import BatchGetRequest
 from schemas.subscription import (
+    SubscriptionBatchGetResponse,
+    ExportFormat,
+    SubscriptionBulkCreate,
+    SubscriptionBulkResponse,
     SubscriptionCreate,
     SubscriptionUpdate,
     SubscriptionResponse,
     SubscriptionDetailResponse,
+    SubscriptionSideloadedResponse,
+    PlanEmbedding,
 )
 from services.subscription import SubscriptionService
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
 
-@router.get("", response_model=list[SubscriptionDetailResponse])
-def get_subscriptions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+
+@router.get("", response_model=list[SubscriptionDetailResponse] | SubscriptionSideloadedResponse)
+def get_subscriptions(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    plans: PlanEmbedding = PlanEmbedding.INLINE,
+    fields: str | None = None,
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, SubscriptionDetailResponse)
+    service = SubscriptionService(db)
+    if plans == PlanEmbedding.SIDELOAD:
+        if selected is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields cannot be combined with plans=sideload"
+            )
+        page = service.get_subscriptions_sideloaded(skip=skip, limit=limit, cursor=cursor)
+        set_next_cursor(response, page.subscriptions, limit)
+        if settings.fast_json:
+            return fast_json_response(SubscriptionSideloadedResponse, page, response)
+        return page
+    subscriptions = service.get_subscriptions(skip=skip, limit=limit, cursor=cursor, fields=selected)
+    set_next_cursor(response, subscriptions, limit)
+    if selected is not None:
+        return fieldset_response(SubscriptionDetailResponse, selected, subscriptions, response)
+    if settings.fast_json:
+        return fast_json_response(list[SubscriptionDetailResponse], subscriptions, response)
+    return subscriptions
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_subscriptions(format: ExportFormat = ExportFormat.NDJSON, db: Session = Depends(get_db)):
     service = SubscriptionService(db)
-    return service.get_subscriptions(skip=skip, limit=limit)
+    return StreamingResponse(
+        service.export_subscriptions(format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="subscriptions.{format.value}"'},
+    )
 
 
 @router.get("/{subscription_id}", response_model=SubscriptionDetailResponse)
-def get_subscription(subscription_id: int, db: Session = Depends(get_db)):
+def get_subscription(
+    subscription_id: int,
+    response: Response,
+    fields: str | None = None,
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, SubscriptionDetailResponse)
     service = SubscriptionService(db)
-    return service.get_subscription(subscription_id)
+    subscription = service.get_subscription(subscription_id, selected)
+    if selected is not None:
+        return fieldset_response(SubscriptionDetailResponse, selected, subscription, response)
+    return subscription
 
 
 @router.get("/user/{user_id}", response_model=list[SubscriptionResponse])
-def get_user_subscriptions(user_id: int, db: Session = Depends(get_db)):
+def get_user_subscriptions(
+    user_id: int,
+    response: Response,
+    fields: str | None = None,
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, SubscriptionResponse)
     service = SubscriptionService(db)
-    return service.get_user_subscriptions(user_id)
+    subscriptions = service.get_user_subscriptions(user_id, fields=selected)
+    if selected is not None:
+        return fieldset_response(SubscriptionResponse, selected, subscriptions, response)
+    if settings.fast_json:
+        return fast_json_response(list[SubscriptionResponse], subscriptions, response)
+    return subscriptions
 
 
 @router.get("/user/{user_id}/active", response_model=SubscriptionResponse | None)
@@ -43,6 +116,18 @@ def create_subscription(subscription_data: SubscriptionCreate, db: Session = Dep
     return service.create_subscription(subscription_data)
 
 
+@router.post("/bulk", response_model=SubscriptionBulkResponse)
+def create_subscriptions(bulk_data: SubscriptionBulkCreate, db: Session = Depends(get_db)):
+    service = SubscriptionService(db)
+    return service.create_subscriptions(bulk_data.subscriptions)
+
+
+@router.post("/batch-get", response_model=SubscriptionBatchGetResponse)
+def batch_get_subscriptions(request: BatchGetRequest, db: Session = Depends(get_db)):
+    service = SubscriptionService(db)
+    return service.batch_get_subscriptions(request.ids)
+
+
 @router.patch("/{subscription_id}", response_model=SubscriptionResponse)
 def update_subscription(
     subscription_id: int,
@@ -1,23 +1,51 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 
+from core.config import settings
+from core.fast_json import fast_json_response
+from core.fieldsets import fieldset_response, parse_fields
+from core.pagination import set_next_cursor
 from database import get_db
-from schemas.user import UserCreate, UserUpdate, UserResponse
+from schemas.bulk import BatchGetRequest
+from schemas.user import UserBatchGetResponse, UserBulkCreate, UserBulkResponse, UserCreate, UserUpdate, UserResponse
 from services.user import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("", response_model=list[UserResponse])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, UserResponse)
     service = UserService(db)
-    return service.get_users(skip=skip, limit=limit)
+    users = service.get_users(skip=skip, limit=limit, cursor=cursor, fields=selected)
+    set_next_cursor(response, users, limit)
+    if selected is not None:
+        return fieldset_response(UserResponse, selected, users, response)
+    if settings.fast_json:
+        return fast_json_response(list[UserResponse], users, response)
+    return users
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(
+    user_id: int,
+    response: Response,
+    fields: str | None = None,
+    db: Session = Depends(get_db),
+):
+    selected = parse_fields(fields, UserResponse)
     service = UserService(db)
-    return service.get_user(user_id)
+    user = service.get_user(user_id, selected)
+    if selected is not None:
+        return fieldset_response(UserResponse, selected, user, response)
+    return user
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -26,6 +54,18 @@ def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
     return service.create_user(user_data)
 
 
+@router.post("/bulk", response_model=UserBulkResponse)
+def create_users(bulk_data: UserBulkCreate, db: Session = Depends(get_db)):
+    service = UserService(db)
+    return service.create_users(bulk_data.users)
+
+
+@router.post("/batch-get", response_model=UserBatchGetResponse)
+def batch_get_users(request: BatchGetRequest, db: Session = Depends(get_db)):
+    service = UserService(db)
+    return service.batch_get_users(request.ids)
+
+
 @router.patch("/{user_id}", response_model=UserResponse)
 def update_user(user_id: int, user_data: UserUpdate, db: Session = Depends(get_db)):
     service = UserService(db)
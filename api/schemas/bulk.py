@@ -0,0 +1,15 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+BULK_MAX_ITEMS = 10000
+BATCH_GET_MAX_IDS = 1000
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    REJECTED = "rejected"
+
+
+class BatchGetRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_GET_MAX_IDS)
@@ -37,3 +37,13 @@ class PlanResponse(PlanBase):
 
     class Config:
         from_attributes = True
+
+
+class PlanBatchGetResult(BaseModel):
+    id: int
+    found: bool
+    plan: PlanResponse | None = None
+
+
+class PlanBatchGetResponse(BaseModel):
+    results: list[PlanBatchGetResult]
@@ -1,6 +1,15 @@
+from datetime import date
+from enum import Enum
+
 from pydantic import BaseModel
 
 
+class TimeseriesGranularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 class SubscriptionsByStatusReport(BaseModel):
     status: str
     count: int
@@ -16,3 +25,15 @@ class SubscriptionReportResponse(BaseModel):
     total_subscriptions: int
     by_status: list[SubscriptionsByStatusReport]
     by_plan: list[SubscriptionsByPlanReport]
+
+
+class SubscriptionTimeseriesBucket(BaseModel):
+    bucket_start: date
+    counts: dict[str, int]
+
+
+class SubscriptionTimeseriesResponse(BaseModel):
+    granularity: TimeseriesGranularity
+    start: date
+    end: date
+    buckets: list[SubscriptionTimeseriesBucket]
@@ -1,12 +1,24 @@
 from datetime import datetime
+from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from models.subscription import SubscriptionStatus
+from schemas.bulk import BULK_MAX_ITEMS, BulkItemStatus
 from schemas.user import UserResponse
 from schemas.plan import PlanResponse
 
 
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class PlanEmbedding(str, Enum):
+    INLINE = "inline"
+    SIDELOAD = "sideload"
+
+
 class SubscriptionBase(BaseModel):
     user_id: int
     plan_id: int
@@ -35,6 +47,43 @@ class SubscriptionResponse(SubscriptionBase):
         from_attributes = True
 
 
-class SubscriptionDetailResponse(SubscriptionResponse):
+class SubscriptionWithUserResponse(SubscriptionResponse):
     user: UserResponse
+
+
+class SubscriptionDetailResponse(SubscriptionWithUserResponse):
     plan: PlanResponse
+
+
+class SubscriptionSideloadedResponse(BaseModel):
+    """A page of subscriptions whose plans are listed once, keyed by ``plan_id``."""
+
+    subscriptions: list[SubscriptionWithUserResponse]
+    plans: dict[int, PlanResponse]
+
+
+class SubscriptionBulkCreate(BaseModel):
+    subscriptions: list[SubscriptionCreate] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class SubscriptionBulkResult(BaseModel):
+    index: int
+    status: BulkItemStatus
+    subscription: SubscriptionResponse | None = None
+    detail: str | None = None
+
+
+class SubscriptionBulkResponse(BaseModel):
+    created: int
+    rejected: int
+    results: list[SubscriptionBulkResult]
+
+
+class SubscriptionBatchGetResult(BaseModel):
+    id: int
+    found: bool
+    subscription: SubscriptionDetailResponse | None = None
+
+
+class SubscriptionBatchGetResponse(BaseModel):
+    results: list[SubscriptionBatchGetResult]
@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 from models.user import UserMode
+from schemas.bulk import BULK_MAX_ITEMS, BulkItemStatus
 
 
 class UserBase(BaseModel):
@@ -28,3 +29,30 @@ class UserResponse(UserBase):
 
     class Config:
         from_attributes = True
+
+
+class UserBulkCreate(BaseModel):
+    users: list[UserCreate] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class UserBulkResult(BaseModel):
+    index: int
+    status: BulkItemStatus
+    user: UserResponse | None = None
+    detail: str | None = None
+
+
+class UserBulkResponse(BaseModel):
+    created: int
+    rejected: int
+    results: list[UserBulkResult]
+
+
+class UserBatchGetResult(BaseModel):
+    id: int
+    found: bool
+    user: UserResponse | None = None
+
+
+class UserBatchGetResponse(BaseModel):
+    results: list[UserBatchGetResult]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Compare requests/sec of the sync and async database stacks.
+
+Starts the API twice under uvicorn against the same (already seeded)
+database, once with ASYNC_DB=false and once with ASYNC_DB=true, drives the
+same read mix at a fixed concurrency and prints the results as JSON.
+
+Usage:
+    python scripts/benchmark_async.py [--database-url URL] [--concurrency N] [--duration SECONDS]
+
+Options:
+    --database-url URL   Database to benchmark against (default: $DATABASE_URL)
+    --concurrency N      Concurrent in-flight requests (default: 32)
+    --duration SECONDS   Measurement time per mode (default: 20)
+    --port PORT          Port for the uvicorn server (default: 8100)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+
+import httpx
+
+from loadgen import Request, run_load, running_api
+
+
+def read_mix(user_ids: list[int]):
+    def next_request(rng):
+        roll = rng.random()
+        if roll < 0.4:
+            return Request("GET", "/plans/active")
+        if roll < 0.7:
+            return Request("GET", f"/subscriptions/user/{rng.choice(user_ids)}/active")
+        if roll < 0.9:
+            return Request("GET", f"/users/{rng.choice(user_ids)}")
+        return Request("GET", "/subscriptions?limit=20")
+    return next_request
+
+
+def benchmark_mode(async_db: bool, args) -> dict:
+    env = {"ASYNC_DB": str(async_db).lower(), "DATABASE_URL": args.database_url}
+    with running_api(args.port, env) as base_url:
+        user_ids = [user["id"] for user in httpx.get(f"{base_url}/users?limit=1000").json()] or [1]
+        next_request = read_mix(user_ids)
+        asyncio.run(run_load(base_url, next_request, args.concurrency, duration=2.0))
+        result = asyncio.run(run_load(base_url, next_request, args.concurrency, args.duration))
+
+    return {
+        "mode": "async" if async_db else "sync",
+        "requests": result.requests,
+        "errors": result.errors,
+        "requests_per_second": round(result.requests_per_second, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sync and async database stacks")
+    parser.add_argument("--database-url", type=str, default=os.environ.get("DATABASE_URL"), help="Database URL (default: $DATABASE_URL)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent in-flight requests (default: 32)")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measurement time per mode in seconds (default: 20)")
+    parser.add_argument("--port", type=int, default=8100, help="Port for the uvicorn server (default: 8100)")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    results = [benchmark_mode(False, args), benchmark_mode(True, args)]
+    sync_rps, async_rps = (r["requests_per_second"] for r in results)
+    print(json.dumps({
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "results": results,
+        "async_speedup": round(async_rps / sync_rps, 2) if sync_rps else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
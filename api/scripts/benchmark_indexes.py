@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Record EXPLAIN ANALYZE timings for the hot subscription queries with and without
+the lookup indexes from migration c5e8d1f0a3b7.
+
+Seeds a large dataset, then measures each query twice: once with only the
+original single-column user_id index ("before") and once with the
+(user_id, status), partial active end_date and (status, plan_id) indexes
+("after"). Everything, including the seed rows and index changes, happens in
+one transaction that is rolled back. The index changes take an exclusive
+lock on subscriptions, so run this against a scratch database. PostgreSQL only.
+
+Usage:
+    python scripts/benchmark_indexes.py [--database-url URL] [--users N] [--per-user N] [--output FILE]
+
+Options:
+    --database-url URL   Database to benchmark against (default: $DATABASE_URL)
+    --users N            Users to seed (default: 250000)
+    --per-user N         Subscriptions per seeded user, at most one active (default: 8)
+    --repeat N           EXPLAIN ANALYZE runs per query, best time is kept (default: 3)
+    --output FILE        Also write the JSON results to FILE
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+from pathlib import Path
+
+from sqlalchemy import Index, create_engine, select, text
+from sqlalchemy.orm import joinedload
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.subscription import Subscription, SubscriptionStatus  # noqa: E402
+from repositories.subscription import count_by_plan_and_status_statement, count_summary_statement  # noqa: E402
+
+NEW_INDEXES = [
+    index for index in Subscription.__table__.indexes
+    if index.name in {
+        "ix_subscriptions_user_id_status",
+        "ix_subscriptions_end_date_active",
+        "ix_subscriptions_status_plan_id",
+    }
+]
+OLD_INDEXES = [Index("ix_subscriptions_user_id", Subscription.__table__.c.user_id)]
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, name, mode, created_at, updated_at)
+    SELECT 'index-benchmark-' || n || '@example.invalid', 'Index Benchmark ' || n, 'live', now(), now()
+    FROM generate_series(1, :users) AS n
+    """,
+    """
+    INSERT INTO subscriptions (user_id, plan_id, status, start_date, end_date, created_at, updated_at)
+    SELECT
+        users.id,
+        plan_ids.ids[1 + (users.id + k) % array_length(plan_ids.ids, 1)],
+        CASE
+            WHEN k = 0 AND users.id % 3 <> 0 THEN 'active'
+            WHEN k % 2 = 0 THEN 'cancelled'
+            ELSE 'expired'
+        END,
+        now() - make_interval(days => 30 * (k + 1)),
+        now() + make_interval(days => (users.id % 60) - 5 - 30 * k),
+        now(),
+        now()
+    FROM users
+    CROSS JOIN generate_series(0, :per_user - 1) AS k
+    CROSS JOIN (SELECT array_agg(id) AS ids FROM plans) AS plan_ids
+    WHERE users.email LIKE 'index-benchmark-%'
+    """,
+]
+
+
+def benchmark_queries(user_id: int) -> dict:
+    now = datetime.now(datetime_UTC)
+    return {
+        "get_active_by_user_id": (
+            select(Subscription)
+            .options(joinedload(Subscription.plan))
+            .filter(Subscription.user_id == user_id)
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE.value)
+            .limit(1)
+        ),
+        "get_by_user_id": (
+            select(Subscription)
+            .options(joinedload(Subscription.plan))
+            .filter(Subscription.user_id == user_id)
+        ),
+        "expire_overdue_candidates": (
+            select(Subscription.id)
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE.value)
+            .filter(Subscription.end_date < now)
+            .order_by(Subscription.id)
+            .limit(1000)
+        ),
+        "count_summary": count_summary_statement(),
+        "count_by_plan_and_status": count_by_plan_and_status_statement(),
+    }
+
+
+def scan_nodes(node: dict) -> list[str]:
+    nodes = []
+    if "Scan" in node["Node Type"] and node.get("Relation Name") == "subscriptions":
+        index = node.get("Index Name")
+        nodes.append(f"{node['Node Type']} using {index}" if index else node["Node Type"])
+    for child in node.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def explain(connection, statement, repeat: int) -> dict:
+    sql = str(statement.compile(connection, compile_kwargs={"literal_binds": True}))
+    best = None
+    for _ in range(repeat):
+        plan = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()[0]
+        if best is None or plan["Execution Time"] < best["Execution Time"]:
+            best = plan
+    return {
+        "execution_ms": round(best["Execution Time"], 3),
+        "scans": scan_nodes(best["Plan"]),
+    }
+
+
+def measure(connection, queries: dict, repeat: int) -> dict:
+    connection.execute(text("ANALYZE subscriptions"))
+    return {name: explain(connection, statement, repeat) for name, statement in queries.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark subscription lookup indexes")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"), help="Database URL (default: $DATABASE_URL)")
+    parser.add_argument("--users", type=int, default=250_000, help="Users to seed (default: 250000)")
+    parser.add_argument("--per-user", type=int, default=8, help="Subscriptions per seeded user (default: 8)")
+    parser.add_argument("--repeat", type=int, default=3, help="EXPLAIN ANALYZE runs per query (default: 3)")
+    parser.add_argument("--output", type=str, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name != "postgresql":
+        parser.error("index benchmark requires PostgreSQL")
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            print(f"Seeding {args.users} users x {args.per_user} subscriptions (rolled back afterwards)...", file=sys.stderr)
+            for statement in SEED_SQL:
+                connection.execute(text(statement), {"users": args.users, "per_user": args.per_user})
+            user_id = connection.execute(
+                text("SELECT max(id) FROM users WHERE email LIKE 'index-benchmark-%'")
+            ).scalar()
+            queries = benchmark_queries(user_id)
+            rows = connection.execute(text("SELECT count(*) FROM subscriptions")).scalar()
+
+            for index in NEW_INDEXES:
+                connection.execute(DropIndex(index, if_exists=True))
+            for index in OLD_INDEXES:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+            before = measure(connection, queries, args.repeat)
+
+            for index in NEW_INDEXES:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+            for index in OLD_INDEXES:
+                connection.execute(DropIndex(index, if_exists=True))
+            after = measure(connection, queries, args.repeat)
+        finally:
+            transaction.rollback()
+
+    results = {
+        "subscriptions": rows,
+        "queries": {
+            name: {
+                "before": before[name],
+                "after": after[name],
+                "speedup": round(before[name]["execution_ms"] / after[name]["execution_ms"], 1)
+                if after[name]["execution_ms"] else None,
+            }
+            for name in queries
+        },
+    }
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Compare the three-query subscription report with the single GROUPING SETS query.
+
+Runs EXPLAIN (ANALYZE, BUFFERS) for the old count_total / count_by_status /
+count_by_plan queries and for SubscriptionRepository.count_summary's
+statement, and prints how many times each plan scans the subscriptions
+table, the buffers it touched and the execution time. PostgreSQL only.
+
+With --seed-rows the benchmark first bulk-inserts that many subscriptions
+inside its own transaction and rolls everything back afterwards, so it can
+run against a scratch copy of any database.
+
+Usage:
+    python scripts/benchmark_report_query.py [--database-url URL] [--seed-rows N] [--repeat N]
+
+Options:
+    --database-url URL   Database to benchmark against (default: $DATABASE_URL)
+    --seed-rows N        Insert N extra subscriptions before measuring (default: 0)
+    --repeat N           EXPLAIN ANALYZE runs per query, best time is kept (default: 3)
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select, text
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.plan import Plan  # noqa: E402
+from models.subscription import Subscription  # noqa: E402
+from repositories.subscription import count_summary_statement  # noqa: E402
+
+LEGACY_QUERIES = {
+    "count_total": select(func.count(Subscription.id)),
+    "count_by_status": select(Subscription.status, func.count(Subscription.id)).group_by(Subscription.status),
+    "count_by_plan": (
+        select(Plan.name, Plan.tier, func.count(Subscription.id))
+        .join(Subscription, Subscription.plan_id == Plan.id)
+        .group_by(Plan.id, Plan.name, Plan.tier)
+    ),
+}
+
+SEED_SQL = """
+WITH bench_user AS (
+    INSERT INTO users (email, name, mode, created_at, updated_at)
+    VALUES ('report-benchmark@example.invalid', 'Report Benchmark', 'live', now(), now())
+    RETURNING id
+), plan_ids AS (
+    SELECT array_agg(id) AS ids FROM plans
+)
+INSERT INTO subscriptions (user_id, plan_id, status, start_date, end_date, created_at, updated_at)
+SELECT
+    bench_user.id,
+    plan_ids.ids[1 + n % array_length(plan_ids.ids, 1)],
+    CASE WHEN n % 2 = 0 THEN 'cancelled' ELSE 'expired' END,
+    now() - make_interval(days => n % 720),
+    now() - make_interval(days => n % 360),
+    now(),
+    now()
+FROM bench_user, plan_ids, generate_series(1, :rows) AS n
+"""
+
+
+def count_scans(node: dict, relation: str) -> int:
+    scans = 1 if node.get("Relation Name") == relation else 0
+    return scans + sum(count_scans(child, relation) for child in node.get("Plans", []))
+
+
+def explain(connection, statement, repeat: int) -> dict:
+    sql = str(statement.compile(connection, compile_kwargs={"literal_binds": True}))
+    best = None
+    for _ in range(repeat):
+        plan = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()[0]
+        if best is None or plan["Execution Time"] < best["Execution Time"]:
+            best = plan
+    root = best["Plan"]
+    return {
+        "subscription_scans": count_scans(root, "subscriptions"),
+        "shared_buffers": root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0),
+        "execution_ms": round(best["Execution Time"], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the subscription report queries")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"), help="Database URL (default: $DATABASE_URL)")
+    parser.add_argument("--seed-rows", type=int, default=0, help="Extra subscriptions to insert before measuring (default: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="EXPLAIN ANALYZE runs per query (default: 3)")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name != "postgresql":
+        parser.error("GROUPING SETS benchmark requires PostgreSQL")
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            if args.seed_rows:
+                print(f"Seeding {args.seed_rows} subscriptions (rolled back afterwards)...", file=sys.stderr)
+                connection.execute(text(SEED_SQL), {"rows": args.seed_rows})
+                connection.execute(text("ANALYZE subscriptions"))
+
+            rows = connection.execute(select(func.count(Subscription.id))).scalar()
+            legacy = {name: explain(connection, statement, args.repeat) for name, statement in LEGACY_QUERIES.items()}
+            single = explain(connection, count_summary_statement(), args.repeat)
+        finally:
+            transaction.rollback()
+
+    summary = {
+        "subscriptions": rows,
+        "three_queries": {
+            "queries": legacy,
+            "subscription_scans": sum(result["subscription_scans"] for result in legacy.values()),
+            "shared_buffers": sum(result["shared_buffers"] for result in legacy.values()),
+            "execution_ms": round(sum(result["execution_ms"] for result in legacy.values()), 2),
+        },
+        "grouping_sets": single,
+    }
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark the subscription list read paths: ORM hydration versus row projection.
+
+Seeds subscriptions (with their users and plans) and, for each page size,
+reads and encodes one page of GET /subscriptions both ways:
+
+    orm         SubscriptionRepository.get_all, validated from attributes, then dump_json
+    projection  SubscriptionRepository.get_all_details (Core rows mapped to
+                response schemas), then dump_json
+
+Each path runs in a fresh session, so the ORM path pays for its identity map.
+CPU time (time.process_time) is the best of --repeat runs; memory is the
+tracemalloc peak of one run. Both paths must produce identical bytes,
+otherwise the script fails.
+
+Usage:
+    python scripts/benchmark_row_reads.py [--database-url URL] [--rows N] [--page-sizes N,N] [--repeat N]
+
+Options:
+    --database-url URL  Database to seed; it must be empty (default: in-memory SQLite)
+    --rows N            Subscriptions to seed (default: 10000)
+    --page-sizes N,N    Page sizes to measure (default: 100,10000)
+    --repeat N          Timed runs per path and page size (default: 5)
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from datetime import UTC as datetime_UTC
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from database import Base  # noqa: E402
+from models import Plan, Subscription, User  # noqa: E402
+from repositories.subscription import SubscriptionRepository  # noqa: E402
+from schemas.subscription import SubscriptionDetailResponse  # noqa: E402
+
+ADAPTER = TypeAdapter(list[SubscriptionDetailResponse])
+
+
+def seed(session, rows: int) -> None:
+    now = datetime.now(datetime_UTC)
+    session.execute(insert(Plan), [
+        {
+            "id": index + 1,
+            "name": f"Plan {index}",
+            "tier": ("free", "basic", "pro")[index % 3],
+            "description": "Benchmark plan",
+            "price": Decimal("9.99"),
+            "billing_period": "monthly",
+            "active_from": now - timedelta(days=30),
+            "active_to": None,
+            "simulation": False,
+        }
+        for index in range(15)
+    ])
+    session.execute(insert(User), [
+        {"id": index + 1, "email": f"user{index}@example.com", "name": f"User {index}", "mode": "live"}
+        for index in range(rows)
+    ])
+    session.execute(insert(Subscription), [
+        {
+            "id": index + 1,
+            "user_id": index + 1,
+            "plan_id": index % 15 + 1,
+            "status": "active",
+            "start_date": now - timedelta(days=index % 30),
+            "end_date": now + timedelta(days=30),
+        }
+        for index in range(rows)
+    ])
+    session.commit()
+
+
+def orm_page(session, limit: int) -> bytes:
+    subscriptions = SubscriptionRepository(session).get_all(limit=limit)
+    return ADAPTER.dump_json(ADAPTER.validate_python(subscriptions, from_attributes=True))
+
+
+def projection_page(session, limit: int) -> bytes:
+    return ADAPTER.dump_json(SubscriptionRepository(session).get_all_details(limit=limit))
+
+
+def measure(session_factory, read_page, limit: int, repeat: int) -> tuple[bytes, float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        with session_factory() as session:
+            started = time.process_time()
+            body = read_page(session, limit)
+            best = min(best, time.process_time() - started)
+
+    with session_factory() as session:
+        tracemalloc.start()
+        read_page(session, limit)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return body, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ORM versus row projection reads")
+    parser.add_argument("--database-url", default="sqlite://", help="Empty database to seed (default: in-memory SQLite)")
+    parser.add_argument("--rows", type=int, default=10000, help="Subscriptions to seed (default: 10000)")
+    parser.add_argument("--page-sizes", default="100,10000", help="Page sizes to measure (default: 100,10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path and page size (default: 5)")
+    args = parser.parse_args()
+
+    if args.database_url.startswith("sqlite"):
+        engine = create_engine(args.database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        seed(session, args.rows)
+
+    results = {}
+    for limit in (int(size) for size in args.page_sizes.split(",")):
+        orm_body, orm_cpu, orm_peak = measure(session_factory, orm_page, limit, args.repeat)
+        projection_body, projection_cpu, projection_peak = measure(
+            session_factory, projection_page, limit, args.repeat
+        )
+        if orm_body != projection_body:
+            raise SystemExit(f"page size {limit}: read paths produced different bytes")
+
+        rows = min(limit, args.rows)
+        results[limit] = {
+            "rows": rows,
+            "bytes": len(orm_body),
+            "orm": {
+                "row_us": round(orm_cpu * 1e6 / rows, 2),
+                "peak_bytes_per_row": orm_peak // rows,
+            },
+            "projection": {
+                "row_us": round(projection_cpu * 1e6 / rows, 2),
+                "peak_bytes_per_row": projection_peak // rows,
+            },
+            "cpu_speedup": round(orm_cpu / projection_cpu, 2),
+            "memory_ratio": round(orm_peak / projection_peak, 2),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark JSON encoding of list responses, per response schema.
+
+Builds in-memory ORM objects (no database needed) and times, for each of
+UserResponse, PlanResponse and SubscriptionDetailResponse:
+
+    stdlib     validate, dump to Python, then json.dumps (FastAPI's classic path)
+    dump_json  validate and dump_json in one pass (FastAPI's newer path)
+    orjson     validate with the trusted schema, dump to Python, then orjson.dumps
+    fast_json  validate with the trusted schema and dump_json (core.fast_json, FAST_JSON=true)
+
+The trusted schema is the response schema with EmailStr fields read as plain
+strings, since stored emails were validated on input.
+
+Every strategy must produce identical bytes, otherwise the script fails.
+
+Usage:
+    python scripts/benchmark_serialization.py [--rows N] [--repeat N]
+
+Options:
+    --rows N     Rows per page (default: 100)
+    --repeat N   Timed encodings per strategy, best is kept (default: 200)
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta
+from datetime import UTC as datetime_UTC
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from core.fast_json import dumps, response_adapter  # noqa: E402
+from models import Plan, Subscription, User  # noqa: E402
+from schemas.plan import PlanResponse  # noqa: E402
+from schemas.subscription import SubscriptionDetailResponse  # noqa: E402
+from schemas.user import UserResponse  # noqa: E402
+
+
+def build_rows(count: int) -> dict[str, list]:
+    now = datetime.now(datetime_UTC)
+    plans = [
+        Plan(
+            id=index + 1,
+            name=f"Plan {index}",
+            tier=("free", "basic", "pro")[index % 3],
+            description="Benchmark plan",
+            price=Decimal("9.99"),
+            billing_period="monthly",
+            active_from=now - timedelta(days=30),
+            active_to=None,
+            simulation=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(15)
+    ]
+    users = [
+        User(id=index + 1, email=f"user{index}@example.com", name=f"User {index}", mode="live", created_at=now, updated_at=now)
+        for index in range(count)
+    ]
+    subscriptions = [
+        Subscription(
+            id=index + 1,
+            user_id=user.id,
+            plan_id=plans[index % len(plans)].id,
+            status="active",
+            start_date=now - timedelta(days=index % 30),
+            end_date=now + timedelta(days=30),
+            cancelled_at=None,
+            created_at=now,
+            updated_at=now,
+            user=user,
+            plan=plans[index % len(plans)],
+        )
+        for index, user in enumerate(users)
+    ]
+    return {
+        "UserResponse": (list[UserResponse], users),
+        "PlanResponse": (list[PlanResponse], plans * max(1, count // len(plans))),
+        "SubscriptionDetailResponse": (list[SubscriptionDetailResponse], subscriptions),
+    }
+
+
+def strategies(schema) -> dict:
+    validating = TypeAdapter(schema)
+    trusted = response_adapter(schema)
+
+    def stdlib(rows):
+        data = validating.dump_python(validating.validate_python(rows, from_attributes=True), mode="json")
+        return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def dump_json(rows):
+        return validating.dump_json(validating.validate_python(rows, from_attributes=True))
+
+    def orjson_path(rows):
+        return dumps(trusted.dump_python(trusted.validate_python(rows, from_attributes=True), mode="json"))
+
+    def fast_json(rows):
+        return trusted.dump_json(trusted.validate_python(rows, from_attributes=True))
+
+    return {"stdlib": stdlib, "dump_json": dump_json, "orjson": orjson_path, "fast_json": fast_json}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page (default: 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed encodings per strategy (default: 200)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, (schema, rows) in build_rows(args.rows).items():
+        encoders = strategies(schema)
+        outputs = {strategy: encode(rows) for strategy, encode in encoders.items()}
+        if len(set(outputs.values())) != 1:
+            raise SystemExit(f"{name}: strategies produced different bytes")
+
+        timings = {}
+        for strategy, encode in encoders.items():
+            best = min(timeit.repeat(lambda: encode(rows), number=1, repeat=args.repeat))
+            timings[strategy] = {
+                "page_us": round(best * 1e6, 1),
+                "row_us": round(best * 1e6 / len(rows), 2),
+            }
+        results[name] = {
+            "rows": len(rows),
+            "bytes": len(outputs["fast_json"]),
+            "timings": timings,
+            "speedup_vs_stdlib": round(timings["stdlib"]["page_us"] / timings["fast_json"]["page_us"], 2),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
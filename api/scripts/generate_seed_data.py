@@ -2,22 +2,106 @@
 """
 Generate seed data SQL for users, plans, and subscriptions.
 
+Users and their subscriptions are generated in chunks, optionally across
+worker processes, and written out as each chunk completes, so memory use does
+not grow with --users. The output is identical for the same --seed, --now and
+--chunk-size, whatever the number of workers.
+
 Usage:
-    python scripts/generate_seed_data.py [--users N] [--output FILE]
+    python scripts/generate_seed_data.py [--users N] [--output FILE] [--format copy|insert]
+                                         [--seed N] [--now TIMESTAMP] [--workers N]
+    python scripts/generate_seed_data.py --users N --load [--database-url URL]
 
 Options:
-    --users N       Number of users to generate (default: 50)
-    --output FILE   Output SQL file (default: seed_data.sql)
+    --users N            Number of users to generate (default: 50)
+    --output FILE        Output SQL file (default: seed_data.sql)
+    --format FORMAT      copy (COPY ... FROM stdin blocks, for psql) or insert
+                         (multi-row INSERT statements) (default: copy)
+    --seed N             Random seed (default: 0)
+    --now TIMESTAMP      Reference time for generated dates, ISO 8601 (default: current time)
+    --workers N          Worker processes generating chunks (default: 1)
+    --chunk-size N       Users per chunk (default: 10000)
+    --batch-size N       Rows per INSERT statement with --format insert (default: 1000)
+    --load               Stream the data into the database with COPY instead of writing a file
+    --database-url URL   Database for --load (default: $DATABASE_URL)
 """
 
 import argparse
+import io
+import os
+import random
+import re
+from collections import deque
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from datetime import UTC as datetime_UTC
 from decimal import Decimal
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import NamedTuple
+
 from faker import Faker
-import random
 
-fake = Faker()
+PLAN_COLUMNS = (
+    "id", "name", "tier", "description", "price", "billing_period",
+    "active_from", "active_to", "simulation", "created_at", "updated_at",
+)
+USER_COLUMNS = ("id", "email", "name", "mode", "created_at", "updated_at")
+# No id column: the sequence numbers subscriptions in load order, which is generation order.
+SUBSCRIPTION_COLUMNS = (
+    "user_id", "plan_id", "status", "start_date", "end_date", "cancelled_at", "created_at", "updated_at",
+)
+
+# Roughly: 15% no subscription, 10% simulation, 40% active, 20% lapsed, 15% future
+USER_TYPE_WEIGHTS = {
+    "no_subscription": 15,
+    "simulation": 10,
+    "active_free": 15,
+    "active_basic": 15,
+    "active_pro": 10,
+    "lapsed": 20,
+    "future": 15,
+}
+
+# Weights for 0, 1, 2 and 3 earlier, finished subscriptions before a user's latest one.
+PAST_SUBSCRIPTION_WEIGHTS = (50, 25, 15, 10)
+
+NAME_POOL_SIZE = 1000
+EMAIL_DOMAINS = ("example.com", "example.net", "example.org")
+
+SEQUENCE_TABLES = ("plans", "users", "subscriptions")
+
+TRUNCATE_SQL = (
+    "TRUNCATE TABLE subscription_timeseries_cache, subscription_counters, subscriptions, users, plans "
+    "RESTART IDENTITY CASCADE;"
+)
+FINISH_SQL = (
+    "INSERT INTO subscription_counters (plan_id, status, count) "
+    "SELECT plan_id, status, COUNT(*) FROM subscriptions GROUP BY plan_id, status;",
+    # Plans and users use explicit ids; move the sequences past them so inserts do not collide.
+    *(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table};"
+        for table in SEQUENCE_TABLES
+    ),
+    "ANALYZE plans, users, subscriptions, subscription_counters;",
+)
+
+
+class SeedConfig(NamedTuple):
+    seed: int
+    now: datetime
+    plans: list[dict]
+    format: str
+    batch_size: int
+
+
+class Chunk(NamedTuple):
+    """One chunk of users, rendered in the output format."""
+
+    users: str
+    subscriptions: str
+    user_count: int
+    subscription_count: int
 
 
 def escape_sql_string(value: str) -> str:
@@ -26,8 +110,9 @@ def escape_sql_string(value: str) -> str:
 
 
 def format_datetime(dt: datetime) -> str:
-    """Format datetime for SQL."""
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    """Format datetime for SQL, with its UTC offset when it has one."""
+    # isoformat() is several times faster than strftime() and omits zero microseconds.
+    return dt.isoformat(sep=" ")
 
 
 def format_decimal(value: Decimal) -> str:
@@ -35,10 +120,58 @@ def format_decimal(value: Decimal) -> str:
     return f"{value:.2f}"
 
 
-def generate_plans() -> list[dict]:
+def sql_value(value) -> str:
+    """Format a value as a SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, datetime):
+        return f"'{format_datetime(value)}'"
+    if isinstance(value, Decimal):
+        return format_decimal(value)
+    if isinstance(value, str):
+        return f"'{escape_sql_string(value)}'"
+    return str(value)
+
+
+def copy_value(value) -> str:
+    """Format a value for COPY text format."""
+    if isinstance(value, str):
+        return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    if isinstance(value, datetime):
+        return format_datetime(value)
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, Decimal):
+        return format_decimal(value)
+    return str(value)
+
+
+def copy_rows(rows: list[tuple]) -> str:
+    return "".join("\t".join(map(copy_value, row)) + "\n" for row in rows)
+
+
+def copy_block(table: str, columns: tuple[str, ...], data: str) -> str:
+    """A ``COPY ... FROM stdin`` block as psql reads it from a script."""
+    return f"COPY {table} ({', '.join(columns)}) FROM stdin;\n{data}\\.\n"
+
+
+def insert_statements(table: str, columns: tuple[str, ...], rows: list[tuple], batch_size: int) -> str:
+    statements = []
+    for start in range(0, len(rows), batch_size):
+        values = ",\n".join(
+            f"({', '.join(map(sql_value, row))})" for row in rows[start:start + batch_size]
+        )
+        statements.append(f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n{values};\n")
+    return "".join(statements)
+
+
+def generate_plans(now: datetime) -> list[dict]:
     """Generate plan data for current year and next year."""
     plans = []
-    now = datetime.now(datetime_UTC)
     current_year = now.year
     next_year = current_year + 1
 
@@ -121,244 +254,298 @@ def generate_plans() -> list[dict]:
     return plans
 
 
-def generate_users_and_subscriptions(num_users: int, plans: list[dict]) -> tuple[list[dict], list[dict]]:
-    """Generate users with various subscription states."""
-    users = []
-    subscriptions = []
-    now = datetime.now(datetime_UTC)
-
-    # Get plan IDs by category
-    current_year_plans = [p for p in plans if not p["simulation"] and p["active_from"].year == now.year]
-    simulation_plans = [p for p in plans if p["simulation"]]
-
-    # Distribution of user types
-    # Roughly: 15% no subscription, 10% simulation, 40% active, 20% lapsed, 15% future
-    user_types = (
-        ["no_subscription"] * 15 +
-        ["simulation"] * 10 +
-        ["active_free"] * 15 +
-        ["active_basic"] * 15 +
-        ["active_pro"] * 10 +
-        ["lapsed"] * 20 +
-        ["future"] * 15
-    )
+def plan_rows(plans: list[dict], now: datetime) -> list[tuple]:
+    return [
+        (
+            plan["id"], plan["name"], plan["tier"], plan["description"], plan["price"], plan["billing_period"],
+            plan["active_from"], plan["active_to"], plan["simulation"], now, now,
+        )
+        for plan in plans
+    ]
 
-    user_id = 1
-    subscription_id = 1
 
-    for i in range(num_users):
-        user_type = random.choice(user_types)
+@lru_cache(maxsize=None)
+def name_pools(seed: int) -> tuple[list[str], list[str]]:
+    """First and last names drawn once per process; per-user picks come from the chunk's RNG."""
+    fake = Faker()
+    fake.seed_instance(seed)
+    return (
+        [fake.first_name() for _ in range(NAME_POOL_SIZE)],
+        [fake.last_name() for _ in range(NAME_POOL_SIZE)],
+    )
 
-        # Create user
-        is_simulation = user_type == "simulation"
-        user = {
-            "id": user_id,
-            "email": fake.unique.email(),
-            "name": fake.name(),
-            "mode": "simulation" if is_simulation else "live",
-        }
-        users.append(user)
 
-        # Create subscription based on user type
-        if user_type == "no_subscription":
-            pass  # No subscription for this user
-
-        elif user_type == "simulation":
-            # Simulation user with simulation plan
-            plan = random.choice(simulation_plans)
-            start_date = now - timedelta(days=random.randint(1, 30))
-            subscriptions.append({
-                "id": subscription_id,
-                "user_id": user_id,
-                "plan_id": plan["id"],
-                "status": "active",
-                "start_date": start_date,
-                "end_date": None,
-                "cancelled_at": None,
-            })
-            subscription_id += 1
-
-        elif user_type.startswith("active_"):
-            # Active subscription
-            tier = user_type.replace("active_", "")
-            tier_plans = [p for p in current_year_plans if p["tier"] == tier]
-            plan = random.choice(tier_plans)
-
-            start_date = now - timedelta(days=random.randint(1, 180))
-            end_date = start_date + timedelta(days=365 if plan["billing_period"] == "yearly" else 30)
-
-            subscriptions.append({
-                "id": subscription_id,
-                "user_id": user_id,
-                "plan_id": plan["id"],
-                "status": "active",
-                "start_date": start_date,
-                "end_date": end_date,
-                "cancelled_at": None,
-            })
-            subscription_id += 1
-
-        elif user_type == "lapsed":
-            # Lapsed subscription (end_date in the past)
-            plan = random.choice(current_year_plans)
-            days_ago = random.randint(30, 365)
-            start_date = now - timedelta(days=days_ago + 30)
-            end_date = now - timedelta(days=random.randint(1, 29))
-
-            status = random.choice(["expired", "cancelled"])
-            cancelled_at = end_date - timedelta(days=random.randint(1, 5)) if status == "cancelled" else None
-
-            subscriptions.append({
-                "id": subscription_id,
-                "user_id": user_id,
-                "plan_id": plan["id"],
-                "status": status,
-                "start_date": start_date,
-                "end_date": end_date,
-                "cancelled_at": cancelled_at,
-            })
-            subscription_id += 1
-
-        elif user_type == "future":
-            # Future subscription (start_date in the future)
-            plan = random.choice(current_year_plans)
-            start_date = now + timedelta(days=random.randint(1, 60))
-            end_date = start_date + timedelta(days=365 if plan["billing_period"] == "yearly" else 30)
-
-            subscriptions.append({
-                "id": subscription_id,
-                "user_id": user_id,
-                "plan_id": plan["id"],
-                "status": "active",
-                "start_date": start_date,
-                "end_date": end_date,
-                "cancelled_at": None,
-            })
-            subscription_id += 1
+def email_part(name: str) -> str:
+    return re.sub(r"[^a-z]", "", name.lower())
+
+
+def billing_days(plan: dict) -> int:
+    return 365 if plan["billing_period"] == "yearly" else 30
+
+
+def subscription_row(
+    user_id: int,
+    plan: dict,
+    status: str,
+    start_date: datetime,
+    end_date: datetime | None,
+    cancelled_at: datetime | None,
+    created_at: datetime,
+) -> tuple:
+    if cancelled_at is not None:
+        updated_at = cancelled_at
+    elif status == "expired":
+        updated_at = end_date
+    else:
+        updated_at = created_at
+    return (user_id, plan["id"], status, start_date, end_date, cancelled_at, created_at, updated_at)
+
+
+def ended_subscription(
+    rng: random.Random, user_id: int, plan: dict, start_date: datetime, end_date: datetime
+) -> tuple:
+    status = rng.choice(["expired", "cancelled"])
+    cancelled_at = end_date - timedelta(days=rng.randint(1, 5)) if status == "cancelled" else None
+    return subscription_row(user_id, plan, status, start_date, end_date, cancelled_at, start_date)
+
+
+def past_subscriptions(rng: random.Random, user_id: int, before: datetime, plans: list[dict]) -> list[tuple]:
+    """Zero or more finished subscriptions ending before ``before``, oldest first."""
+    count = rng.choices(range(len(PAST_SUBSCRIPTION_WEIGHTS)), PAST_SUBSCRIPTION_WEIGHTS)[0]
+    rows = []
+    end_date = before
+    for _ in range(count):
+        end_date -= timedelta(days=rng.randint(1, 60))
+        plan = rng.choice(plans)
+        start_date = end_date - timedelta(days=billing_days(plan) * rng.randint(1, 3))
+        rows.append(ended_subscription(rng, user_id, plan, start_date, end_date))
+        end_date = start_date
+    rows.reverse()
+    return rows
+
+
+def generate_user(
+    rng: random.Random,
+    user_id: int,
+    now: datetime,
+    plans_by_tier: dict[str, list[dict]],
+    first_names: list[str],
+    last_names: list[str],
+) -> tuple[tuple, list[tuple]]:
+    """Generate one user and their subscription history, oldest first.
+
+    At most one subscription per user is active, and it is always the latest.
+    """
+    user_type = rng.choices(list(USER_TYPE_WEIGHTS), list(USER_TYPE_WEIGHTS.values()))[0]
+    current_year_plans = plans_by_tier["all"]
+    subscriptions = []
 
-        user_id += 1
+    if user_type == "simulation":
+        # Simulation user with simulation plan
+        plan = rng.choice(plans_by_tier["simulation"])
+        start_date = now - timedelta(days=rng.randint(1, 30))
+        subscriptions.append(subscription_row(user_id, plan, "active", start_date, None, None, start_date))
+
+    elif user_type.startswith("active_"):
+        # Active subscription, possibly after earlier ones on any tier
+        plan = rng.choice(plans_by_tier[user_type.removeprefix("active_")])
+        start_date = now - timedelta(days=rng.randint(1, 180))
+        end_date = start_date + timedelta(days=billing_days(plan))
+        subscriptions += past_subscriptions(rng, user_id, start_date, current_year_plans)
+        subscriptions.append(subscription_row(user_id, plan, "active", start_date, end_date, None, start_date))
+
+    elif user_type == "lapsed":
+        # Lapsed subscription (end_date in the past), possibly after earlier ones
+        plan = rng.choice(current_year_plans)
+        start_date = now - timedelta(days=rng.randint(30, 365) + 30)
+        end_date = now - timedelta(days=rng.randint(1, 29))
+        subscriptions += past_subscriptions(rng, user_id, start_date, current_year_plans)
+        subscriptions.append(ended_subscription(rng, user_id, plan, start_date, end_date))
+
+    elif user_type == "future":
+        # Future subscription (start_date in the future), possibly a returning user
+        plan = rng.choice(current_year_plans)
+        start_date = now + timedelta(days=rng.randint(1, 60))
+        end_date = start_date + timedelta(days=billing_days(plan))
+        subscriptions += past_subscriptions(rng, user_id, now, current_year_plans)
+        subscriptions.append(subscription_row(user_id, plan, "active", start_date, end_date, None, now))
+
+    if subscriptions:
+        # Signed up shortly before their first subscription was created
+        created_at = subscriptions[0][6] - timedelta(days=rng.randint(0, 30))
+    else:
+        created_at = now - timedelta(days=rng.randint(0, 730))
+    # users timestamps are stored without a time zone
+    created_at = created_at.replace(tzinfo=None)
+
+    first_name = rng.choice(first_names)
+    last_name = rng.choice(last_names)
+    # The user id keeps emails unique without tracking the ones already used.
+    email = f"{email_part(first_name)}.{email_part(last_name)}.{user_id}@{rng.choice(EMAIL_DOMAINS)}"
+    mode = "simulation" if user_type == "simulation" else "live"
+    user = (user_id, email, f"{first_name} {last_name}", mode, created_at, created_at)
+    return user, subscriptions
+
+
+def generate_chunk(config: SeedConfig, task: tuple[int, int]) -> Chunk:
+    """Generate ``count`` users from ``first_user_id`` with an RNG seeded by the chunk alone."""
+    first_user_id, count = task
+    rng = random.Random(f"{config.seed}:{first_user_id}")
+    first_names, last_names = name_pools(config.seed)
+    current_year_plans = [
+        p for p in config.plans if not p["simulation"] and p["active_from"].year == config.now.year
+    ]
+    plans_by_tier = {
+        "all": current_year_plans,
+        "simulation": [p for p in config.plans if p["simulation"]],
+        **{tier: [p for p in current_year_plans if p["tier"] == tier] for tier in ("free", "basic", "pro")},
+    }
 
-    return users, subscriptions
+    users = []
+    subscriptions = []
+    for user_id in range(first_user_id, first_user_id + count):
+        user, user_subscriptions = generate_user(
+            rng, user_id, config.now, plans_by_tier, first_names, last_names
+        )
+        users.append(user)
+        subscriptions += user_subscriptions
+
+    if config.format == "copy":
+        return Chunk(copy_rows(users), copy_rows(subscriptions), len(users), len(subscriptions))
+    return Chunk(
+        insert_statements("users", USER_COLUMNS, users, config.batch_size),
+        insert_statements("subscriptions", SUBSCRIPTION_COLUMNS, subscriptions, config.batch_size),
+        len(users),
+        len(subscriptions),
+    )
 
 
-def generate_sql(plans: list[dict], users: list[dict], subscriptions: list[dict]) -> str:
-    """Generate SQL statements for all data."""
-    now = datetime.now(datetime_UTC)
-    sql_lines = [
-        "-- Seed data generated at " + format_datetime(now),
-        "-- This script clears existing data and repopulates the database",
-        "",
-        "-- Clear existing data (CASCADE handles foreign key constraints)",
-        "TRUNCATE TABLE subscriptions, users, plans RESTART IDENTITY CASCADE;",
-        "",
-        "-- ============================================",
-        "-- Plans",
-        "-- ============================================",
-        "",
+def generate_chunks(config: SeedConfig, num_users: int, chunk_size: int, workers: int) -> Iterator[Chunk]:
+    """Yield chunks in user id order, generating up to ``workers`` at a time."""
+    tasks = [
+        (first_user_id, min(chunk_size, num_users - first_user_id + 1))
+        for first_user_id in range(1, num_users + 1, chunk_size)
     ]
-
-    # Generate plan inserts
-    for plan in plans:
-        active_to = f"'{format_datetime(plan['active_to'])}'" if plan["active_to"] else "NULL"
-        simulation = 1 if plan["simulation"] else 0
-        sql_lines.append(
-            f"INSERT INTO plans (id, name, tier, description, price, billing_period, active_from, active_to, simulation, created_at, updated_at) VALUES ("
-            f"{plan['id']}, "
-            f"'{escape_sql_string(plan['name'])}', "
-            f"'{plan['tier']}', "
-            f"'{escape_sql_string(plan['description'])}', "
-            f"{format_decimal(plan['price'])}, "
-            f"'{plan['billing_period']}', "
-            f"'{format_datetime(plan['active_from'])}', "
-            f"{active_to}, "
-            f"{simulation}, "
-            f"'{format_datetime(now)}', "
-            f"'{format_datetime(now)}'"
-            f");"
+    if workers <= 1:
+        for task in tasks:
+            yield generate_chunk(config, task)
+        return
+    with Pool(workers) as pool:
+        # Stay a bounded number of chunks ahead of the consumer so a slow
+        # writer or database does not leave finished chunks piling up in memory.
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(generate_chunk, (config, task)))
+            if len(pending) > workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def write_sql(path: str, config: SeedConfig, chunks: Iterator[Chunk]) -> tuple[int, int]:
+    """Write a psql script that clears and repopulates the database; return the user and subscription counts."""
+    plans = plan_rows(config.plans, config.now)
+    users = subscriptions = 0
+    with open(path, "w") as f:
+        f.write(
+            f"-- Seed data generated at {format_datetime(config.now)} with seed {config.seed}\n"
+            "-- This script clears existing data and repopulates the database\n"
+            "\n"
+            "-- Clear existing data (CASCADE handles foreign key constraints)\n"
+            f"{TRUNCATE_SQL}\n"
+            "\n"
         )
-
-    sql_lines.extend([
-        "",
-        "-- ============================================",
-        "-- Users",
-        "-- ============================================",
-        "",
-    ])
-
-    # Generate user inserts
-    for user in users:
-        sql_lines.append(
-            f"INSERT INTO users (id, email, name, mode, created_at, updated_at) VALUES ("
-            f"{user['id']}, "
-            f"'{escape_sql_string(user['email'])}', "
-            f"'{escape_sql_string(user['name'])}', "
-            f"'{user['mode']}', "
-            f"'{format_datetime(now)}', "
-            f"'{format_datetime(now)}'"
-            f");"
+        if config.format == "copy":
+            f.write(copy_block("plans", PLAN_COLUMNS, copy_rows(plans)))
+        else:
+            f.write(insert_statements("plans", PLAN_COLUMNS, plans, config.batch_size))
+        for chunk in chunks:
+            if config.format == "copy":
+                f.write(copy_block("users", USER_COLUMNS, chunk.users))
+                f.write(copy_block("subscriptions", SUBSCRIPTION_COLUMNS, chunk.subscriptions))
+            else:
+                f.write(chunk.users)
+                f.write(chunk.subscriptions)
+            users += chunk.user_count
+            subscriptions += chunk.subscription_count
+        f.write("\n" + "\n".join(FINISH_SQL) + "\n")
+        f.write(
+            "\n"
+            f"-- Plans: {len(plans)}\n"
+            f"-- Users: {users}\n"
+            f"-- Subscriptions: {subscriptions}\n"
         )
+    return users, subscriptions
 
-    sql_lines.extend([
-        "",
-        "-- ============================================",
-        "-- Subscriptions",
-        "-- ============================================",
-        "",
-    ])
-
-    # Generate subscription inserts
-    for sub in subscriptions:
-        end_date = f"'{format_datetime(sub['end_date'])}'" if sub["end_date"] else "NULL"
-        cancelled_at = f"'{format_datetime(sub['cancelled_at'])}'" if sub["cancelled_at"] else "NULL"
-        sql_lines.append(
-            f"INSERT INTO subscriptions (id, user_id, plan_id, status, start_date, end_date, cancelled_at, created_at, updated_at) VALUES ("
-            f"{sub['id']}, "
-            f"{sub['user_id']}, "
-            f"{sub['plan_id']}, "
-            f"'{sub['status']}', "
-            f"'{format_datetime(sub['start_date'])}', "
-            f"{end_date}, "
-            f"{cancelled_at}, "
-            f"'{format_datetime(now)}', "
-            f"'{format_datetime(now)}'"
-            f");"
-        )
 
-    sql_lines.extend([
-        "",
-        "-- ============================================",
-        "-- Summary",
-        "-- ============================================",
-        f"-- Plans: {len(plans)}",
-        f"-- Users: {len(users)}",
-        f"-- Subscriptions: {len(subscriptions)}",
-        "",
-    ])
+def load(database_url: str, config: SeedConfig, chunks: Iterator[Chunk]) -> tuple[int, int]:
+    """Clear and repopulate the database with COPY in one transaction; return the user and subscription counts."""
+    from sqlalchemy import create_engine
+
+    def copy(cursor, table: str, columns: tuple[str, ...], data: str) -> None:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", io.StringIO(data))
+
+    users = subscriptions = 0
+    engine = create_engine(database_url)
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(TRUNCATE_SQL)
+        copy(cursor, "plans", PLAN_COLUMNS, copy_rows(plan_rows(config.plans, config.now)))
+        for chunk in chunks:
+            copy(cursor, "users", USER_COLUMNS, chunk.users)
+            copy(cursor, "subscriptions", SUBSCRIPTION_COLUMNS, chunk.subscriptions)
+            users += chunk.user_count
+            subscriptions += chunk.subscription_count
+            print(f"  Loaded {users} users")
+        for statement in FINISH_SQL:
+            cursor.execute(statement)
+        connection.commit()
+    finally:
+        connection.close()
+        engine.dispose()
+    return users, subscriptions
+
 
-    return "\n".join(sql_lines)
+def parse_now(value: str) -> datetime:
+    now = datetime.fromisoformat(value)
+    return now.replace(tzinfo=datetime_UTC) if now.tzinfo is None else now.astimezone(datetime_UTC)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate seed data SQL for the subscription API")
     parser.add_argument("--users", type=int, default=50, help="Number of users to generate (default: 50)")
     parser.add_argument("--output", type=str, default="seed_data.sql", help="Output SQL file (default: seed_data.sql)")
+    parser.add_argument("--format", choices=["copy", "insert"], default="copy", help="Output format (default: copy)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--now", type=parse_now, default=None, help="Reference time, ISO 8601 (default: current time)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes generating chunks (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Users per chunk (default: 10000)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT with --format insert (default: 1000)")
+    parser.add_argument("--load", action="store_true", help="Stream the data into the database instead of writing a file")
+    parser.add_argument("--database-url", type=str, default=os.environ.get("DATABASE_URL"), help="Database for --load (default: $DATABASE_URL)")
     args = parser.parse_args()
+    if args.load and not args.database_url:
+        parser.error("--load needs --database-url or DATABASE_URL")
+    if args.load and args.format != "copy":
+        parser.error("--load always uses COPY; drop --format insert")
+    if args.chunk_size < 1 or args.batch_size < 1:
+        parser.error("--chunk-size and --batch-size must be positive")
 
-    print(f"Generating seed data with {args.users} users...")
-
-    plans = generate_plans()
-    print(f"  Generated {len(plans)} plans")
+    now = (args.now or datetime.now(datetime_UTC)).replace(microsecond=0)
+    config = SeedConfig(args.seed, now, generate_plans(now), args.format, args.batch_size)
+    chunks = generate_chunks(config, args.users, args.chunk_size, args.workers)
 
-    users, subscriptions = generate_users_and_subscriptions(args.users, plans)
-    print(f"  Generated {len(users)} users")
-    print(f"  Generated {len(subscriptions)} subscriptions")
-
-    sql = generate_sql(plans, users, subscriptions)
-
-    with open(args.output, "w") as f:
-        f.write(sql)
-
-    print(f"Seed data written to {args.output}")
+    print(f"Generating seed data with {args.users} users...")
+    print(f"  Generated {len(config.plans)} plans")
+    if args.load:
+        users, subscriptions = load(args.database_url, config, chunks)
+    else:
+        users, subscriptions = write_sql(args.output, config, chunks)
+    print(f"  Generated {users} users")
+    print(f"  Generated {subscriptions} subscriptions")
+
+    print("Seed data loaded" if args.load else f"Seed data written to {args.output}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Load-test the API against a seeded local PostgreSQL and report latency per endpoint.
+
+Optionally seeds the database with scripts/generate_seed_data.py at the
+requested scale, starts the API under uvicorn, and drives a fixed-concurrency
+mix of:
+
+    GET  /plans/active
+    GET  /subscriptions/user/{user_id}/active
+    POST /subscriptions
+    POST /subscriptions/{subscription_id}/cancel   (subscriptions created by the run)
+    GET  /reports/subscriptions
+
+The result (p50/p95/p99 latency, throughput and 5xx errors per endpoint, plus
+the git commit) is printed as JSON and can be written to a file to diff
+between commits. The database must already be migrated (alembic upgrade head).
+
+Usage:
+    python scripts/load_test.py [--database-url URL] [--scale 10k|1m|10m | --users N] [--seed]
+                                [--concurrency N] [--duration SECONDS] [--output FILE]
+
+Options:
+    --database-url URL   Database to test against (default: $DATABASE_URL)
+    --scale SCALE        Seeded user count: 10k, 1m or 10m (default: 10k)
+    --users N            Exact user count, overrides --scale
+    --seed               Regenerate and load seed data before the run (destroys existing data)
+    --mix SPEC           Endpoint weights, e.g. "plans_active=30,user_active=35,create=15,cancel=10,report=10"
+    --concurrency N      Concurrent in-flight requests (default: 32)
+    --duration SECONDS   Measurement time (default: 60)
+    --warmup SECONDS     Unmeasured warm-up time (default: 5)
+    --workers N          Uvicorn worker processes (default: 1)
+    --port PORT          Port for the uvicorn server (default: 8100)
+    --random-seed N      Seed for the seed data and the request mix (default: 0)
+    --output FILE        Also write the JSON result to FILE
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from collections import deque
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+from pathlib import Path
+
+import httpx
+
+from loadgen import API_DIR, Request, run_load, running_api, summarize
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+
+DEFAULT_MIX = {
+    "plans_active": 30,
+    "user_active": 35,
+    "create": 15,
+    "cancel": 10,
+    "report": 10,
+}
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {name.strip()!r} in --mix")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+def seed(database_url: str, users: int, random_seed: int) -> None:
+    subprocess.run(
+        [
+            sys.executable, "scripts/generate_seed_data.py", "--load",
+            "--database-url", database_url,
+            "--users", str(users),
+            "--seed", str(random_seed),
+            "--workers", str(os.cpu_count() or 1),
+        ],
+        cwd=API_DIR,
+        check=True,
+    )
+    verify_seed(database_url, users)
+
+
+def verify_seed(database_url: str, users: int) -> None:
+    """Fail fast if the seed did not load, e.g. counters left empty so the report share measures nothing."""
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as connection:
+            seeded_users = connection.scalar(text("SELECT COUNT(*) FROM users"))
+            subscriptions = connection.scalar(text("SELECT COUNT(*) FROM subscriptions"))
+            counted = connection.scalar(text("SELECT COALESCE(SUM(count), 0) FROM subscription_counters"))
+    finally:
+        engine.dispose()
+    if seeded_users != users:
+        raise SystemExit(f"Seeding loaded {seeded_users} users, expected {users}")
+    if counted != subscriptions:
+        raise SystemExit(f"subscription_counters sum to {counted} but there are {subscriptions} subscriptions")
+
+
+def build_mix(mix: dict[str, int], users: int, plan_ids: list[int]):
+    """Return the request generator and the response hook that feeds cancellations."""
+    created: deque[int] = deque(maxlen=10_000)
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+
+    def create(rng) -> Request:
+        body = {
+            "user_id": rng.randint(1, users),
+            "plan_id": rng.choice(plan_ids),
+            "start_date": datetime.now(datetime_UTC).isoformat(),
+        }
+        return Request("POST", "/subscriptions", body, "POST /subscriptions")
+
+    def next_request(rng) -> Request:
+        name = rng.choices(names, weights)[0]
+        if name == "plans_active":
+            return Request("GET", "/plans/active", endpoint="GET /plans/active")
+        if name == "user_active":
+            return Request(
+                "GET",
+                f"/subscriptions/user/{rng.randint(1, users)}/active",
+                endpoint="GET /subscriptions/user/{user_id}/active",
+            )
+        if name == "cancel" and created:
+            return Request(
+                "POST",
+                f"/subscriptions/{created.popleft()}/cancel",
+                endpoint="POST /subscriptions/{subscription_id}/cancel",
+            )
+        if name == "report":
+            return Request("GET", "/reports/subscriptions", endpoint="GET /reports/subscriptions")
+        return create(rng)
+
+    def on_response(request: Request, response: httpx.Response) -> None:
+        if request.endpoint == "POST /subscriptions" and response.status_code == 201:
+            created.append(response.json()["id"])
+
+    return next_request, on_response
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=API_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the API against a seeded database")
+    parser.add_argument("--database-url", type=str, default=os.environ.get("DATABASE_URL"), help="Database URL (default: $DATABASE_URL)")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="10k", help="Seeded user count (default: 10k)")
+    parser.add_argument("--users", type=int, default=None, help="Exact user count, overrides --scale")
+    parser.add_argument("--seed", action="store_true", help="Regenerate and load seed data first (destroys existing data)")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Endpoint weights, e.g. plans_active=30,create=15")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent in-flight requests (default: 32)")
+    parser.add_argument("--duration", type=float, default=60.0, help="Measurement time in seconds (default: 60)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured warm-up time in seconds (default: 5)")
+    parser.add_argument("--workers", type=int, default=1, help="Uvicorn worker processes (default: 1)")
+    parser.add_argument("--port", type=int, default=8100, help="Port for the uvicorn server (default: 8100)")
+    parser.add_argument("--random-seed", type=int, default=0, help="Seed for the seed data and the request mix (default: 0)")
+    parser.add_argument("--output", type=str, default=None, help="Also write the JSON result to this file")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+    users = args.users or SCALES[args.scale]
+
+    if args.seed:
+        seed(args.database_url, users, args.random_seed)
+
+    with running_api(args.port, {"DATABASE_URL": args.database_url}, workers=args.workers) as base_url:
+        plan_ids = [plan["id"] for plan in httpx.get(f"{base_url}/plans/active").json()]
+        if not plan_ids:
+            raise SystemExit("No active plans; seed the database first (--seed)")
+        next_request, on_response = build_mix(args.mix, users, plan_ids)
+        if args.warmup > 0:
+            asyncio.run(run_load(
+                base_url, next_request, args.concurrency, args.warmup,
+                seed=args.random_seed + 10_000, on_response=on_response,
+            ))
+        result = asyncio.run(run_load(
+            base_url, next_request, args.concurrency, args.duration, seed=args.random_seed, on_response=on_response,
+        ))
+
+    report = {
+        "commit": git_commit(),
+        "users": users,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "workers": args.workers,
+        "mix": args.mix,
+        "total": summarize(result.latencies, result.errors, result.duration),
+        "endpoints": {
+            endpoint: summarize(result.endpoint_latencies[endpoint], result.endpoint_errors[endpoint], result.duration)
+            for endpoint in sorted(set(result.endpoint_latencies) | set(result.endpoint_errors))
+        },
+    }
+    output = json.dumps(report, indent=2, sort_keys=True)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Closed-loop HTTP load generator shared by the benchmark scripts.
+
+Each of ``concurrency`` workers sends one request at a time for ``duration``
+seconds, so throughput reflects server capacity at a fixed concurrency.
+"""
+
+import asyncio
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import httpx
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    body: dict | None = None
+    # Groups latencies in the result, e.g. "GET /users/{user_id}".
+    endpoint: str | None = None
+
+
+@dataclass
+class LoadResult:
+    duration: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    endpoint_latencies: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    endpoint_errors: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: list[float], errors: int, duration: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "requests_per_second": round(len(ordered) / duration, 1) if duration else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+    }
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    next_request: Callable[[random.Random], Request],
+    deadline: float,
+    seed: int,
+    result: LoadResult,
+    on_response: Callable[[Request, httpx.Response], None] | None,
+) -> None:
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        request = next_request(rng)
+        endpoint = request.endpoint or f"{request.method} {request.path}"
+        started = time.perf_counter()
+        try:
+            response = await client.request(request.method, request.path, json=request.body)
+            if response.status_code >= 500:
+                result.errors += 1
+                result.endpoint_errors[endpoint] += 1
+        except httpx.HTTPError:
+            result.errors += 1
+            result.endpoint_errors[endpoint] += 1
+            continue
+        latency = time.perf_counter() - started
+        result.latencies.append(latency)
+        result.endpoint_latencies[endpoint].append(latency)
+        if on_response is not None:
+            on_response(request, response)
+
+
+async def run_load(
+    base_url: str,
+    next_request: Callable[[random.Random], Request],
+    concurrency: int = 32,
+    duration: float = 20.0,
+    seed: int = 0,
+    on_response: Callable[[Request, httpx.Response], None] | None = None,
+) -> LoadResult:
+    result = LoadResult()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(
+            _worker(client, next_request, deadline, seed + index, result, on_response)
+            for index in range(concurrency)
+        ))
+        result.duration = time.perf_counter() - started
+    return result
+
+
+def wait_until_healthy(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"API at {base_url} did not become healthy")
+
+
+@contextmanager
+def running_api(port: int, env: dict[str, str], workers: int = 1) -> Iterator[str]:
+    """Serve ``main:app`` under uvicorn with ``env`` and yield its base URL."""
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=API_DIR,
+        env=dict(os.environ, **env),
+    )
+    try:
+        wait_until_healthy(base_url)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait()
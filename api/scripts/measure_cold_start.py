@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Measure Lambda cold-start cost: the time to ``import main`` and the latency
+of the first request through the Lambda handler.
+
+Every run happens in a fresh interpreter so nothing is cached between
+samples. Results are printed as JSON.
+
+Usage:
+    python scripts/measure_cold_start.py [--runs N] [--path PATH] [--budget-ms MS]
+
+Options:
+    --runs N        Number of fresh interpreters to sample (default: 5)
+    --path PATH     Request path for the first request (default: /health)
+    --top N         Number of slowest imports to report (default: 10)
+    --budget-ms MS  Exit with status 1 if the median import time exceeds MS
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+from types import SimpleNamespace
+
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+event = {
+    "version": "2.0",
+    "routeKey": "$default",
+    "rawPath": sys.argv[1],
+    "rawQueryString": "",
+    "headers": {"host": "localhost"},
+    "requestContext": {
+        "http": {"method": "GET", "path": sys.argv[1], "sourceIp": "127.0.0.1", "protocol": "HTTP/1.1"},
+        "stage": "$default",
+    },
+    "isBase64Encoded": False,
+}
+response = main.handler(event, SimpleNamespace(aws_request_id="cold-start-probe"))
+finished = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_request_ms": (finished - imported) * 1000,
+    "status_code": response["statusCode"],
+}))
+"""
+
+
+def sample(path: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, path],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int) -> list[dict]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        imports.append({
+            "module": module,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return sorted(imports, key=lambda entry: entry["self_ms"], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import and first-request latency of the Lambda handler")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to sample (default: 5)")
+    parser.add_argument("--path", type=str, default="/health", help="Request path for the first request (default: /health)")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to report (default: 10)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the median import time exceeds this budget")
+    args = parser.parse_args()
+
+    samples = [sample(args.path) for _ in range(args.runs)]
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    first_request_ms = statistics.median(s["first_request_ms"] for s in samples)
+
+    report = {
+        "runs": args.runs,
+        "path": args.path,
+        "import_ms": round(import_ms, 1),
+        "first_request_ms": round(first_request_ms, 1),
+        "status_codes": sorted({s["status_code"] for s in samples}),
+        "slowest_imports": slowest_imports(args.top),
+        "budget_ms": args.budget_ms,
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.budget_ms is not None and import_ms > args.budget_ms:
+        print(f"import main took {import_ms:.1f}ms, over the {args.budget_ms:.1f}ms budget", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.db_errors import violated_constraint
+from core.pagination import decode_cursor
+from core.timestamps import as_utc
+from models.plan import PLAN_WINDOW_OVERLAP_CONSTRAINT, Plan
+from repositories.async_plan import AsyncPlanRepository
+from schemas.plan import PlanBatchGetResponse, PlanBatchGetResult, PlanCreate, PlanResponse, PlanUpdate
+from services.plan_catalog import plan_catalog
+
+
+class AsyncPlanService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncPlanRepository(db)
+
+    async def get_plan(self, plan_id: int, fields: tuple[str, ...] | None = None) -> Plan:
+        plan = await self.repository.get_by_id(plan_id, fields)
+        if not plan:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Plan not found"
+            )
+        return plan
+
+    async def get_plans(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Plan]:
+        after_id = decode_cursor(cursor) if cursor else None
+        return await self.repository.get_all(skip=skip, limit=limit, after_id=after_id, fields=fields)
+
+    async def get_active_plans(
+        self, current_time: datetime | None = None, fields: tuple[str, ...] | None = None
+    ) -> list[Plan]:
+        """Plans active now come from the catalog; ``at`` or ``fields`` lookups use the indexed query."""
+        if settings.plan_catalog_enabled and current_time is None and fields is None:
+            snapshot = await plan_catalog.snapshot_async(self.db)
+            return snapshot.active_at(None)
+        if current_time is not None:
+            current_time = as_utc(current_time)
+        return await self.repository.get_active_plans(current_time=current_time, fields=fields)
+
+    async def batch_get_plans(self, plan_ids: list[int]) -> PlanBatchGetResponse:
+        plans = {}
+        missing = list(dict.fromkeys(plan_ids))
+        if settings.plan_catalog_enabled:
+            cached = (await plan_catalog.snapshot_async(self.db)).by_id
+            plans = {plan_id: cached[plan_id] for plan_id in missing if plan_id in cached}
+            missing = [plan_id for plan_id in missing if plan_id not in cached]
+        if missing:
+            plans.update(await self.repository.get_by_ids(missing))
+        return PlanBatchGetResponse(results=[
+            PlanBatchGetResult(
+                id=plan_id,
+                found=plan_id in plans,
+                plan=PlanResponse.model_validate(plans[plan_id]) if plan_id in plans else None,
+            )
+            for plan_id in plan_ids
+        ])
+
+    async def create_plan(self, plan_data: PlanCreate) -> Plan:
+        try:
+            plan = await self.repository.create(plan_data)
+        except IntegrityError as error:
+            if violated_constraint(error) != PLAN_WINDOW_OVERLAP_CONSTRAINT:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Plan active window overlaps another plan with the same tier and billing period"
+            )
+        plan_catalog.invalidate()
+        return plan
+
+    async def update_plan(self, plan_id: int, plan_data: PlanUpdate) -> Plan:
+        plan = await self.get_plan(plan_id)
+        try:
+            plan = await self.repository.update(plan, plan_data)
+        except IntegrityError as error:
+            if violated_constraint(error) != PLAN_WINDOW_OVERLAP_CONSTRAINT:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Plan active window overlaps another plan with the same tier and billing period"
+            )
+        plan_catalog.invalidate()
+        return plan
+
+    async def delete_plan(self, plan_id: int) -> None:
+        plan = await self.get_plan(plan_id)
+        await self.repository.delete(plan)
+        plan_catalog.invalidate()
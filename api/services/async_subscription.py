@@ -0,0 +1,224 @@
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+
+from typing import NoReturn
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.pagination import decode_cursor
+from models.plan import Plan
+from models.subscription import Subscription, SubscriptionStatus, is_duplicate_active
+from models.user import UserMode
+from repositories.async_plan import AsyncPlanRepository
+from repositories.async_subscription import AsyncSubscriptionRepository
+from repositories.subscription import SIDELOADED_FIELDS
+from repositories.async_user import AsyncUserRepository
+from schemas.plan import PlanResponse
+from schemas.subscription import (
+    SubscriptionBatchGetResponse,
+    SubscriptionBatchGetResult,
+    SubscriptionCreate,
+    SubscriptionDetailResponse,
+    SubscriptionResponse,
+    SubscriptionSideloadedResponse,
+    SubscriptionUpdate,
+    SubscriptionWithUserResponse,
+)
+from services.plan_catalog import plan_catalog
+
+
+class AsyncSubscriptionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncSubscriptionRepository(db)
+        self.user_repository = AsyncUserRepository(db)
+        self.plan_repository = AsyncPlanRepository(db)
+
+    async def _get_plan(self, plan_id: int) -> Plan | None:
+        if settings.plan_catalog_enabled:
+            snapshot = await plan_catalog.snapshot_async(self.db)
+            plan = snapshot.get(plan_id)
+            if plan is not None:
+                return plan
+        return await self.plan_repository.get_by_id(plan_id)
+
+    async def _get_plans(self, plan_ids: list[int]) -> dict[int, Plan]:
+        if not settings.plan_catalog_enabled:
+            return await self.plan_repository.get_by_ids(plan_ids)
+        # The snapshot can trail plans created by other processes; read those directly.
+        cached = (await plan_catalog.snapshot_async(self.db)).by_id
+        plans = {plan_id: cached[plan_id] for plan_id in plan_ids if plan_id in cached}
+        missing = [plan_id for plan_id in plan_ids if plan_id not in cached]
+        if missing:
+            plans.update(await self.plan_repository.get_by_ids(missing))
+        return plans
+
+    async def get_subscription(self, subscription_id: int, fields: tuple[str, ...] | None = None) -> Subscription:
+        subscription = await self.repository.get_by_id(subscription_id, fields)
+        if not subscription:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Subscription not found"
+            )
+        return subscription
+
+    async def get_subscriptions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[SubscriptionDetailResponse]:
+        after_id = decode_cursor(cursor) if cursor else None
+        if settings.row_projection:
+            return await self.repository.get_all_details(skip=skip, limit=limit, after_id=after_id, fields=fields)
+        return await self.repository.get_all(skip=skip, limit=limit, after_id=after_id, fields=fields)
+
+    async def get_subscriptions_sideloaded(
+        self, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> SubscriptionSideloadedResponse:
+        after_id = decode_cursor(cursor) if cursor else None
+        if settings.row_projection:
+            subscriptions = await self.repository.get_all_with_users(skip=skip, limit=limit, after_id=after_id)
+        else:
+            subscriptions = [
+                SubscriptionWithUserResponse.model_validate(subscription)
+                for subscription in await self.repository.get_all(
+                    skip=skip, limit=limit, after_id=after_id, fields=SIDELOADED_FIELDS
+                )
+            ]
+        plan_ids = sorted({subscription.plan_id for subscription in subscriptions})
+        plans = await self._get_plans(plan_ids) if plan_ids else {}
+        return SubscriptionSideloadedResponse(
+            subscriptions=subscriptions,
+            plans={plan_id: PlanResponse.model_validate(plans[plan_id]) for plan_id in plan_ids},
+        )
+
+    async def batch_get_subscriptions(self, subscription_ids: list[int]) -> SubscriptionBatchGetResponse:
+        if settings.row_projection:
+            subscriptions = await self.repository.get_details_by_ids(list(set(subscription_ids)))
+        else:
+            found = await self.repository.get_by_ids(list(set(subscription_ids)))
+            subscriptions = {
+                subscription_id: SubscriptionDetailResponse.model_validate(subscription)
+                for subscription_id, subscription in found.items()
+            }
+        return SubscriptionBatchGetResponse(results=[
+            SubscriptionBatchGetResult(
+                id=subscription_id,
+                found=subscription_id in subscriptions,
+                subscription=subscriptions.get(subscription_id),
+            )
+            for subscription_id in subscription_ids
+        ])
+
+    async def get_user_subscriptions(
+        self, user_id: int, fields: tuple[str, ...] | None = None
+    ) -> list[SubscriptionResponse]:
+        if settings.row_projection:
+            return await self.repository.get_responses_by_user_id(user_id, fields=fields)
+        return await self.repository.get_by_user_id(user_id, fields=fields)
+
+    async def get_active_subscription(self, user_id: int) -> Subscription | None:
+        return await self.repository.get_active_by_user_id(user_id)
+
+    async def create_subscription(self, subscription_data: SubscriptionCreate) -> Subscription:
+        try:
+            subscription = await self.repository.create_if_eligible(subscription_data)
+        except IntegrityError as error:
+            if not is_duplicate_active(error):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already has an active subscription"
+            )
+        if subscription is None:
+            await self._raise_ineligible(subscription_data)
+        return subscription
+
+    async def _raise_ineligible(self, subscription_data: SubscriptionCreate) -> NoReturn:
+        user = await self.user_repository.get_by_id(subscription_data.user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+
+        if user.mode == UserMode.SIMULATION.value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Users in simulation mode cannot have subscriptions"
+            )
+
+        existing_active = await self.repository.get_active_by_user_id(subscription_data.user_id)
+        if existing_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already has an active subscription"
+            )
+
+        plan = await self._get_plan(subscription_data.plan_id)
+        if not plan:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Plan not found"
+            )
+
+        if not plan.is_active():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Plan is not currently active"
+            )
+
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Subscription eligibility changed during the request"
+        )
+
+    async def update_subscription(self, subscription_id: int, subscription_data: SubscriptionUpdate) -> Subscription:
+        subscription = await self.get_subscription(subscription_id)
+
+        if subscription_data.plan_id:
+            plan = await self._get_plan(subscription_data.plan_id)
+            if not plan:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Plan not found"
+                )
+            if not plan.is_active():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Plan is not currently active"
+                )
+
+        try:
+            return await self.repository.update(subscription, subscription_data)
+        except IntegrityError as error:
+            if not is_duplicate_active(error):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already has an active subscription"
+            )
+
+    async def cancel_subscription(self, subscription_id: int) -> Subscription:
+        subscription = await self.get_subscription(subscription_id)
+
+        if subscription.status != SubscriptionStatus.ACTIVE.value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only active subscriptions can be cancelled"
+            )
+
+        update_data = SubscriptionUpdate(
+            status=SubscriptionStatus.CANCELLED
+        )
+        subscription.cancelled_at = datetime.now(datetime_UTC)
+        return await self.repository.update(subscription, update_data)
+
+    async def delete_subscription(self, subscription_id: int) -> None:
+        subscription = await self.get_subscription(subscription_id)
+        await self.repository.delete(subscription)
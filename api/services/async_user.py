@@ -0,0 +1,66 @@
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.pagination import decode_cursor
+from models.user import User
+from repositories.async_user import AsyncUserRepository
+from schemas.user import UserBatchGetResponse, UserBatchGetResult, UserCreate, UserResponse, UserUpdate
+
+
+class AsyncUserService:
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncUserRepository(db)
+
+    async def get_user(self, user_id: int, fields: tuple[str, ...] | None = None) -> User:
+        user = await self.repository.get_by_id(user_id, fields)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        return user
+
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[User]:
+        after_id = decode_cursor(cursor) if cursor else None
+        return await self.repository.get_all(skip=skip, limit=limit, after_id=after_id, fields=fields)
+
+    async def batch_get_users(self, user_ids: list[int]) -> UserBatchGetResponse:
+        users = await self.repository.get_by_ids(list(set(user_ids)))
+        return UserBatchGetResponse(results=[
+            UserBatchGetResult(
+                id=user_id,
+                found=user_id in users,
+                user=UserResponse.model_validate(users[user_id]) if user_id in users else None,
+            )
+            for user_id in user_ids
+        ])
+
+    async def create_user(self, user_data: UserCreate) -> User:
+        existing_user = await self.repository.get_by_email(user_data.email)
+        if existing_user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+        return await self.repository.create(user_data)
+
+    async def update_user(self, user_id: int, user_data: UserUpdate) -> User:
+        user = await self.get_user(user_id)
+        if user_data.email:
+            existing_user = await self.repository.get_by_email(user_data.email)
+            if existing_user and existing_user.id != user_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered"
+                )
+        return await self.repository.update(user, user_data)
+
+    async def delete_user(self, user_id: int) -> None:
+        user = await self.get_user(user_id)
+        await self.repository.delete(user)
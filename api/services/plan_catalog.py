@@ -0,0 +1,111 @@
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.timestamps import as_utc
+from models.plan import Plan
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True)
+class PlanCatalogSnapshot:
+    """Immutable view of every plan, indexed by id and by start of the active window."""
+
+    version: tuple
+    plans: list[Plan]
+    by_id: dict[int, Plan] = field(init=False)
+    _by_active_from: list[Plan] = field(init=False)
+    _active_from: list[datetime] = field(init=False)
+
+    def __post_init__(self):
+        ordered = sorted(self.plans, key=lambda plan: as_utc(plan.active_from))
+        object.__setattr__(self, "by_id", {plan.id: plan for plan in self.plans})
+        object.__setattr__(self, "_by_active_from", ordered)
+        object.__setattr__(self, "_active_from", [as_utc(plan.active_from) for plan in ordered])
+
+    def get(self, plan_id: int) -> Plan | None:
+        return self.by_id.get(plan_id)
+
+    def active_at(self, current_time: datetime | None = None) -> list[Plan]:
+        if current_time is None:
+            current_time = datetime.now(datetime_UTC)
+        started = bisect.bisect_right(self._active_from, current_time)
+        active = [plan for plan in self._by_active_from[:started] if plan.is_active(current_time)]
+        return sorted(active, key=lambda plan: plan.id)
+
+
+class PlanCatalog:
+    """Process-wide cache of the plans table.
+
+    The snapshot is dropped whenever ``PlanService`` writes a plan. Changes
+    made by other processes are picked up by comparing the cheap
+    ``count``/``max(updated_at)`` version at most once per
+    ``settings.plan_catalog_refresh_seconds``.
+    """
+
+    def __init__(self):
+        self._snapshot: PlanCatalogSnapshot | None = None
+        self._checked_at = 0.0
+        # Bumped by every invalidate(); a refresh that started before one
+        # read the table before the write and must not be stored.
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._snapshot = None
+
+    def _fresh_snapshot(self) -> PlanCatalogSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < settings.plan_catalog_refresh_seconds:
+            return snapshot
+        return None
+
+    def snapshot(self, db: Session) -> PlanCatalogSnapshot:
+        # No lock: a refresh is idempotent, so concurrent callers at worst
+        # load the table twice. A lock would also deadlock coroutines that
+        # share the event loop thread in snapshot_async.
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        generation = self._generation
+        snapshot = self._snapshot
+        version = self._load_version(db)
+        if snapshot is None or snapshot.version != version:
+            snapshot = PlanCatalogSnapshot(version=version, plans=self._load_plans(db))
+        if generation == self._generation:
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+        return snapshot
+
+    async def snapshot_async(self, db: "AsyncSession") -> PlanCatalogSnapshot:
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot
+        return await db.run_sync(self.snapshot)
+
+    def _load_version(self, db: Session) -> tuple:
+        count, last_updated = db.execute(select(func.count(Plan.id), func.max(Plan.updated_at))).one()
+        return count, last_updated
+
+    def _load_plans(self, db: Session) -> list[Plan]:
+        # A throwaway session on the caller's connection keeps the cached
+        # instances out of the request's identity map without checking out
+        # a second connection from the pool.
+        loader = Session(bind=db.connection())
+        try:
+            return list(loader.scalars(select(Plan).order_by(Plan.id)))
+        finally:
+            loader.close()
+
+
+plan_catalog = PlanCatalog()
@@ -1,34 +1,160 @@
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from datetime import UTC as datetime_UTC
+
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from models.plan import PlanTier
 from repositories.subscription import SubscriptionRepository
+from repositories.subscription_counter import SubscriptionCounterRepository
+from repositories.subscription_timeseries_cache import SubscriptionTimeseriesCacheRepository, bucket_floor
 from schemas.report import (
     SubscriptionReportResponse,
     SubscriptionsByStatusReport,
     SubscriptionsByPlanReport,
+    SubscriptionTimeseriesBucket,
+    SubscriptionTimeseriesResponse,
+    TimeseriesGranularity,
 )
 
+TIMESERIES_MAX_BUCKETS = 1000
+
+
+def _next_bucket(bucket_start: date, granularity: TimeseriesGranularity) -> date:
+    if granularity == TimeseriesGranularity.WEEK:
+        return bucket_start + timedelta(weeks=1)
+    if granularity == TimeseriesGranularity.MONTH:
+        if bucket_start.month == 12:
+            return bucket_start.replace(year=bucket_start.year + 1, month=1)
+        return bucket_start.replace(month=bucket_start.month + 1)
+    return bucket_start + timedelta(days=1)
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime.combine(day, time(), tzinfo=datetime_UTC)
+
 
 class ReportService:
     def __init__(self, db: Session):
         self.subscription_repository = SubscriptionRepository(db)
+        self.counter_repository = SubscriptionCounterRepository(db)
+        self.timeseries_cache_repository = SubscriptionTimeseriesCacheRepository(db)
 
-    def get_subscription_report(self) -> SubscriptionReportResponse:
-        total = self.subscription_repository.count_total()
+    def get_subscription_report(self, fresh: bool = False) -> SubscriptionReportResponse:
+        """Build the report from the maintained counters, or recount subscriptions if ``fresh``."""
+        if fresh:
+            return self._recount_subscription_report()
+
+        by_status_counts: Counter[str] = Counter()
+        # Plan names are not unique, so plans are told apart by id.
+        by_plan_counts: Counter[int] = Counter()
+        plan_labels: dict[int, tuple[str, str]] = {}
+        for plan_id, name, tier, status, count in self.counter_repository.get_report_rows():
+            by_status_counts[status] += count
+            by_plan_counts[plan_id] += count
+            plan_labels[plan_id] = (name, tier)
 
-        by_status_raw = self.subscription_repository.count_by_status()
         by_status = [
             SubscriptionsByStatusReport(status=status, count=count)
-            for status, count in by_status_raw
+            for status, count in by_status_counts.items()
         ]
-
-        by_plan_raw = self.subscription_repository.count_by_plan()
         by_plan = [
-            SubscriptionsByPlanReport(plan_name=name, tier=tier, count=count)
-            for name, tier, count in by_plan_raw
+            SubscriptionsByPlanReport(plan_name=name, tier=tier, count=by_plan_counts[plan_id])
+            for plan_id, (name, tier) in plan_labels.items()
         ]
 
         return SubscriptionReportResponse(
-            total_subscriptions=total,
+            total_subscriptions=sum(by_status_counts.values()),
             by_status=by_status,
             by_plan=by_plan,
         )
+
+    def _recount_subscription_report(self) -> SubscriptionReportResponse:
+        total, by_status_raw, by_plan_raw = self.subscription_repository.count_summary()
+        return SubscriptionReportResponse(
+            total_subscriptions=total,
+            by_status=[
+                SubscriptionsByStatusReport(status=status, count=count)
+                for status, count in by_status_raw
+            ],
+            by_plan=[
+                SubscriptionsByPlanReport(plan_name=name, tier=tier, count=count)
+                for name, tier, count in by_plan_raw
+            ],
+        )
+
+    def get_subscription_timeseries(
+        self, start: date, end: date, granularity: TimeseriesGranularity
+    ) -> SubscriptionTimeseriesResponse:
+        """Active subscriptions per tier for each UTC bucket overlapping [start, end].
+
+        Buckets that ended before today are read from (or written to) the
+        persistent cache, so normally only the open bucket is counted.
+        """
+        if start > end:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start must not be after end"
+            )
+
+        bucket_starts = []
+        bucket_start = bucket_floor(start, granularity)
+        while bucket_start <= end:
+            if len(bucket_starts) == TIMESERIES_MAX_BUCKETS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Range spans more than {TIMESERIES_MAX_BUCKETS} buckets"
+                )
+            bucket_starts.append(bucket_start)
+            bucket_start = _next_bucket(bucket_start, granularity)
+
+        today = datetime.now(datetime_UTC).date()
+        closed = [
+            bucket_start for bucket_start in bucket_starts
+            if _next_bucket(bucket_start, granularity) <= today
+        ]
+        counts = {}
+        if closed:
+            # Read before counting: store() drops the buckets if a write invalidated the cache since.
+            generation = self.timeseries_cache_repository.generation()
+            counts = self.timeseries_cache_repository.get_range(granularity.value, closed[0], closed[-1])
+
+        missing = [bucket_start for bucket_start in bucket_starts if bucket_start not in counts]
+        if missing:
+            computed = self._count_buckets(granularity, missing)
+            counts.update(computed)
+            if closed:
+                self.timeseries_cache_repository.store(
+                    granularity.value,
+                    {bucket_start: computed[bucket_start] for bucket_start in missing if bucket_start in closed},
+                    generation,
+                )
+
+        return SubscriptionTimeseriesResponse(
+            granularity=granularity,
+            start=start,
+            end=end,
+            buckets=[
+                SubscriptionTimeseriesBucket(
+                    bucket_start=bucket_start,
+                    counts={tier.value: 0 for tier in PlanTier} | counts[bucket_start],
+                )
+                for bucket_start in bucket_starts
+            ],
+        )
+
+    def _count_buckets(
+        self, granularity: TimeseriesGranularity, bucket_starts: list[date]
+    ) -> dict[date, dict[str, int]]:
+        bounds = [
+            (_utc_midnight(bucket_start), _utc_midnight(_next_bucket(bucket_start, granularity)))
+            for bucket_start in bucket_starts
+        ]
+        active = self.subscription_repository.count_active_by_tier(granularity.value, bounds)
+
+        # Every tier gets a row, zeros included, so a cached bucket is complete.
+        counts = {bucket_start: {tier.value: 0 for tier in PlanTier} for bucket_start in bucket_starts}
+        for (bucket_start, tier), count in active.items():
+            counts[bucket_start.date()][tier] = count
+        return counts
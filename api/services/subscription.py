@@ -1,25 +1,76 @@
+import csv
+import io
+from collections.abc import Iterator
 from datetime import datetime
 from datetime import UTC as datetime_UTC
+from typing import NoReturn
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from models.subscription import Subscription, SubscriptionStatus
+from core.config import settings
+from core.pagination import decode_cursor
+from models.plan import Plan
+from models.subscription import Subscription, SubscriptionStatus, is_duplicate_active
 from models.user import UserMode
-from repositories.subscription import SubscriptionRepository
+from repositories.subscription import SIDELOADED_FIELDS, SubscriptionRepository
 from repositories.user import UserRepository
 from repositories.plan import PlanRepository
-from schemas.subscription import SubscriptionCreate, SubscriptionUpdate
+from schemas.plan import PlanResponse
+from schemas.bulk import BulkItemStatus
+from schemas.subscription import (
+    ExportFormat,
+    SubscriptionBulkResponse,
+    SubscriptionBulkResult,
+    SubscriptionBatchGetResponse,
+    SubscriptionBatchGetResult,
+    SubscriptionCreate,
+    SubscriptionDetailResponse,
+    SubscriptionResponse,
+    SubscriptionSideloadedResponse,
+    SubscriptionUpdate,
+    SubscriptionWithUserResponse,
+)
+from schemas.user import UserResponse
+from services.plan_catalog import plan_catalog
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_CSV_COLUMNS = (
+    list(SubscriptionResponse.model_fields)
+    + [f"user_{field}" for field in UserResponse.model_fields]
+    + [f"plan_{field}" for field in PlanResponse.model_fields]
+)
 
 
 class SubscriptionService:
     def __init__(self, db: Session):
+        self.db = db
         self.repository = SubscriptionRepository(db)
         self.user_repository = UserRepository(db)
         self.plan_repository = PlanRepository(db)
 
-    def get_subscription(self, subscription_id: int) -> Subscription:
-        subscription = self.repository.get_by_id(subscription_id)
+    def _get_plan(self, plan_id: int) -> Plan | None:
+        if settings.plan_catalog_enabled:
+            plan = plan_catalog.snapshot(self.db).get(plan_id)
+            if plan is not None:
+                return plan
+        return self.plan_repository.get_by_id(plan_id)
+
+    def _get_plans(self, plan_ids: list[int]) -> dict[int, Plan]:
+        if not settings.plan_catalog_enabled:
+            return self.plan_repository.get_by_ids(plan_ids)
+        # The snapshot can trail plans created by other processes; read those directly.
+        cached = plan_catalog.snapshot(self.db).by_id
+        plans = {plan_id: cached[plan_id] for plan_id in plan_ids if plan_id in cached}
+        missing = [plan_id for plan_id in plan_ids if plan_id not in cached]
+        if missing:
+            plans.update(self.plan_repository.get_by_ids(missing))
+        return plans
+
+    def get_subscription(self, subscription_id: int, fields: tuple[str, ...] | None = None) -> Subscription:
+        subscription = self.repository.get_by_id(subscription_id, fields)
         if not subscription:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -27,16 +78,130 @@ class SubscriptionService:
             )
         return subscription
 
-    def get_subscriptions(self, skip: int = 0, limit: int = 100) -> list[Subscription]:
-        return self.repository.get_all(skip=skip, limit=limit)
+    def get_subscriptions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[SubscriptionDetailResponse]:
+        after_id = decode_cursor(cursor) if cursor else None
+        if settings.row_projection:
+            return self.repository.get_all_details(skip=skip, limit=limit, after_id=after_id, fields=fields)
+        return self.repository.get_all(skip=skip, limit=limit, after_id=after_id, fields=fields)
+
+    def get_subscriptions_sideloaded(
+        self, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> SubscriptionSideloadedResponse:
+        """Same page as ``get_subscriptions``, with each distinct plan listed once."""
+        after_id = decode_cursor(cursor) if cursor else None
+        if settings.row_projection:
+            subscriptions = self.repository.get_all_with_users(skip=skip, limit=limit, after_id=after_id)
+        else:
+            subscriptions = [
+                SubscriptionWithUserResponse.model_validate(subscription)
+                for subscription in self.repository.get_all(
+                    skip=skip, limit=limit, after_id=after_id, fields=SIDELOADED_FIELDS
+                )
+            ]
+        plan_ids = sorted({subscription.plan_id for subscription in subscriptions})
+        plans = self._get_plans(plan_ids) if plan_ids else {}
+        return SubscriptionSideloadedResponse(
+            subscriptions=subscriptions,
+            plans={plan_id: PlanResponse.model_validate(plans[plan_id]) for plan_id in plan_ids},
+        )
+
+    def export_subscriptions(
+        self, export_format: ExportFormat, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[str]:
+        """Yield the export in chunks of ``batch_size`` rows.
+
+        Rows are read from a server-side cursor, so memory stays bounded by
+        one batch regardless of table size.
+        """
+        if export_format == ExportFormat.CSV:
+            rows = self._export_csv_lines()
+        else:
+            rows = self._export_ndjson_lines()
+
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= batch_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
 
-    def get_user_subscriptions(self, user_id: int) -> list[Subscription]:
-        return self.repository.get_by_user_id(user_id)
+    def _export_ndjson_lines(self) -> Iterator[str]:
+        for subscription in self.repository.iter_all():
+            yield SubscriptionDetailResponse.model_validate(subscription).model_dump_json() + "\n"
+
+    def _export_csv_lines(self) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_COLUMNS)
+
+        writer.writeheader()
+        for subscription in self.repository.iter_all():
+            detail = SubscriptionDetailResponse.model_validate(subscription).model_dump(mode="json")
+            user = detail.pop("user")
+            plan = detail.pop("plan")
+            detail.update({f"user_{field}": value for field, value in user.items()})
+            detail.update({f"plan_{field}": value for field, value in plan.items()})
+            writer.writerow(detail)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    def batch_get_subscriptions(self, subscription_ids: list[int]) -> SubscriptionBatchGetResponse:
+        """Look up every id in one query; results follow ``subscription_ids`` order."""
+        if settings.row_projection:
+            subscriptions = self.repository.get_details_by_ids(list(set(subscription_ids)))
+        else:
+            found = self.repository.get_by_ids(list(set(subscription_ids)))
+            subscriptions = {
+                subscription_id: SubscriptionDetailResponse.model_validate(subscription)
+                for subscription_id, subscription in found.items()
+            }
+        return SubscriptionBatchGetResponse(results=[
+            SubscriptionBatchGetResult(
+                id=subscription_id,
+                found=subscription_id in subscriptions,
+                subscription=subscriptions.get(subscription_id),
+            )
+            for subscription_id in subscription_ids
+        ])
+
+    def get_user_subscriptions(
+        self, user_id: int, fields: tuple[str, ...] | None = None
+    ) -> list[SubscriptionResponse]:
+        if settings.row_projection:
+            return self.repository.get_responses_by_user_id(user_id, fields=fields)
+        return self.repository.get_by_user_id(user_id, fields=fields)
 
     def get_active_subscription(self, user_id: int) -> Subscription | None:
         return self.repository.get_active_by_user_id(user_id)
 
     def create_subscription(self, subscription_data: SubscriptionCreate) -> Subscription:
+        try:
+            subscription = self.repository.create_if_eligible(subscription_data)
+        except IntegrityError as error:
+            if not is_duplicate_active(error):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already has an active subscription"
+            )
+        if subscription is None:
+            self._raise_ineligible(subscription_data)
+        return subscription
+
+    def _raise_ineligible(self, subscription_data: SubscriptionCreate) -> NoReturn:
+        """Explain why ``create_if_eligible`` inserted nothing.
+
+        Only runs on the failure path, and checks in the same order the
+        API has always reported errors.
+        """
         user = self.user_repository.get_by_id(subscription_data.user_id)
         if not user:
             raise HTTPException(
@@ -57,7 +222,7 @@ class SubscriptionService:
                 detail="User already has an active subscription"
             )
 
-        plan = self.plan_repository.get_by_id(subscription_data.plan_id)
+        plan = self._get_plan(subscription_data.plan_id)
         if not plan:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -70,13 +235,73 @@ class SubscriptionService:
                 detail="Plan is not currently active"
             )
 
-        return self.repository.create(subscription_data)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Subscription eligibility changed during the request"
+        )
+
+    def create_subscriptions(self, subscriptions_data: list[SubscriptionCreate]) -> SubscriptionBulkResponse:
+        """Validate and import a batch of subscriptions with set-based queries.
+
+        Users, their active subscriptions and plans are each fetched once for
+        the whole batch; rows failing the same rules as
+        ``create_subscription`` are rejected per item and the rest are
+        inserted in one transaction.
+        """
+        user_ids = list({s.user_id for s in subscriptions_data})
+        user_modes = self.user_repository.get_modes_by_ids(user_ids)
+        users_with_active = self.repository.get_user_ids_with_active(user_ids)
+        plans = self._get_plans(list({s.plan_id for s in subscriptions_data}))
+        now = datetime.now(datetime_UTC)
+
+        results: list[SubscriptionBulkResult | None] = [None] * len(subscriptions_data)
+        accepted: list[tuple[int, SubscriptionCreate]] = []
+
+        for index, subscription_data in enumerate(subscriptions_data):
+            mode = user_modes.get(subscription_data.user_id)
+            plan = plans.get(subscription_data.plan_id)
+            if mode is None:
+                detail = "User not found"
+            elif mode == UserMode.SIMULATION.value:
+                detail = "Users in simulation mode cannot have subscriptions"
+            elif subscription_data.user_id in users_with_active:
+                detail = "User already has an active subscription"
+            elif plan is None:
+                detail = "Plan not found"
+            elif not plan.is_active(now):
+                detail = "Plan is not currently active"
+            else:
+                users_with_active.add(subscription_data.user_id)
+                accepted.append((index, subscription_data))
+                continue
+            results[index] = SubscriptionBulkResult(index=index, status=BulkItemStatus.REJECTED, detail=detail)
+
+        if accepted:
+            try:
+                subscriptions = self.repository.create_many([data for _, data in accepted])
+            except IntegrityError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Batch conflicts with concurrent changes"
+                )
+            for (index, _), subscription in zip(accepted, subscriptions):
+                results[index] = SubscriptionBulkResult(
+                    index=index,
+                    status=BulkItemStatus.CREATED,
+                    subscription=SubscriptionResponse.model_validate(subscription),
+                )
+
+        return SubscriptionBulkResponse(
+            created=len(accepted),
+            rejected=len(subscriptions_data) - len(accepted),
+            results=results,
+        )
 
     def update_subscription(self, subscription_id: int, subscription_data: SubscriptionUpdate) -> Subscription:
         subscription = self.get_subscription(subscription_id)
 
         if subscription_data.plan_id:
-            plan = self.plan_repository.get_by_id(subscription_data.plan_id)
+            plan = self._get_plan(subscription_data.plan_id)
             if not plan:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -88,7 +313,15 @@ class SubscriptionService:
                     detail="Plan is not currently active"
                 )
 
-        return self.repository.update(subscription, subscription_data)
+        try:
+            return self.repository.update(subscription, subscription_data)
+        except IntegrityError as error:
+            if not is_duplicate_active(error):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already has an active subscription"
+            )
 
     def cancel_subscription(self, subscription_id: int) -> Subscription:
         subscription = self.get_subscription(subscription_id)
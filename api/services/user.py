@@ -1,17 +1,28 @@
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from core.pagination import decode_cursor
 from models.user import User
 from repositories.user import UserRepository
-from schemas.user import UserCreate, UserUpdate
+from schemas.bulk import BulkItemStatus
+from schemas.user import (
+    UserBatchGetResponse,
+    UserBatchGetResult,
+    UserBulkResponse,
+    UserBulkResult,
+    UserCreate,
+    UserResponse,
+    UserUpdate,
+)
 
 
 class UserService:
     def __init__(self, db: Session):
         self.repository = UserRepository(db)
 
-    def get_user(self, user_id: int) -> User:
-        user = self.repository.get_by_id(user_id)
+    def get_user(self, user_id: int, fields: tuple[str, ...] | None = None) -> User:
+        user = self.repository.get_by_id(user_id, fields)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -22,8 +33,27 @@ class UserService:
     def get_user_by_email(self, email: str) -> User | None:
         return self.repository.get_by_email(email)
 
-    def get_users(self, skip: int = 0, limit: int = 100) -> list[User]:
-        return self.repository.get_all(skip=skip, limit=limit)
+    def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[User]:
+        after_id = decode_cursor(cursor) if cursor else None
+        return self.repository.get_all(skip=skip, limit=limit, after_id=after_id, fields=fields)
+
+    def batch_get_users(self, user_ids: list[int]) -> UserBatchGetResponse:
+        """Look up every id in one query; results follow ``user_ids`` order."""
+        users = self.repository.get_by_ids(list(set(user_ids)))
+        return UserBatchGetResponse(results=[
+            UserBatchGetResult(
+                id=user_id,
+                found=user_id in users,
+                user=UserResponse.model_validate(users[user_id]) if user_id in users else None,
+            )
+            for user_id in user_ids
+        ])
 
     def create_user(self, user_data: UserCreate) -> User:
         existing_user = self.repository.get_by_email(user_data.email)
@@ -34,6 +64,49 @@ class UserService:
             )
         return self.repository.create(user_data)
 
+    def create_users(self, users_data: list[UserCreate]) -> UserBulkResponse:
+        """Create a batch of users with one conflict query and one INSERT.
+
+        Emails that are already registered, or repeated within the batch,
+        are rejected per item; everything else is created together.
+        """
+        existing_emails = self.repository.get_existing_emails([u.email for u in users_data])
+        results: list[UserBulkResult | None] = [None] * len(users_data)
+        accepted: list[tuple[int, UserCreate]] = []
+        seen_emails: set[str] = set()
+
+        for index, user_data in enumerate(users_data):
+            if user_data.email in existing_emails:
+                detail = "Email already registered"
+            elif user_data.email in seen_emails:
+                detail = "Duplicate email in batch"
+            else:
+                seen_emails.add(user_data.email)
+                accepted.append((index, user_data))
+                continue
+            results[index] = UserBulkResult(index=index, status=BulkItemStatus.REJECTED, detail=detail)
+
+        if accepted:
+            try:
+                users = self.repository.create_many([user_data for _, user_data in accepted])
+            except IntegrityError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered"
+                )
+            for (index, _), user in zip(accepted, users):
+                results[index] = UserBulkResult(
+                    index=index,
+                    status=BulkItemStatus.CREATED,
+                    user=UserResponse.model_validate(user),
+                )
+
+        return UserBulkResponse(
+            created=len(accepted),
+            rejected=len(users_data) - len(accepted),
+            results=results,
+        )
+
     def update_user(self, user_id: int, user_data: UserUpdate) -> User:
         user = self.get_user(user_id)
         if user_data.email:
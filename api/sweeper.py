@@ -0,0 +1,96 @@
+"""Lambda handler that expires subscriptions whose end_date has passed."""
+
+import json
+import time
+from datetime import datetime
+from datetime import UTC as datetime_UTC
+
+from database import SessionLocal, get_engine
+from repositories.subscription import SubscriptionRepository
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_TIME_BUDGET_SECONDS = 60.0
+# Time left for the final chunk to commit and the response to be returned.
+TIMEOUT_SAFETY_MARGIN_SECONDS = 5.0
+
+
+def sweep(batch_size: int = DEFAULT_BATCH_SIZE, time_budget_seconds: float = DEFAULT_TIME_BUDGET_SECONDS) -> dict:
+    """Expire overdue subscriptions chunk by chunk until none are left or the budget runs out.
+
+    Each chunk commits on its own, so stopping early (or a crash) leaves
+    every completed chunk in place; the next run picks up the rest.
+    """
+    get_engine()
+    now = datetime.now(datetime_UTC)
+    started = time.monotonic()
+    expired = 0
+    batches = 0
+    slowest_batch = 0.0
+    complete = False
+
+    db = SessionLocal()
+    try:
+        repository = SubscriptionRepository(db)
+        while True:
+            elapsed = time.monotonic() - started
+            if batches and elapsed + slowest_batch > time_budget_seconds:
+                break
+            batch_started = time.monotonic()
+            count = repository.expire_overdue(batch_size, now=now)
+            slowest_batch = max(slowest_batch, time.monotonic() - batch_started)
+            expired += count
+            batches += 1
+            if count < batch_size:
+                complete = True
+                break
+    finally:
+        db.close()
+
+    elapsed = time.monotonic() - started
+    return {
+        "expired": expired,
+        "batches": batches,
+        "complete": complete,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(expired / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+def handler(event, context):
+    """Expire overdue subscriptions.
+
+    Args:
+        event: Lambda event with optional 'batch_size' (default: 1000) and
+            'time_budget_seconds' (default: the invocation's remaining time
+            minus a safety margin, or 60 outside Lambda)
+        context: Lambda context
+
+    Returns:
+        dict with statusCode and sweep statistics
+    """
+    batch_size = int(event.get("batch_size", DEFAULT_BATCH_SIZE))
+    time_budget = event.get("time_budget_seconds")
+    if time_budget is None:
+        if context is not None and hasattr(context, "get_remaining_time_in_millis"):
+            time_budget = context.get_remaining_time_in_millis() / 1000 - TIMEOUT_SAFETY_MARGIN_SECONDS
+        else:
+            time_budget = DEFAULT_TIME_BUDGET_SECONDS
+
+    try:
+        result = sweep(batch_size=batch_size, time_budget_seconds=float(time_budget))
+    except Exception as e:
+        return {
+            "statusCode": 500,
+            "body": json.dumps({
+                "success": False,
+                "error": str(e),
+            }),
+        }
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps({
+            "success": True,
+            **result,
+        }),
+    }
@@ -3,14 +3,24 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import create_engine
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from database import Base
+import main
+from database import AppSession, Base, get_db
 from models.user import User, UserMode
 from models.plan import Plan, PlanTier
 from models.subscription import Subscription, SubscriptionStatus
+from services.plan_catalog import plan_catalog
+
+
+@pytest.fixture(autouse=True)
+def reset_plan_catalog():
+    plan_catalog.invalidate()
+    yield
+    plan_catalog.invalidate()
 
 
 @pytest.fixture
@@ -27,12 +37,32 @@ def engine():
 
 @pytest.fixture
 def db_session(engine):
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    SessionLocal = sessionmaker(class_=AppSession, autocommit=False, autoflush=False, bind=engine)
     session = SessionLocal()
     yield session
     session.close()
 
 
+@pytest.fixture
+def client(db_session):
+    main.app.dependency_overrides[get_db] = lambda: db_session
+    yield TestClient(main.app)
+    main.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def sql_statements(engine):
+    """Every statement sent to ``engine``; clear it right before the code under test."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
 @pytest.fixture
 def sample_user(db_session):
     user = User(
@@ -0,0 +1,179 @@
+import asyncio
+from datetime import datetime, timedelta
+from datetime import UTC as datetime_UTC
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from database import AppSession, Base
+from models.plan import Plan, PlanTier
+from models.subscription import SubscriptionStatus
+from models.user import User, UserMode
+from schemas.subscription import SubscriptionCreate
+from schemas.user import UserCreate
+from services.async_plan import AsyncPlanService
+from services.async_subscription import AsyncSubscriptionService
+from services.async_user import AsyncUserService
+from services.plan_catalog import plan_catalog
+
+
+@pytest.fixture
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def async_session(run):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async def create_schema():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    run(create_schema())
+    session = async_sessionmaker(
+        engine, sync_session_class=AppSession, autoflush=False, expire_on_commit=False
+    )()
+    yield session
+    run(session.close())
+    run(engine.dispose())
+
+
+@pytest.fixture
+def seeded(run, async_session):
+    user = User(email="async@example.com", name="Async User", mode=UserMode.LIVE.value)
+    simulation_user = User(email="sim@example.com", name="Sim User", mode=UserMode.SIMULATION.value)
+    plan = Plan(
+        name="Basic Monthly",
+        tier=PlanTier.BASIC.value,
+        price=Decimal("9.99"),
+        billing_period="monthly",
+        active_from=datetime.now(datetime_UTC) - timedelta(days=30),
+        simulation=False,
+    )
+    async_session.add_all([user, simulation_user, plan])
+    run(async_session.commit())
+    return user, simulation_user, plan
+
+
+class TestAsyncUserService:
+    def test_create_and_list_users(self, run, async_session):
+        service = AsyncUserService(async_session)
+
+        user = run(service.create_user(UserCreate(email="new@example.com", name="New")))
+        users = run(service.get_users())
+
+        assert [u.id for u in users] == [user.id]
+
+    def test_create_user_duplicate_email_raises_error(self, run, async_session, seeded):
+        service = AsyncUserService(async_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(service.create_user(UserCreate(email="async@example.com", name="Dup")))
+
+        assert exc_info.value.status_code == 400
+
+
+class TestAsyncPlanService:
+    def test_get_active_plans(self, run, async_session, seeded):
+        _, _, plan = seeded
+        service = AsyncPlanService(async_session)
+
+        active_plans = run(service.get_active_plans())
+
+        assert [p.id for p in active_plans] == [plan.id]
+
+
+class TestAsyncSubscriptionService:
+    def test_create_and_cancel_subscription(self, run, async_session, seeded):
+        user, _, plan = seeded
+        service = AsyncSubscriptionService(async_session)
+
+        subscription = run(service.create_subscription(SubscriptionCreate(
+            user_id=user.id,
+            plan_id=plan.id,
+            start_date=datetime.now(datetime_UTC),
+        )))
+        cancelled = run(service.cancel_subscription(subscription.id))
+
+        assert cancelled.status == SubscriptionStatus.CANCELLED.value
+        assert cancelled.cancelled_at is not None
+
+    def test_create_subscription_for_simulation_user_raises_error(
+        self, run, async_session, seeded
+    ):
+        _, simulation_user, plan = seeded
+        service = AsyncSubscriptionService(async_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(service.create_subscription(SubscriptionCreate(
+                user_id=simulation_user.id,
+                plan_id=plan.id,
+                start_date=datetime.now(datetime_UTC),
+            )))
+
+        assert exc_info.value.status_code == 400
+
+    def test_get_subscription_with_fields_loads_only_requested_plan(self, run, async_session, seeded):
+        user, _, plan = seeded
+        service = AsyncSubscriptionService(async_session)
+        created = run(service.create_subscription(SubscriptionCreate(
+            user_id=user.id,
+            plan_id=plan.id,
+            start_date=datetime.now(datetime_UTC),
+        )))
+        async_session.expunge_all()
+
+        subscription = run(service.get_subscription(created.id, ("status", "plan")))
+
+        assert subscription.status == SubscriptionStatus.ACTIVE.value
+        assert subscription.plan.id == plan.id
+        assert "user" not in subscription.__dict__ and "start_date" not in subscription.__dict__
+
+    def test_get_subscriptions_loads_user_and_plan(self, run, async_session, seeded):
+        user, _, plan = seeded
+        service = AsyncSubscriptionService(async_session)
+        run(service.create_subscription(SubscriptionCreate(
+            user_id=user.id,
+            plan_id=plan.id,
+            start_date=datetime.now(datetime_UTC),
+        )))
+
+        subscriptions = run(service.get_subscriptions())
+
+        assert subscriptions[0].user.email == "async@example.com"
+        assert subscriptions[0].plan.name == "Basic Monthly"
+
+    def test_sideload_reads_plans_missing_from_catalog(self, run, async_session, seeded):
+        user, _, _ = seeded
+        service = AsyncSubscriptionService(async_session)
+        # Warm the catalog, then add a plan the way another process would.
+        run(plan_catalog.snapshot_async(async_session))
+        plan = Plan(
+            name="Created Elsewhere",
+            tier=PlanTier.PRO.value,
+            price=Decimal("29.99"),
+            billing_period="monthly",
+            active_from=datetime.now(datetime_UTC) - timedelta(days=1),
+            simulation=False,
+        )
+        async_session.add(plan)
+        run(async_session.commit())
+
+        run(service.create_subscription(SubscriptionCreate(
+            user_id=user.id,
+            plan_id=plan.id,
+            start_date=datetime.now(datetime_UTC),
+        )))
+        page = run(service.get_subscriptions_sideloaded())
+
+        assert page.plans[plan.id].name == "Created Elsewhere"
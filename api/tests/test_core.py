@@ -0,0 +1,165 @@
+import threading
+from datetime import datetime, timedelta
+from datetime import UTC as datetime_UTC
+from types import SimpleNamespace
+
+from fastapi import Response
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import NullPool
+
+from core.config import Settings
+from core.db_errors import violated_constraint, violates_unique
+
+from core.metrics import MetricsRegistry
+from core.http_cache import etag_matches, not_modified, plan_etag, set_cache_headers
+from core.pagination import decode_cursor, encode_cursor
+from core.pool import TimedQueuePool, engine_options, pool_status, track_pool
+
+
+class TestPagination:
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor(42)) == 42
+
+
+class TestDbErrors:
+    def test_violated_constraint_reads_psycopg2_and_asyncpg_errors(self):
+        psycopg2_error = Exception()
+        psycopg2_error.diag = SimpleNamespace(constraint_name="ex_plans_window_overlap")
+        asyncpg_cause = Exception()
+        asyncpg_cause.constraint_name = "uq_subscriptions_user_id_active"
+        asyncpg_error = Exception()
+        asyncpg_error.__cause__ = asyncpg_cause
+
+        assert violated_constraint(IntegrityError("", {}, psycopg2_error)) == "ex_plans_window_overlap"
+        assert violated_constraint(IntegrityError("", {}, asyncpg_error)) == "uq_subscriptions_user_id_active"
+        assert violated_constraint(IntegrityError("", {}, Exception("UNIQUE constraint failed"))) is None
+
+    def test_violates_unique_matches_name_or_sqlite_columns(self):
+        named = Exception()
+        named.diag = SimpleNamespace(constraint_name="subscriptions_plan_id_fkey")
+        sqlite_unique = Exception("UNIQUE constraint failed: subscriptions.user_id")
+        sqlite_other = Exception("FOREIGN KEY constraint failed")
+        args = ("uq_subscriptions_user_id_active", "subscriptions", ["user_id"])
+
+        assert violates_unique(IntegrityError("", {}, named), *args) is False
+        assert violates_unique(IntegrityError("", {}, sqlite_unique), *args) is True
+        assert violates_unique(IntegrityError("", {}, sqlite_other), *args) is False
+
+
+class TestHttpCache:
+    def test_plan_etag_is_strong_and_stable(self, sample_plan):
+        etag = plan_etag([sample_plan])
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert plan_etag([sample_plan]) == etag
+
+    def test_plan_etag_changes_when_plan_updated(self, db_session, sample_plan):
+        etag = plan_etag([sample_plan])
+
+        sample_plan.updated_at = datetime.now(datetime_UTC) + timedelta(seconds=1)
+
+        assert plan_etag([sample_plan]) != etag
+
+    def test_etag_matches_list_and_weak_validators(self):
+        assert etag_matches('"a", W/"b"', '"b"') is True
+        assert etag_matches("*", '"b"') is True
+        assert etag_matches('"a"', '"b"') is False
+        assert etag_matches(None, '"b"') is False
+
+    def test_not_modified_keeps_cache_headers(self):
+        response = Response()
+        response.headers["X-Next-Cursor"] = "abc"
+
+        result = not_modified(response, '"b"')
+
+        assert result.status_code == 304
+        assert result.body == b""
+        assert result.headers["ETag"] == '"b"'
+        assert result.headers["X-Next-Cursor"] == "abc"
+        assert "max-age=" in result.headers["Cache-Control"]
+        assert "content-length" not in result.headers
+
+    def test_set_cache_headers(self):
+        response = Response()
+
+        set_cache_headers(response, '"b"')
+
+        assert response.headers["ETag"] == '"b"'
+        assert response.headers["Cache-Control"].startswith("public")
+
+
+class TestPool:
+    def test_single_mode_holds_one_connection(self):
+        options = engine_options(Settings(db_pool_mode="single"), "postgresql+psycopg2://db/shade")
+
+        assert options["poolclass"] is TimedQueuePool
+        assert options["pool_size"] == 1
+        assert options["max_overflow"] == 0
+
+    def test_rds_proxy_mode_avoids_pre_ping_and_prepared_statements(self):
+        options = engine_options(
+            Settings(db_pool_mode="rds_proxy"), "postgresql+asyncpg://db/shade", is_async=True
+        )
+
+        assert options["poolclass"] is NullPool
+        assert options["pool_pre_ping"] is False
+        assert options["connect_args"]["prepared_statement_cache_size"] == 0
+
+    def test_track_pool_counts_checkouts_and_waits(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        engine = create_engine(url, **engine_options(Settings(db_pool_mode="queue"), url))
+        stats = track_pool(engine)
+
+        for _ in range(2):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        status = pool_status(engine, stats)
+        assert status["checkouts"] == 2
+        assert status["connects"] == 1
+        assert status["checkout_wait_seconds"] > 0
+        assert status["checked_out"] == 0
+        engine.dispose()
+
+
+class TestMetrics:
+    def test_histogram_is_cumulative_per_route(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.5, 5.0):
+            registry.request_started()
+            registry.request_finished("GET", "/users/{user_id}", 200, seconds)
+
+        text = registry.render()
+
+        labels = 'method="GET",route="/users/{user_id}"'
+        assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"http_request_duration_seconds_count{{{labels}}} 3" in text
+        assert f'http_responses_total{{{labels},status="200"}} 3' in text
+        assert "http_requests_in_flight 0" in text
+
+    def test_shards_from_other_threads_are_summed(self):
+        registry = MetricsRegistry()
+
+        def record():
+            registry.request_started()
+            registry.request_finished("GET", "/plans", 200, 0.001)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        record()
+
+        assert 'http_responses_total{method="GET",route="/plans",status="200"} 5' in registry.render()
+
+    def test_pool_status_is_exported_per_engine(self):
+        text = MetricsRegistry().render({"sync": {"checkouts": 7, "overflow": -3, "pool": "TimedQueuePool"}})
+
+        assert "# TYPE db_pool_checkouts_total counter" in text
+        assert 'db_pool_checkouts_total{engine="sync"} 7' in text
+        assert 'db_pool_overflow{engine="sync"} -3' in text
+        assert "db_pool_size" not in text
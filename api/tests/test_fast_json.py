@@ -0,0 +1,36 @@
+import pytest
+
+from core.config import settings
+from core.fast_json import FastJSONResponse, dumps
+
+
+def fetch(client, monkeypatch, path, fast_json):
+    monkeypatch.setattr(settings, "fast_json", fast_json)
+    return client.get(path)
+
+
+class TestFastJSON:
+    @pytest.mark.parametrize("path", [
+        "/users?limit=1",
+        "/plans",
+        "/plans/active",
+        "/subscriptions?limit=1",
+        "/subscriptions?plans=sideload",
+        "/subscriptions/user/{user_id}",
+    ])
+    def test_fast_path_is_byte_identical(self, client, monkeypatch, sample_subscription, path):
+        path = path.format(user_id=sample_subscription.user_id)
+
+        standard = fetch(client, monkeypatch, path, fast_json=False)
+        fast = fetch(client, monkeypatch, path, fast_json=True)
+
+        assert standard.status_code == fast.status_code == 200
+        assert fast.content == standard.content
+        for header in ("content-type", "content-length", "etag", "x-next-cursor"):
+            assert fast.headers.get(header) == standard.headers.get(header)
+
+    def test_response_class_encodes_python_content_compactly(self):
+        content = {"name": "Zoë", "items": [1, None, True]}
+
+        assert FastJSONResponse(content).body == dumps(content) == '{"name":"Zoë","items":[1,null,true]}'.encode()
+        assert FastJSONResponse(b'{"raw":1}').body == b'{"raw":1}'
@@ -0,0 +1,73 @@
+import pytest
+
+
+class TestFieldsets:
+    def test_subscription_fields_trim_response_and_columns(
+        self, client, sample_subscription, sql_statements
+    ):
+        full = client.get("/subscriptions").json()
+        sql_statements.clear()
+
+        response = client.get("/subscriptions?fields=status,plan_id,end_date")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {key: item[key] for key in ("id", "plan_id", "end_date", "status")} for item in full
+        ]
+        query = next(statement for statement in sql_statements if "FROM subscriptions" in statement)
+        assert "JOIN" not in query
+        assert "description" not in query and "cancelled_at" not in query
+
+    def test_nested_field_joins_only_its_table(self, client, sample_subscription, sql_statements):
+        response = client.get("/subscriptions?fields=plan")
+
+        assert set(response.json()[0]) == {"id", "plan"}
+        query = next(statement for statement in sql_statements if "FROM subscriptions" in statement)
+        assert "JOIN plans" in query and "JOIN users" not in query
+
+    def test_user_and_plan_fields(self, client, sample_user, sample_plan):
+        assert client.get(f"/users/{sample_user.id}?fields=email").json() == {
+            "email": sample_user.email,
+            "id": sample_user.id,
+        }
+        assert client.get("/plans?fields=tier").json() == [{"tier": "basic", "id": sample_plan.id}]
+
+    @pytest.mark.parametrize("path, table, skipped", [
+        ("/users/{user_id}?fields=email", "users", "users.name"),
+        ("/plans/{plan_id}?fields=name", "plans", "plans.description"),
+        ("/subscriptions/{subscription_id}?fields=status", "subscriptions", "subscriptions.cancelled_at"),
+    ])
+    def test_single_item_fields_load_only_their_columns(
+        self, client, sample_subscription, sql_statements, path, table, skipped
+    ):
+        path = path.format(
+            user_id=sample_subscription.user_id,
+            plan_id=sample_subscription.plan_id,
+            subscription_id=sample_subscription.id,
+        )
+        sql_statements.clear()
+
+        response = client.get(path)
+
+        assert response.status_code == 200
+        query = next(statement for statement in sql_statements if f"FROM {table}" in statement)
+        assert skipped not in query
+        assert "JOIN" not in query
+
+    def test_plan_etag_depends_on_fields(self, client, sample_plan):
+        full = client.get("/plans")
+        trimmed = client.get("/plans?fields=name")
+
+        assert full.headers["etag"] != trimmed.headers["etag"]
+        assert client.get("/plans?fields=name", headers={"If-None-Match": trimmed.headers["etag"]}).status_code == 304
+
+    @pytest.mark.parametrize("path, detail", [
+        ("/users?fields=email,password", "Unknown fields: password"),
+        ("/subscriptions?fields=", "fields must name at least one field"),
+        ("/subscriptions?fields=status&plans=sideload", "fields cannot be combined with plans=sideload"),
+    ])
+    def test_invalid_fields_are_rejected(self, client, path, detail):
+        response = client.get(path)
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": detail}
@@ -0,0 +1,74 @@
+import json
+import logging
+
+import main
+from core.config import settings
+from core.metrics import metrics
+from core.query_stats import track_queries
+
+
+class TestLambdaHandler:
+    def test_scheduled_keep_warm_event_skips_app(self, monkeypatch):
+        monkeypatch.setattr(main, "_lambda_adapter", None)
+        event = {"source": "aws.events", "detail-type": "Scheduled Event"}
+
+        response = main.handler(event, None)
+
+        assert response == {"statusCode": 200, "body": "warm"}
+        assert main._lambda_adapter is None
+
+    def test_explicit_warmup_event_is_keep_warm(self):
+        assert main.is_keep_warm_event({"warmup": True}) is True
+        assert main.is_keep_warm_event({"rawPath": "/health"}) is False
+
+
+class TestQueryStats:
+    def test_request_reports_queries_in_server_timing_and_log(
+        self, engine, client, sample_user, monkeypatch, caplog
+    ):
+        track_queries(engine)
+        monkeypatch.setattr(settings, "slow_query_ms", 0.0)
+        monkeypatch.setattr(settings, "slow_query_log_limit", 1)
+
+        response = client.get(f"/users/{sample_user.id}")
+
+        assert response.status_code == 200
+        assert response.headers["server-timing"].startswith("db;dur=")
+        assert 'desc="1 queries"' in response.headers["server-timing"]
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record["path"] == "/users/{user_id}"
+        assert record["queries"] == 1
+        assert len(record["slow_queries"]) == 1
+        assert "FROM users" in record["slow_queries"][0]["statement"]
+
+    def test_configure_request_logging_adds_handler_only_without_root_handlers(self, monkeypatch):
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(main.request_logger, "handlers", [])
+
+        main.configure_request_logging()
+        main.configure_request_logging()
+
+        assert main.request_logger.getEffectiveLevel() == logging.INFO
+        assert [type(handler) for handler in main.request_logger.handlers] == [logging.StreamHandler]
+
+        monkeypatch.setattr(root, "handlers", [logging.NullHandler()])
+        monkeypatch.setattr(main.request_logger, "handlers", [])
+
+        main.configure_request_logging()
+
+        assert main.request_logger.handlers == []
+
+
+class TestMetricsEndpoint:
+    def test_metrics_endpoint_exposes_route_templates(self, client, sample_user):
+        metrics.reset()
+
+        client.get(f"/users/{sample_user.id}")
+        client.get("/users/999999")
+        response = client.get("/metrics")
+
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_responses_total{method="GET",route="/users/{user_id}",status="200"} 1' in response.text
+        assert 'http_responses_total{method="GET",route="/users/{user_id}",status="404"} 1' in response.text
+        assert "http_requests_in_flight 1" in response.text
@@ -96,6 +96,23 @@ class TestPlanModel:
         assert plan.is_active(datetime(2024, 6, 15, tzinfo=datetime_UTC)) is False
         assert plan.is_active(datetime(2026, 6, 15, tzinfo=datetime_UTC)) is False
 
+    def test_plan_is_active_keeps_non_utc_offsets(self):
+        from datetime import timezone
+
+        new_york = timezone(timedelta(hours=-5))
+        plan = Plan(
+            name="Offset Test",
+            tier=PlanTier.FREE.value,
+            price=Decimal("0.00"),
+            billing_period="monthly",
+            active_from=datetime(2025, 1, 1, 0, tzinfo=new_york),
+            active_to=None,
+        )
+
+        # 03:00 UTC is still 22:00 the previous day in New York.
+        assert plan.is_active(datetime(2025, 1, 1, 3, tzinfo=datetime_UTC)) is False
+        assert plan.is_active(datetime(2025, 1, 1, 6, tzinfo=datetime_UTC)) is True
+
     def test_plan_tiers(self):
         assert PlanTier.FREE.value == "free"
         assert PlanTier.BASIC.value == "basic"
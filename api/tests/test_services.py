@@ -1,19 +1,42 @@
-from datetime import datetime, timedelta
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
 from datetime import UTC as datetime_UTC
 from decimal import Decimal
+from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException
-
-from models.user import UserMode
-from models.plan import PlanTier
-from models.subscription import SubscriptionStatus
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from core.config import settings
+from core.pagination import encode_cursor
+from database import AppSession
+from models.user import User, UserMode
+from models.plan import Plan, PlanTier
+from models.subscription import Subscription, SubscriptionStatus
+from models.subscription_timeseries import SubscriptionTimeseriesCache
+from repositories.subscription import SubscriptionRepository
+from repositories.subscription_counter import SubscriptionCounterRepository
+from repositories.subscription_timeseries_cache import SubscriptionTimeseriesCacheRepository
+from schemas.bulk import BulkItemStatus
 from schemas.user import UserCreate, UserUpdate
 from schemas.plan import PlanCreate, PlanUpdate
-from schemas.subscription import SubscriptionCreate, SubscriptionUpdate
+from schemas.report import TimeseriesGranularity
+from schemas.subscription import (
+    ExportFormat,
+    SubscriptionCreate,
+    SubscriptionDetailResponse,
+    SubscriptionResponse,
+    SubscriptionUpdate,
+)
 from services.user import UserService
 from services.plan import PlanService
-from services.subscription import SubscriptionService
+from services.plan_catalog import plan_catalog
+from services.subscription import EXPORT_CSV_COLUMNS, SubscriptionService
 from services.report import ReportService
 
 
@@ -99,6 +122,74 @@ class TestUserService:
 
         assert len(users) >= 2
 
+    def test_get_users_with_cursor_walks_pages_in_id_order(
+        self, db_session, sample_user, simulation_user
+    ):
+        service = UserService(db_session)
+
+        first_page = service.get_users(limit=1)
+        second_page = service.get_users(
+            limit=1, cursor=encode_cursor(first_page[-1].id)
+        )
+        last_page = service.get_users(
+            limit=1, cursor=encode_cursor(second_page[-1].id)
+        )
+
+        assert [u.id for u in first_page + second_page] == sorted(
+            [sample_user.id, simulation_user.id]
+        )
+        assert last_page == []
+
+    def test_get_users_with_invalid_cursor_raises_error(self, db_session):
+        service = UserService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_users(cursor="not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+        assert "Invalid cursor" in str(exc_info.value.detail)
+
+    def test_create_users_in_bulk(self, db_session, sample_user):
+        service = UserService(db_session)
+        users_data = [
+            UserCreate(email="bulk1@example.com", name="Bulk One"),
+            UserCreate(email=sample_user.email, name="Existing"),
+            UserCreate(email="bulk2@example.com", name="Bulk Two"),
+            UserCreate(email="bulk1@example.com", name="Repeated"),
+        ]
+
+        response = service.create_users(users_data)
+
+        assert response.created == 2
+        assert response.rejected == 2
+        assert [r.status for r in response.results] == [
+            BulkItemStatus.CREATED,
+            BulkItemStatus.REJECTED,
+            BulkItemStatus.CREATED,
+            BulkItemStatus.REJECTED,
+        ]
+        assert response.results[0].user.email == "bulk1@example.com"
+        assert "already registered" in response.results[1].detail
+        assert "Duplicate" in response.results[3].detail
+        assert service.get_user_by_email("bulk2@example.com") is not None
+
+    def test_batch_get_users_keeps_input_order_and_marks_missing(
+        self, db_session, sql_statements, sample_user
+    ):
+        service = UserService(db_session)
+        sql_statements.clear()
+
+        response = service.batch_get_users([9999, sample_user.id, sample_user.id])
+
+        assert [(r.id, r.found) for r in response.results] == [
+            (9999, False),
+            (sample_user.id, True),
+            (sample_user.id, True),
+        ]
+        assert response.results[0].user is None
+        assert response.results[1].user.email == sample_user.email
+        assert len(sql_statements) == 1
+
 
 class TestPlanService:
     def test_create_plan(self, db_session):
@@ -153,6 +244,100 @@ class TestPlanService:
         plan_ids = [p.id for p in active_plans]
         assert future_plan.id in plan_ids
 
+    @pytest.mark.parametrize("catalog_enabled", [True, False])
+    def test_get_active_plans_at_past_time(
+        self, db_session, monkeypatch, catalog_enabled, sample_plan, expired_plan
+    ):
+        monkeypatch.setattr(settings, "plan_catalog_enabled", catalog_enabled)
+        service = PlanService(db_session)
+        # Naive timestamps are read as UTC.
+        past = (datetime.now(datetime_UTC) - timedelta(days=100)).replace(tzinfo=None)
+
+        active_plans = service.get_active_plans(current_time=past)
+
+        assert [p.id for p in active_plans] == [expired_plan.id]
+
+    def test_catalog_drops_refresh_that_raced_a_write(self, db_session, monkeypatch, sample_plan):
+        load_plans = plan_catalog._load_plans
+
+        def load_then_write(db):
+            plans = load_plans(db)
+            # A PlanService write commits and invalidates while the refresh is in flight.
+            plan_catalog.invalidate()
+            return plans
+
+        monkeypatch.setattr(plan_catalog, "_load_plans", load_then_write)
+        plan_catalog.snapshot(db_session)
+        monkeypatch.undo()
+
+        assert plan_catalog._snapshot is None
+
+    @pytest.mark.parametrize("catalog_enabled", [True, False])
+    def test_batch_get_plans(self, db_session, monkeypatch, catalog_enabled, sample_plan, future_plan):
+        monkeypatch.setattr(settings, "plan_catalog_enabled", catalog_enabled)
+        service = PlanService(db_session)
+
+        response = service.batch_get_plans([future_plan.id, 9999, sample_plan.id])
+
+        assert [(r.id, r.found) for r in response.results] == [
+            (future_plan.id, True),
+            (9999, False),
+            (sample_plan.id, True),
+        ]
+        assert response.results[2].plan.name == sample_plan.name
+
+    def test_batch_get_plans_finds_plans_missing_from_catalog(self, db_session, sample_plan):
+        # Warm the catalog, then add a plan the way another process would.
+        plan_catalog.snapshot(db_session)
+        plan = Plan(
+            name="Created Elsewhere",
+            tier=PlanTier.PRO.value,
+            price=Decimal("29.99"),
+            billing_period="monthly",
+            active_from=datetime.now(datetime_UTC),
+            simulation=False,
+        )
+        db_session.add(plan)
+        db_session.commit()
+
+        response = PlanService(db_session).batch_get_plans([plan.id, sample_plan.id, 9999])
+
+        assert [(r.id, r.found) for r in response.results] == [
+            (plan.id, True),
+            (sample_plan.id, True),
+            (9999, False),
+        ]
+        assert response.results[0].plan.name == "Created Elsewhere"
+
+    @pytest.mark.parametrize(
+        "constraint_name, expected",
+        [("ex_plans_window_overlap", HTTPException), ("plans_pkey", IntegrityError)],
+    )
+    def test_create_plan_maps_only_window_conflicts_to_409(
+        self, db_session, monkeypatch, constraint_name, expected
+    ):
+        service = PlanService(db_session)
+        violation = Exception(constraint_name)
+        violation.diag = SimpleNamespace(constraint_name=constraint_name)
+
+        def conflict(plan_data):
+            raise IntegrityError("INSERT INTO plans", {}, violation)
+
+        monkeypatch.setattr(service.repository, "create", conflict)
+        plan_data = PlanCreate(
+            name="Overlapping",
+            tier=PlanTier.BASIC,
+            price=Decimal("9.99"),
+            billing_period="monthly",
+            active_from=datetime.now(datetime_UTC),
+        )
+
+        with pytest.raises(expected) as exc_info:
+            service.create_plan(plan_data)
+
+        if expected is HTTPException:
+            assert exc_info.value.status_code == 409
+
     def test_update_plan(self, db_session, sample_plan):
         service = PlanService(db_session)
         update_data = PlanUpdate(name="Updated Plan Name")
@@ -170,6 +355,46 @@ class TestPlanService:
         with pytest.raises(HTTPException):
             service.get_plan(plan_id)
 
+    def test_get_active_plans_served_from_catalog_snapshot(
+        self, db_session, sample_plan, expired_plan
+    ):
+        service = PlanService(db_session)
+        service.get_active_plans()
+        db_session.delete(sample_plan)
+        db_session.commit()
+
+        active_plans = service.get_active_plans()
+
+        assert [p.id for p in active_plans] == [sample_plan.id]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"current_time": datetime.now(datetime_UTC)}, {"fields": ("id", "name")}],
+    )
+    def test_get_active_plans_at_or_fields_uses_indexed_query(
+        self, db_session, sql_statements, sample_plan, kwargs
+    ):
+        service = PlanService(db_session)
+        service.get_active_plans()
+        sql_statements.clear()
+
+        active_plans = service.get_active_plans(**kwargs)
+
+        assert [p.id for p in active_plans] == [sample_plan.id]
+        assert len(sql_statements) == 1
+        assert "FROM plans" in sql_statements[0]
+
+    def test_update_plan_refreshes_catalog(self, db_session, sample_plan):
+        service = PlanService(db_session)
+        service.get_active_plans()
+
+        service.update_plan(
+            sample_plan.id,
+            PlanUpdate(active_from=datetime.now(datetime_UTC) + timedelta(days=1)),
+        )
+
+        assert service.get_active_plans() == []
+
 
 class TestSubscriptionService:
     def test_create_subscription(self, db_session, sample_user, sample_plan):
@@ -187,6 +412,45 @@ class TestSubscriptionService:
         assert subscription.plan_id == sample_plan.id
         assert subscription.status == SubscriptionStatus.ACTIVE.value
 
+    def test_create_subscription_uses_single_statement(
+        self, db_session, sql_statements, sample_user, sample_plan
+    ):
+        service = SubscriptionService(db_session)
+        subscription_data = SubscriptionCreate(
+            user_id=sample_user.id,
+            plan_id=sample_plan.id,
+            start_date=datetime.now(datetime_UTC),
+        )
+        sql_statements.clear()
+
+        subscription = service.create_subscription(subscription_data)
+
+        assert subscription.status == SubscriptionStatus.ACTIVE.value
+        assert len(sql_statements) == 2
+        assert sql_statements[0].startswith("INSERT INTO subscriptions")
+        assert sql_statements[1].startswith("INSERT INTO subscription_counters")
+
+    def test_reactivating_second_subscription_raises_error(
+        self, db_session, sample_subscription, sample_user, sample_plan
+    ):
+        old_sub = Subscription(
+            user_id=sample_user.id,
+            plan_id=sample_plan.id,
+            status=SubscriptionStatus.CANCELLED.value,
+            start_date=datetime.now(datetime_UTC) - timedelta(days=60),
+        )
+        db_session.add(old_sub)
+        db_session.commit()
+        service = SubscriptionService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.update_subscription(
+                old_sub.id, SubscriptionUpdate(status=SubscriptionStatus.ACTIVE)
+            )
+
+        assert exc_info.value.status_code == 400
+        assert "already has an active subscription" in str(exc_info.value.detail)
+
     def test_create_subscription_for_simulation_user_raises_error(
         self, db_session, simulation_user, sample_plan
     ):
@@ -219,6 +483,34 @@ class TestSubscriptionService:
         assert exc_info.value.status_code == 400
         assert "already has an active subscription" in str(exc_info.value.detail).lower()
 
+    @pytest.mark.parametrize(
+        "constraint_name, expected",
+        [("uq_subscriptions_user_id_active", HTTPException), ("subscriptions_plan_id_fkey", IntegrityError)],
+    )
+    def test_create_subscription_maps_only_duplicate_active_to_400(
+        self, db_session, monkeypatch, sample_user, sample_plan, constraint_name, expected
+    ):
+        service = SubscriptionService(db_session)
+        violation = Exception(constraint_name)
+        violation.diag = SimpleNamespace(constraint_name=constraint_name)
+
+        def conflict(subscription_data):
+            raise IntegrityError("INSERT INTO subscriptions", {}, violation)
+
+        monkeypatch.setattr(service.repository, "create_if_eligible", conflict)
+        subscription_data = SubscriptionCreate(
+            user_id=sample_user.id,
+            plan_id=sample_plan.id,
+            start_date=datetime.now(datetime_UTC),
+        )
+
+        with pytest.raises(expected) as exc_info:
+            service.create_subscription(subscription_data)
+
+        if expected is HTTPException:
+            assert exc_info.value.status_code == 400
+            assert "already has an active subscription" in str(exc_info.value.detail)
+
     def test_create_subscription_with_inactive_plan_raises_error(
         self, db_session, sample_user, expired_plan
     ):
@@ -267,6 +559,38 @@ class TestSubscriptionService:
         assert exc_info.value.status_code == 404
         assert "Plan not found" in str(exc_info.value.detail)
 
+    def test_create_subscriptions_in_bulk(
+        self, db_session, sample_user, simulation_user, sample_plan, expired_plan
+    ):
+        other_user = User(email="other@example.com", name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        service = SubscriptionService(db_session)
+        start_date = datetime.now(datetime_UTC)
+        subscriptions_data = [
+            SubscriptionCreate(user_id=sample_user.id, plan_id=sample_plan.id, start_date=start_date),
+            SubscriptionCreate(user_id=sample_user.id, plan_id=sample_plan.id, start_date=start_date),
+            SubscriptionCreate(user_id=simulation_user.id, plan_id=sample_plan.id, start_date=start_date),
+            SubscriptionCreate(user_id=99999, plan_id=sample_plan.id, start_date=start_date),
+            SubscriptionCreate(user_id=other_user.id, plan_id=expired_plan.id, start_date=start_date),
+            SubscriptionCreate(user_id=other_user.id, plan_id=99999, start_date=start_date),
+        ]
+
+        response = service.create_subscriptions(subscriptions_data)
+
+        assert response.created == 1
+        assert response.rejected == 5
+        assert response.results[0].status == BulkItemStatus.CREATED
+        assert response.results[0].subscription.user_id == sample_user.id
+        assert [r.detail for r in response.results[1:]] == [
+            "User already has an active subscription",
+            "Users in simulation mode cannot have subscriptions",
+            "User not found",
+            "Plan is not currently active",
+            "Plan not found",
+        ]
+        assert service.get_active_subscription(sample_user.id) is not None
+
     def test_get_subscription(self, db_session, sample_subscription):
         service = SubscriptionService(db_session)
 
@@ -302,6 +626,170 @@ class TestSubscriptionService:
         assert exc_info.value.status_code == 400
         assert "Only active subscriptions" in str(exc_info.value.detail)
 
+    def test_get_subscriptions_with_cursor_skips_earlier_rows(
+        self, db_session, sample_subscription, sample_plan
+    ):
+        other_user = User(email="other@example.com", name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        later_sub = Subscription(
+            user_id=other_user.id,
+            plan_id=sample_plan.id,
+            status=SubscriptionStatus.ACTIVE.value,
+            start_date=datetime.now(datetime_UTC),
+        )
+        db_session.add(later_sub)
+        db_session.commit()
+        service = SubscriptionService(db_session)
+
+        subscriptions = service.get_subscriptions(
+            cursor=encode_cursor(sample_subscription.id)
+        )
+
+        assert [s.id for s in subscriptions] == [later_sub.id]
+
+    def test_get_subscriptions_sideloaded_lists_each_plan_once(
+        self, db_session, sample_subscription, sample_plan
+    ):
+        other_user = User(email="other@example.com", name="Other User")
+        db_session.add(other_user)
+        db_session.commit()
+        db_session.add(Subscription(
+            user_id=other_user.id,
+            plan_id=sample_plan.id,
+            status=SubscriptionStatus.ACTIVE.value,
+            start_date=datetime.now(datetime_UTC),
+        ))
+        db_session.commit()
+        service = SubscriptionService(db_session)
+
+        page = service.get_subscriptions_sideloaded().model_dump(mode="json")
+        inline = [
+            SubscriptionDetailResponse.model_validate(s).model_dump(mode="json")
+            for s in service.get_subscriptions()
+        ]
+
+        assert list(page["plans"]) == [str(sample_plan.id)]
+        assert page["plans"][str(sample_plan.id)] == inline[0]["plan"]
+        assert page["subscriptions"] == [
+            {key: value for key, value in s.items() if key != "plan"} for s in inline
+        ]
+
+    def test_get_subscriptions_sideloaded_reads_plans_missing_from_catalog(self, db_session, sample_user):
+        # Warm the catalog, then add a plan the way another process would.
+        plan_catalog.snapshot(db_session)
+        plan = Plan(
+            name="Created Elsewhere",
+            tier=PlanTier.PRO.value,
+            price=Decimal("29.99"),
+            billing_period="monthly",
+            active_from=datetime.now(datetime_UTC) - timedelta(days=1),
+            simulation=False,
+        )
+        db_session.add(plan)
+        db_session.commit()
+        db_session.add(Subscription(
+            user_id=sample_user.id,
+            plan_id=plan.id,
+            status=SubscriptionStatus.ACTIVE.value,
+            start_date=datetime.now(datetime_UTC),
+        ))
+        db_session.commit()
+
+        page = SubscriptionService(db_session).get_subscriptions_sideloaded()
+
+        assert plan_catalog.snapshot(db_session).get(plan.id) is None
+        assert page.plans[plan.id].name == "Created Elsewhere"
+
+    def test_export_subscriptions_as_ndjson(self, db_session, sample_subscription):
+        service = SubscriptionService(db_session)
+
+        lines = "".join(service.export_subscriptions(ExportFormat.NDJSON)).splitlines()
+
+        assert len(lines) == 1
+        row = json.loads(lines[0])
+        assert row["id"] == sample_subscription.id
+        assert row["user"]["email"] == "test@example.com"
+        assert row["plan"]["name"] == "Basic Monthly"
+
+    def test_export_subscriptions_as_csv_in_batches(
+        self, db_session, sample_subscription, sample_user, sample_plan
+    ):
+        for days_ago in (90, 60):
+            db_session.add(Subscription(
+                user_id=sample_user.id,
+                plan_id=sample_plan.id,
+                status=SubscriptionStatus.EXPIRED.value,
+                start_date=datetime.now(datetime_UTC) - timedelta(days=days_ago),
+                end_date=datetime.now(datetime_UTC) - timedelta(days=days_ago - 30),
+            ))
+        db_session.commit()
+        service = SubscriptionService(db_session)
+
+        chunks = list(service.export_subscriptions(ExportFormat.CSV, batch_size=2))
+        lines = "".join(chunks).splitlines()
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+
+        # Batches count rows; the header goes out with the first one.
+        assert [len(chunk.splitlines()) for chunk in chunks] == [3, 1]
+        assert lines[0].split(",") == EXPORT_CSV_COLUMNS
+        assert [int(row["id"]) for row in rows] == [
+            sample_subscription.id, sample_subscription.id + 1, sample_subscription.id + 2
+        ]
+        assert [row["status"] for row in rows] == ["active", "expired", "expired"]
+        assert {row["user_email"] for row in rows} == {"test@example.com"}
+        assert {row["plan_tier"] for row in rows} == {PlanTier.BASIC.value}
+
+    def test_row_projection_matches_orm_json(
+        self, db_session, sample_subscription, sample_user, sample_plan
+    ):
+        db_session.add(Subscription(
+            user_id=sample_user.id,
+            plan_id=sample_plan.id,
+            status=SubscriptionStatus.CANCELLED.value,
+            start_date=datetime.now(datetime_UTC) - timedelta(days=90),
+            end_date=None,
+            cancelled_at=datetime.now(datetime_UTC) - timedelta(days=60),
+        ))
+        db_session.commit()
+        repository = SubscriptionRepository(db_session)
+        details = TypeAdapter(list[SubscriptionDetailResponse])
+        responses = TypeAdapter(list[SubscriptionResponse])
+
+        orm_details = details.dump_json(details.validate_python(repository.get_all(), from_attributes=True))
+        orm_responses = responses.dump_json(
+            responses.validate_python(repository.get_by_user_id(sample_user.id), from_attributes=True)
+        )
+
+        assert details.dump_json(repository.get_all_details(), warnings="error") == orm_details
+        assert responses.dump_json(
+            repository.get_responses_by_user_id(sample_user.id), warnings="error"
+        ) == orm_responses
+
+    def test_row_projection_is_opt_in(self, db_session, monkeypatch, sample_subscription, sample_user):
+        service = SubscriptionService(db_session)
+        details = TypeAdapter(list[SubscriptionDetailResponse])
+
+        def read_all():
+            return (
+                service.get_subscriptions(),
+                service.get_user_subscriptions(sample_user.id),
+                service.get_subscriptions_sideloaded().model_dump_json(),
+                service.batch_get_subscriptions([sample_subscription.id]).model_dump_json(),
+            )
+
+        orm_pages = read_all()
+        monkeypatch.setattr(settings, "row_projection", True)
+        db_session.expunge_all()
+        projected_pages = read_all()
+
+        assert all(isinstance(item, Subscription) for item in orm_pages[0] + orm_pages[1])
+        assert all(isinstance(item, SubscriptionResponse) for item in projected_pages[0] + projected_pages[1])
+        assert details.dump_json(details.validate_python(orm_pages[0], from_attributes=True)) == (
+            details.dump_json(projected_pages[0])
+        )
+        assert orm_pages[2:] == projected_pages[2:]
+
     def test_get_user_subscriptions(self, db_session, sample_subscription, sample_user):
         service = SubscriptionService(db_session)
 
@@ -327,6 +815,17 @@ class TestSubscriptionService:
 
         assert subscription is None
 
+    def test_batch_get_subscriptions_matches_single_get(self, db_session, sample_subscription):
+        service = SubscriptionService(db_session)
+
+        response = service.batch_get_subscriptions([sample_subscription.id, 9999])
+
+        assert [(r.id, r.found) for r in response.results] == [(sample_subscription.id, True), (9999, False)]
+        assert response.results[0].subscription.model_dump() == SubscriptionDetailResponse.model_validate(
+            service.get_subscription(sample_subscription.id)
+        ).model_dump()
+        assert response.results[1].subscription is None
+
 
 class TestReportService:
     def test_get_subscription_report(self, db_session, sample_subscription):
@@ -350,8 +849,6 @@ class TestReportService:
     def test_get_subscription_report_counts_by_status(
         self, db_session, sample_user, sample_plan
     ):
-        from models.subscription import Subscription
-
         active_sub = Subscription(
             user_id=sample_user.id,
             plan_id=sample_plan.id,
@@ -368,3 +865,288 @@ class TestReportService:
             (s.count for s in report.by_status if s.status == "active"), 0
         )
         assert active_count >= 1
+
+    def test_get_subscription_report_follows_writes(
+        self, db_session, sample_subscription, sample_plan
+    ):
+        subscription_service = SubscriptionService(db_session)
+        service = ReportService(db_session)
+
+        subscription_service.cancel_subscription(sample_subscription.id)
+        report = service.get_subscription_report()
+        assert [(s.status, s.count) for s in report.by_status] == [("cancelled", 1)]
+
+        subscription_service.delete_subscription(sample_subscription.id)
+        report = service.get_subscription_report()
+        assert report.total_subscriptions == 0
+        assert report.by_plan == []
+
+    def test_get_subscription_report_counts_bulk_creates(
+        self, db_session, sample_user, sample_plan
+    ):
+        other_user = User(email="other@example.com", name="Other", mode="live")
+        db_session.add(other_user)
+        db_session.commit()
+        SubscriptionService(db_session).create_subscriptions([
+            SubscriptionCreate(user_id=user_id, plan_id=sample_plan.id, start_date=datetime.now(datetime_UTC))
+            for user_id in (sample_user.id, other_user.id)
+        ])
+
+        report = ReportService(db_session).get_subscription_report()
+
+        assert report.total_subscriptions == 2
+        assert [(p.plan_name, p.count) for p in report.by_plan] == [("Basic Monthly", 2)]
+
+    @pytest.mark.parametrize("fresh", [False, True])
+    def test_get_subscription_report_keeps_plans_with_the_same_name_apart(
+        self, db_session, fresh, sample_subscription, sample_plan
+    ):
+        twin_plan = Plan(
+            name=sample_plan.name,
+            tier=sample_plan.tier,
+            description="Same name and tier, different price",
+            price=Decimal("12.99"),
+            billing_period="monthly",
+            active_from=sample_plan.active_from,
+            simulation=False,
+        )
+        db_session.add(twin_plan)
+        db_session.commit()
+        db_session.add(Subscription(
+            user_id=sample_subscription.user_id,
+            plan_id=twin_plan.id,
+            status=SubscriptionStatus.EXPIRED.value,
+            start_date=datetime.now(datetime_UTC) - timedelta(days=60),
+        ))
+        db_session.commit()
+
+        report = ReportService(db_session).get_subscription_report(fresh=fresh)
+
+        assert [(p.plan_name, p.tier, p.count) for p in report.by_plan] == [
+            ("Basic Monthly", "basic", 1),
+            ("Basic Monthly", "basic", 1),
+        ]
+
+    def test_fresh_report_matches_counters(
+        self, db_session, sample_subscription, sample_plan, expired_plan
+    ):
+        other_user = User(email="other@example.com", name="Other", mode="live")
+        db_session.add(other_user)
+        db_session.commit()
+        db_session.add(Subscription(
+            user_id=other_user.id,
+            plan_id=expired_plan.id,
+            status=SubscriptionStatus.EXPIRED.value,
+            start_date=datetime.now(datetime_UTC) - timedelta(days=60),
+        ))
+        db_session.commit()
+        service = ReportService(db_session)
+
+        cached = service.get_subscription_report()
+        fresh = service.get_subscription_report(fresh=True)
+
+        assert fresh.total_subscriptions == cached.total_subscriptions == 2
+        assert sorted((s.status, s.count) for s in fresh.by_status) == [("active", 1), ("expired", 1)]
+        assert sorted(fresh.by_plan, key=lambda p: p.plan_name) == sorted(cached.by_plan, key=lambda p: p.plan_name)
+
+    def test_fresh_report_uses_single_query(self, db_session, sql_statements, sample_subscription):
+        sql_statements.clear()
+
+        report = ReportService(db_session).get_subscription_report(fresh=True)
+
+        assert report.total_subscriptions == 1
+        assert len(sql_statements) == 1
+
+    def test_fresh_report_empty(self, db_session):
+        report = ReportService(db_session).get_subscription_report(fresh=True)
+
+        assert report.total_subscriptions == 0
+        assert report.by_status == []
+        assert report.by_plan == []
+
+    def _add_dated_subscription(self, db_session, user, plan, start, cancelled_at=None, end=None):
+        subscription = Subscription(
+            user_id=user.id,
+            plan_id=plan.id,
+            status=SubscriptionStatus.CANCELLED.value if cancelled_at else SubscriptionStatus.EXPIRED.value,
+            start_date=start,
+            end_date=end,
+            cancelled_at=cancelled_at,
+        )
+        db_session.add(subscription)
+        db_session.commit()
+        return subscription
+
+    def test_timeseries_counts_active_days_per_tier(self, db_session, sample_user, sample_plan):
+        self._add_dated_subscription(
+            db_session, sample_user, sample_plan,
+            start=datetime(2024, 1, 10, tzinfo=datetime_UTC),
+            cancelled_at=datetime(2024, 1, 20, 12, tzinfo=datetime_UTC),
+        )
+        service = ReportService(db_session)
+
+        report = service.get_subscription_timeseries(
+            date(2024, 1, 1), date(2024, 1, 31), TimeseriesGranularity.DAY
+        )
+
+        assert len(report.buckets) == 31
+        active_days = [b.bucket_start.day for b in report.buckets if b.counts["basic"] == 1]
+        assert active_days == list(range(10, 21))
+        assert all(b.counts == {"basic": b.counts["basic"], "free": 0, "pro": 0} for b in report.buckets)
+
+    def test_timeseries_aligns_week_and_month_buckets(self, db_session, sample_user, sample_plan):
+        self._add_dated_subscription(
+            db_session, sample_user, sample_plan,
+            start=datetime(2024, 1, 31, tzinfo=datetime_UTC),
+            end=datetime(2024, 2, 2, tzinfo=datetime_UTC),
+        )
+        service = ReportService(db_session)
+
+        weeks = service.get_subscription_timeseries(date(2024, 1, 3), date(2024, 2, 14), TimeseriesGranularity.WEEK)
+        months = service.get_subscription_timeseries(date(2024, 1, 15), date(2024, 3, 1), TimeseriesGranularity.MONTH)
+
+        assert [b.bucket_start for b in weeks.buckets][:2] == [date(2024, 1, 1), date(2024, 1, 8)]
+        assert [(b.bucket_start, b.counts["basic"]) for b in weeks.buckets if b.counts["basic"]] == [
+            (date(2024, 1, 29), 1)
+        ]
+        assert [(b.bucket_start, b.counts["basic"]) for b in months.buckets] == [
+            (date(2024, 1, 1), 1), (date(2024, 2, 1), 1), (date(2024, 3, 1), 0)
+        ]
+
+    def test_timeseries_caches_closed_buckets_only(self, db_session, sample_subscription):
+        service = ReportService(db_session)
+        today = datetime.now(datetime_UTC).date()
+        start = today - timedelta(days=2)
+
+        first = service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+        cached_days = {row.bucket_start for row in db_session.query(SubscriptionTimeseriesCache)}
+        assert cached_days == {start, start + timedelta(days=1)}
+
+        # A closed bucket is served from the cache even if the data changes.
+        db_session.query(SubscriptionTimeseriesCache).filter(
+            SubscriptionTimeseriesCache.bucket_start == start,
+            SubscriptionTimeseriesCache.tier == "basic",
+        ).update({"count": 42})
+        db_session.commit()
+        second = service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+
+        assert [b.counts["basic"] for b in first.buckets] == [1, 1, 1]
+        assert [b.counts["basic"] for b in second.buckets] == [42, 1, 1]
+
+    def test_timeseries_cache_follows_backdated_writes(self, db_session, sample_subscription, sample_plan):
+        other_user = User(email="other@example.com", name="Other", mode="live")
+        db_session.add(other_user)
+        db_session.commit()
+        service = ReportService(db_session)
+        subscription_service = SubscriptionService(db_session)
+        today = datetime.now(datetime_UTC).date()
+        start = today - timedelta(days=10)
+
+        def basic_counts():
+            report = service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+            return [b.counts["basic"] for b in report.buckets]
+
+        assert basic_counts() == [1] * 11
+        backdated = subscription_service.create_subscriptions([SubscriptionCreate(
+            user_id=other_user.id,
+            plan_id=sample_plan.id,
+            start_date=datetime.now(datetime_UTC) - timedelta(days=5),
+        )]).results[0].subscription
+        assert basic_counts() == [1] * 5 + [2] * 6
+
+        # Cancelling now only moves the end of the span past the closed buckets.
+        subscription_service.cancel_subscription(sample_subscription.id)
+        assert db_session.query(SubscriptionTimeseriesCache).count() == 10 * len(PlanTier)
+
+        subscription_service.delete_subscription(backdated.id)
+        assert basic_counts() == [1] * 11
+
+    def test_timeseries_drops_buckets_counted_before_a_concurrent_write(
+        self, engine, db_session, sample_subscription, sample_plan, monkeypatch
+    ):
+        other_user = User(email="other@example.com", name="Other", mode="live")
+        db_session.add(other_user)
+        db_session.commit()
+        service = ReportService(db_session)
+        today = datetime.now(datetime_UTC).date()
+        start = today - timedelta(days=10)
+        count_buckets = service._count_buckets
+
+        def count_then_write(granularity, bucket_starts):
+            # Another request backdates a subscription after this one has counted.
+            counts = count_buckets(granularity, bucket_starts)
+            with sessionmaker(class_=AppSession, bind=engine)() as writer:
+                SubscriptionService(writer).create_subscription(SubscriptionCreate(
+                    user_id=other_user.id,
+                    plan_id=sample_plan.id,
+                    start_date=datetime.now(datetime_UTC) - timedelta(days=5),
+                ))
+            return counts
+
+        monkeypatch.setattr(service, "_count_buckets", count_then_write)
+        stale = service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+        monkeypatch.undo()
+        fresh = service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+
+        assert [b.counts["basic"] for b in stale.buckets] == [1] * 11
+        assert [b.counts["basic"] for b in fresh.buckets] == [1] * 5 + [2] * 6
+
+    def test_timeseries_store_skipped_after_invalidation(self, db_session, sample_subscription):
+        cache = SubscriptionTimeseriesCacheRepository(db_session)
+        generation = cache.generation()
+        bucket = {date(2024, 1, 1): {"basic": 1, "free": 0, "pro": 0}}
+
+        cache.invalidate([(datetime(2024, 1, 1, tzinfo=datetime_UTC), None)])
+        db_session.commit()
+
+        assert cache.store(TimeseriesGranularity.DAY.value, bucket, generation) is False
+        assert cache.store(TimeseriesGranularity.DAY.value, bucket, cache.generation()) is True
+        assert db_session.query(SubscriptionTimeseriesCache).count() == 3
+
+    def test_timeseries_cache_cleared_when_plan_changes_tier(self, db_session, sample_subscription, sample_plan):
+        service = ReportService(db_session)
+        today = datetime.now(datetime_UTC).date()
+        start = today - timedelta(days=3)
+        service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+        assert db_session.query(SubscriptionTimeseriesCache).count() == 3 * len(PlanTier)
+
+        PlanService(db_session).update_plan(sample_plan.id, PlanUpdate(tier=PlanTier.PRO))
+        report = service.get_subscription_timeseries(start, today, TimeseriesGranularity.DAY)
+
+        assert [(b.counts["basic"], b.counts["pro"]) for b in report.buckets] == [(0, 1)] * 4
+
+    def test_timeseries_rejects_reversed_range(self, db_session):
+        service = ReportService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_subscription_timeseries(date(2024, 2, 1), date(2024, 1, 1), TimeseriesGranularity.DAY)
+
+        assert exc_info.value.status_code == 400
+
+    def test_counters_match_recount(self, db_session, sample_subscription):
+        SubscriptionService(db_session).update_subscription(
+            sample_subscription.id, SubscriptionUpdate(status=SubscriptionStatus.EXPIRED)
+        )
+
+        assert SubscriptionCounterRepository(db_session).get_all() == (
+            SubscriptionRepository(db_session).count_by_plan_and_status()
+        )
+
+    def test_counter_listener_only_runs_for_app_sessions(self, engine, db_session, sample_user, sample_plan):
+        def add_subscription(session):
+            session.add(Subscription(
+                user_id=sample_user.id,
+                plan_id=sample_plan.id,
+                status=SubscriptionStatus.CANCELLED.value,
+                start_date=datetime.now(datetime_UTC),
+            ))
+            session.commit()
+
+        with Session(engine) as other:
+            add_subscription(other)
+        assert SubscriptionCounterRepository(db_session).get_all() == {}
+
+        add_subscription(db_session)
+        assert SubscriptionCounterRepository(db_session).get_all() == {
+            (sample_plan.id, SubscriptionStatus.CANCELLED.value): 1
+        }
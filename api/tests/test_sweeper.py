@@ -0,0 +1,75 @@
+import json
+from datetime import datetime, timedelta
+from datetime import UTC as datetime_UTC
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import sweeper
+from database import AppSession
+from models.subscription import Subscription, SubscriptionStatus
+from models.user import User
+from repositories.subscription_counter import SubscriptionCounterRepository
+
+
+@pytest.fixture
+def sweeper_session(engine, monkeypatch):
+    monkeypatch.setattr(sweeper, "SessionLocal", sessionmaker(class_=AppSession, autoflush=False, bind=engine))
+    monkeypatch.setattr(sweeper, "get_engine", lambda: engine)
+
+
+@pytest.fixture
+def overdue_subscriptions(db_session, sample_plan):
+    now = datetime.now(datetime_UTC)
+    subscriptions = []
+    for index, end_date in enumerate([now - timedelta(days=1), now - timedelta(days=2), now + timedelta(days=1), None]):
+        user = User(email=f"sweep{index}@example.com", name=f"Sweep {index}", mode="live")
+        db_session.add(user)
+        db_session.flush()
+        subscriptions.append(Subscription(
+            user_id=user.id,
+            plan_id=sample_plan.id,
+            status=SubscriptionStatus.ACTIVE.value,
+            start_date=now - timedelta(days=30),
+            end_date=end_date,
+        ))
+    db_session.add_all(subscriptions)
+    db_session.commit()
+    return subscriptions
+
+
+class TestSweep:
+    def test_expires_only_overdue_active_rows(self, db_session, sweeper_session, overdue_subscriptions, sample_plan):
+        result = sweeper.sweep(batch_size=1, time_budget_seconds=60)
+
+        db_session.expire_all()
+        statuses = [subscription.status for subscription in overdue_subscriptions]
+        assert statuses == ["expired", "expired", "active", "active"]
+        assert result["expired"] == 2
+        assert result["batches"] == 3
+        assert result["complete"] is True
+        assert SubscriptionCounterRepository(db_session).get_all() == {
+            (sample_plan.id, "active"): 2,
+            (sample_plan.id, "expired"): 2,
+        }
+
+    def test_stops_when_time_budget_is_spent(self, sweeper_session, overdue_subscriptions):
+        result = sweeper.sweep(batch_size=1, time_budget_seconds=0)
+
+        assert result["expired"] == 1
+        assert result["batches"] == 1
+        assert result["complete"] is False
+
+
+class TestSweeperHandler:
+    def test_budget_defaults_to_remaining_lambda_time(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(sweeper, "sweep", lambda **kwargs: calls.append(kwargs) or {"expired": 0})
+        context = SimpleNamespace(get_remaining_time_in_millis=lambda: 30_000)
+
+        response = sweeper.handler({"batch_size": 50}, context)
+
+        assert response["statusCode"] == 200
+        assert json.loads(response["body"]) == {"success": True, "expired": 0}
+        assert calls == [{"batch_size": 50, "time_budget_seconds": 30 - sweeper.TIMEOUT_SAFETY_MARGIN_SECONDS}]
@@ -320,3 +320,47 @@ resource "aws_lambda_function" "migrate" {
     security_group_ids = [aws_security_group.lambda_sg.id]
   }
 }
+
+# Expiry sweeper Lambda Function (uses same image with different handler)
+resource "aws_lambda_function" "sweeper" {
+  function_name = "${local.project_name}-${var.ENVIRONMENT}-sweeper"
+  role          = aws_iam_role.lambda_role.arn
+  package_type  = "Image"
+  image_uri     = "${aws_ecr_repository.api.repository_url}:${var.IMAGE_TAG}"
+  timeout       = 120
+  memory_size   = 256
+
+  image_config {
+    command = ["sweeper.handler"]
+  }
+
+  environment {
+    variables = {
+      ENVIRONMENT  = var.ENVIRONMENT
+      DATABASE_URL = "postgresql+psycopg2://${var.POSTGRES_DB_USERNAME}:${var.POSTGRES_DB_PASSWORD}@${aws_db_instance.postgres.endpoint}/${var.POSTGRES_DB_NAME}"
+    }
+  }
+
+  vpc_config {
+    subnet_ids         = data.aws_subnets.private.ids
+    security_group_ids = [aws_security_group.lambda_sg.id]
+  }
+}
+
+resource "aws_cloudwatch_event_rule" "sweeper" {
+  name                = "${local.project_name}-${var.ENVIRONMENT}-sweeper"
+  schedule_expression = "rate(15 minutes)"
+}
+
+resource "aws_cloudwatch_event_target" "sweeper" {
+  rule = aws_cloudwatch_event_rule.sweeper.name
+  arn  = aws_lambda_function.sweeper.arn
+}
+
+resource "aws_lambda_permission" "sweeper_schedule" {
+  statement_id  = "AllowEventBridgeInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.sweeper.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.sweeper.arn
+}